@@ -0,0 +1,49 @@
+from api.auth.models import AuthPayload, AuthSuccessResponse
+from api.base_api import AsyncBaseAPI
+from api.endpoints import APIEndpoints
+from core.cached_response import CachedResponse
+
+
+class AsyncAuthClient(AsyncBaseAPI):
+    """
+    Async API client for interaction with authorization endpoint (/api/auth).
+
+    Inherits from AsyncBaseAPI; behaves like AuthClient, but every call is a coroutine.
+    """
+
+    async def login(
+        self,
+        payload: AuthPayload,
+        expected_status: int = 200,
+    ) -> AuthSuccessResponse | CachedResponse:
+        """
+        Executes a user authorization request (POST /api/auth).
+
+        Args:
+            payload (AuthPayload): Object with login data (login and password).
+            expected_status (int): Expected HTTP response status (default 200).
+
+        Returns:
+            AuthSuccessResponse: Token object on successful authorization (status 200)
+                and valid response.
+            CachedResponse: Raw response (read once from Playwright) with other status codes or if
+                model validation fails.
+
+        Raises:
+            AssertionError: If the received status code does not match expected_status
+                           or if AuthSuccessResponse model validation fails
+                           (called from AsyncBaseAPI._handle_response).
+        """
+        endpoint = APIEndpoints.AUTH
+        response: CachedResponse = await self.http.post(
+            endpoint=endpoint.format(),
+            json=payload.model_dump(),
+        )
+
+        if response.ok:
+            return self._handle_response(
+                response,
+                expected_status,
+                response_model=AuthSuccessResponse,
+            )
+        return self._handle_response(response, expected_status)
@@ -1,8 +1,7 @@
-from playwright.sync_api import APIResponse
-
 from api.auth.models import AuthPayload, AuthSuccessResponse
 from api.base_api import BaseAPI
 from api.endpoints import APIEndpoints
+from core.cached_response import CachedResponse
 
 
 class AuthClient(BaseAPI):
@@ -16,7 +15,7 @@ class AuthClient(BaseAPI):
         self,
         payload: AuthPayload,
         expected_status: int = 200,
-    ) -> AuthSuccessResponse | APIResponse:
+    ) -> AuthSuccessResponse | CachedResponse:
         """
         Executes a user authorization request (POST /api/auth).
 
@@ -27,7 +26,7 @@ class AuthClient(BaseAPI):
         Returns:
             AuthSuccessResponse: Token object on successful authorization (status 200)
                 and valid response.
-            APIResponse: Raw Playwright response object with other status codes or if
+            CachedResponse: Raw response (read once from Playwright) with other status codes or if
                 model validation fails.
 
         Raises:
@@ -36,9 +35,10 @@ class AuthClient(BaseAPI):
                            (called from BaseAPI._handle_response).
         """
         endpoint = APIEndpoints.AUTH
-        response: APIResponse = self.http.post(
+        response: CachedResponse = self.http.post(
             endpoint=endpoint.format(),
             json=payload.model_dump(),
+            idempotent=True,
         )
 
         if response.ok:
@@ -0,0 +1,166 @@
+import base64
+import binascii
+import fcntl
+import json
+import logging
+import os
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from core.json_codec import codec
+
+logger = logging.getLogger(__name__)
+
+
+def jwt_expiry(token: str) -> float | None:
+    """
+    Reads the `exp` claim of a JWT without verifying its signature.
+
+    Args:
+        token: JWT access token.
+
+    Returns:
+        Expiry as a Unix timestamp, or None if the token is not a JWT or has no `exp`.
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    payload = parts[1] + "=" * (-len(parts[1]) % 4)
+    try:
+        claims = codec.loads(base64.urlsafe_b64decode(payload))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    return float(exp) if isinstance(exp, int | float) else None
+
+
+class TokenStore:
+    """
+    JSON file with cached tokens, guarded by an exclusive file lock.
+
+    All pytest-xdist workers of a run point at the same file, so one worker logs in while
+    the others wait on the lock and then read its token.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Initializes the store.
+
+        Args:
+            path: Path of the JSON file (the lock file is created next to it).
+        """
+        self.path = path
+        self.lock_path = path.with_suffix(path.suffix + ".lock")
+
+    @contextmanager
+    def locked(self) -> Generator[dict[str, dict[str, Any]]]:
+        """
+        Locks the store and yields its entries; changes are written back on exit.
+
+        Yields:
+            Mapping of cache key to `{"token": ..., "expires_at": ...}`.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.lock_path.open("a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                entries = self._read()
+                snapshot = dict(entries)
+                yield entries
+                if entries != snapshot:
+                    self._write(entries)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        """Reads the entries, an absent or corrupted file is an empty store."""
+        try:
+            data = codec.loads(self.path.read_bytes())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Writes the entries atomically (readers never see a half-written file)."""
+        tmp_path = self.path.with_suffix(f"{self.path.suffix}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(codec.dumps(entries))
+        tmp_path.replace(self.path)
+
+
+class TokenProvider:
+    """
+    Auth token provider shared by all workers of a test run.
+
+    A token is taken, in order, from memory, from the shared TokenStore, or from a fresh login.
+    A token is considered stale `refresh_margin` seconds before its JWT `exp`, so it is
+    refreshed before the API starts rejecting it. Tokens without `exp` live `default_ttl`.
+    """
+
+    def __init__(
+        self,
+        login: Callable[[], str],
+        key: str,
+        store: TokenStore,
+        refresh_margin: float = 60.0,
+        default_ttl: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initializes the provider.
+
+        Args:
+            login: Performs the login and returns a new token (raises on failure).
+            key: Cache key of the identity, e.g. base URL and user login (never the password).
+            store: Store shared between workers.
+            refresh_margin: Seconds before expiry when a token is refreshed.
+            default_ttl: Lifetime in seconds of tokens without an `exp` claim.
+            clock: Wall clock returning a Unix timestamp (injectable for tests).
+        """
+        self._login = login
+        self.key = key
+        self.store = store
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._token: str | None = None
+        self._expires_at = 0.0
+        self.logins = 0
+
+    def get_token(self) -> str:
+        """
+        Returns a token that stays valid for at least `refresh_margin` seconds.
+
+        Returns:
+            Auth token.
+
+        Raises:
+            Exception: Whatever the login callable raises if a new token cannot be obtained.
+        """
+        if self._token is not None and self._is_fresh(self._expires_at):
+            return self._token
+        with self.store.locked() as entries:
+            entry = entries.get(self.key)
+            if entry is not None and self._is_fresh(entry["expires_at"]):
+                token, expires_at = entry["token"], entry["expires_at"]
+                logger.info("Using cached auth token for %s", self.key)
+            else:
+                logger.info("Logging in for %s (no fresh cached token)", self.key)
+                token = self._login()
+                expires_at = jwt_expiry(token) or self._clock() + self.default_ttl
+                entries[self.key] = {"token": token, "expires_at": expires_at}
+                self.logins += 1
+        self._token, self._expires_at = token, expires_at
+        return token
+
+    def invalidate(self) -> None:
+        """Drops the cached token, e.g. after the API rejected it with 401."""
+        self._token = None
+        with self.store.locked() as entries:
+            entries.pop(self.key, None)
+
+    def _is_fresh(self, expires_at: float) -> bool:
+        """True if a token expiring at `expires_at` is not due for a refresh yet."""
+        return expires_at - self.refresh_margin > self._clock()
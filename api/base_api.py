@@ -2,51 +2,46 @@ import logging
 from typing import TypeVar
 
 import allure
-from playwright.sync_api import APIResponse
 from pydantic import BaseModel, ValidationError
 
+from core.async_http_client import AsyncHTTPClient
+from core.cached_response import CachedResponse
 from core.http_client import HTTPClient
+from core.validation import validate_body
+from utils.allure_utils import AllureUtils
 
 T = TypeVar("T", bound=BaseModel)
 
 
-class BaseAPI:
+class ResponseHandlerMixin:
     """
-    Base class for all client specific APIs (AuthClient, UserClient, etc.).
+    Response handling shared by the sync (BaseAPI) and async (AsyncBaseAPI) clients.
 
-    Provides a generic HTTP client instance and a method for handling responses.
+    Both HTTP clients return CachedResponse, so the same checks apply to either of them.
     """
 
-    def __init__(self, http_client: HTTPClient) -> None:
-        """
-        Initializes the underlying API client.
-
-        Args:
-            http_client: HTTPClient instance to execute requests.
-        """
-        self.http: HTTPClient = http_client
-
-        self.logger = logging.getLogger(self.__class__.__name__)
+    logger: logging.Logger
 
     def _handle_response(
         self,
-        response: APIResponse,
+        response: CachedResponse,
         expected_status: int,
         response_model: type[T] | None = None,
-    ) -> T | APIResponse:
+    ) -> T | CachedResponse:
         """
         A generic method to handle the API response.
 
         Checks the status code and, if a model is specified, validates the response body against it.
 
         Args:
-            response: APIResponse object received from HTTPClient.
+            response: CachedResponse object received from HTTPClient.
             expected_status: Expected HTTP status code.
             response_model: Optional Pydantic model class for validating the response body.
 
         Returns:
             An instance of response_model if the validation was successful.
-            Raw APIResponse object if response_model is not specified or validation is not required.
+            Raw CachedResponse object if response_model is not specified or validation is not
+            required.
 
         Raises:
             AssertionError: If the actual status of the code does not match the expected_status,
@@ -60,7 +55,7 @@ class BaseAPI:
             response.url,
         )
 
-        allure.attach(
+        AllureUtils.attach(
             name=f"Status response code: {response.status} (Expected: {expected_status})",
             body=str(response.status),
             attachment_type=allure.attachment_type.TEXT,
@@ -73,21 +68,20 @@ class BaseAPI:
 
         if response_model and response.status == expected_status:
             try:
-                body_json = response.json()
-                parsed_model: BaseModel = response_model.model_validate(body_json)
+                parsed_model: T = validate_body(response, response_model)
                 self.logger.debug(
                     "Response body validated successfully against %s", response_model.__name__
                 )
 
-                allure.attach(
+                AllureUtils.attach(
                     name=f"Body of the answer (failed by {response_model.__name__})",
-                    body=parsed_model.model_dump_json(indent=2),
+                    body=response.text,
                     attachment_type=allure.attachment_type.JSON,
                 )
             except ValidationError as e:
                 self.logger.exception("Pydantic validation failed for %s", response_model.__name__)
 
-                allure.attach(
+                AllureUtils.attach(
                     name="Pydantic validation error",
                     body=f"Model: {response_model.__name__}\nErrors: {e!s}\n"
                     f"Body of the answer:\n{response.text()}",
@@ -101,7 +95,7 @@ class BaseAPI:
             except Exception as e:
                 self.logger.exception("Failed to parse response JSON or validate model: %s")
 
-                allure.attach(
+                AllureUtils.attach(
                     name="Response parsing/validation error",
                     body=f"Failed to parse JSON or failed to validate the model: {e}.\n"
                     f"Body of the answer:\n{response.text()}",
@@ -119,3 +113,41 @@ class BaseAPI:
                 "No response model provided or status mismatch, returning raw response."
             )
             return response
+
+
+class BaseAPI(ResponseHandlerMixin):
+    """
+    Base class for all client specific APIs (AuthClient, UserClient, etc.).
+
+    Provides a generic HTTP client instance and a method for handling responses.
+    """
+
+    def __init__(self, http_client: HTTPClient) -> None:
+        """
+        Initializes the underlying API client.
+
+        Args:
+            http_client: HTTPClient instance to execute requests.
+        """
+        self.http: HTTPClient = http_client
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+
+class AsyncBaseAPI(ResponseHandlerMixin):
+    """
+    Base class for the asyncio API clients (AsyncAuthClient, AsyncUserClient, etc.).
+
+    Mirrors BaseAPI on top of AsyncHTTPClient and applies the same response checks.
+    """
+
+    def __init__(self, http_client: AsyncHTTPClient) -> None:
+        """
+        Initializes the underlying async API client.
+
+        Args:
+            http_client: AsyncHTTPClient instance to execute requests.
+        """
+        self.http: AsyncHTTPClient = http_client
+
+        self.logger = logging.getLogger(self.__class__.__name__)
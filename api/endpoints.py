@@ -1,4 +1,6 @@
+import re
 from enum import Enum
+from functools import cache
 
 from config.config import API_PREFIX
 
@@ -19,3 +21,32 @@ class APIEndpoints(Enum):
     def format(self, **kwargs: str) -> str:
         """Форматирует URL эндпоинта, подставляя значения для path-параметров."""
         return self.value.format(**kwargs)
+
+    @classmethod
+    def resolve(cls, path: str) -> "APIEndpoints | None":
+        """
+        Находит шаблон эндпоинта для конкретного пути.
+
+        Например, `/api/request/42/contribution` -> `REQUEST_CONTRIBUTION`.
+
+        Args:
+            path: Путь запроса (query-строка игнорируется).
+
+        Returns:
+            Член APIEndpoints или None, если путь не соответствует ни одному шаблону.
+        """
+        path = path.partition("?")[0]
+        for member, pattern in _endpoint_patterns():
+            if pattern.fullmatch(path):
+                return member
+        return None
+
+
+@cache
+def _endpoint_patterns() -> tuple[tuple[APIEndpoints, re.Pattern[str]], ...]:
+    """Компилирует шаблоны эндпоинтов в регулярные выражения (один раз)."""
+    patterns = []
+    for member in APIEndpoints:
+        parts = re.split(r"\{\w+\}", member.value)
+        patterns.append((member, re.compile("[^/]+".join(map(re.escape, parts)))))
+    return tuple(patterns)
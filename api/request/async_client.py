@@ -0,0 +1,112 @@
+import logging
+from collections.abc import Iterator
+from json import JSONDecodeError
+
+import allure
+from pydantic import ValidationError
+
+from api.base_api import AsyncBaseAPI
+from api.endpoints import APIEndpoints
+from api.request.client import iter_help_requests
+from api.request.frame import RequestsFrame
+from api.request.models import HelpRequestData, RequestsListResponse
+from core.cached_response import CachedResponse
+from core.validation import validate_body
+from utils.allure_utils import AllureUtils
+from utils.helpers import attach_models_preview, handle_api_parsing_error
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRequestClient(AsyncBaseAPI):
+    """Асинхронный API клиент для эндпоинтов, связанных c запросами помощи (/api/request/*)."""
+
+    async def get_all_requests(
+        self, expected_status: int = 200
+    ) -> RequestsListResponse | CachedResponse:
+        """
+        Выполняет GET /api/request. Аутентификация не требуется по Swagger.
+
+        Возвращает список HelpRequestData при успехе (200) или CachedResponse при ошибке (500).
+        """
+        endpoint = APIEndpoints.REQUESTS
+        logger.info("Вызов GET %s", endpoint.value)
+        response = await self.http.get(endpoint=endpoint.value)
+        processed_response = self._handle_response(response, expected_status)
+
+        if expected_status == 200:
+            try:
+                validated_list = validate_body(processed_response, RequestsListResponse)
+            except (JSONDecodeError, ValidationError, TypeError) as e:
+                handle_api_parsing_error(
+                    e, processed_response, context_message="Ошибка ответа get_all_requests"
+                )
+            else:
+                attach_models_preview(
+                    "Список запросов (ответ 200 OK)", validated_list, len(validated_list)
+                )
+                return validated_list
+        return processed_response
+
+    async def iter_requests(self) -> Iterator[HelpRequestData]:
+        """
+        Выполняет GET /api/request и возвращает итератор по запросам помощи.
+
+        Ответ получается асинхронно, разбор по одному элементу - обычный итератор
+        (см. iter_help_requests): тело уже в памяти, ожидать при разборе нечего.
+        """
+        endpoint = APIEndpoints.REQUESTS
+        logger.info("Вызов GET %s (потоковый разбор)", endpoint.value)
+        response = await self.http.get(endpoint=endpoint.value)
+        self._handle_response(response, 200)
+        return iter_help_requests(response)
+
+    async def get_requests_frame(self) -> RequestsFrame:
+        """
+        Выполняет GET /api/request и строит по ответу колоночную RequestsFrame.
+
+        Модели HelpRequestData не создаются: числовые поля, даты и категории читаются
+        из тела ответа в массивы NumPy за один проход (см. RequestsFrame).
+        """
+        endpoint = APIEndpoints.REQUESTS
+        logger.info("Вызов GET %s (колоночный разбор)", endpoint.value)
+        response = await self.http.get(endpoint=endpoint.value)
+        self._handle_response(response, 200)
+        return RequestsFrame.from_response(response)
+
+    async def get_request_details(
+        self, request_id: str, expected_status: int = 200
+    ) -> HelpRequestData | CachedResponse:
+        """
+        Выполняет GET /api/request/{id}. Аутентификация не требуется по Swagger.
+
+        Возвращает HelpRequestData при успехе (200) или CachedResponse при ошибке (400, 404, 500).
+        """
+        endpoint = APIEndpoints.REQUEST_DETAIL.format(id=request_id)
+        logger.info("Вызов GET %s", endpoint)
+        response = await self.http.get(endpoint=endpoint)
+        return self._handle_response(
+            response,
+            expected_status,
+            response_model=HelpRequestData if expected_status == 200 else None,
+        )
+
+    async def contribute_to_request(
+        self, request_id: str, expected_status: int = 200
+    ) -> CachedResponse:
+        """
+        Выполняет POST /api/request/{id}/contribution. Аутентификация не требуется по Swagger.
+
+        Возвращает CachedResponse. Тело при успехе (200) - text/plain.
+        """
+        endpoint = APIEndpoints.REQUEST_CONTRIBUTION.format(id=request_id)
+        logger.info("Вызов POST %s", endpoint)
+        response = await self.http.post(endpoint=endpoint)  # POST без тела
+        processed_response = self._handle_response(response, expected_status)
+        if response.status == 200 and expected_status == 200:
+            AllureUtils.attach(
+                name="Тело ответа (200 OK, text/plain)",
+                body=response.text,
+                attachment_type=allure.attachment_type.TEXT,
+            )
+        return processed_response
@@ -1,28 +1,66 @@
-import json
 import logging
+from collections.abc import Iterator
 from json import JSONDecodeError
 
 import allure
-from playwright.sync_api import APIResponse
 from pydantic import ValidationError
 
 from api.base_api import BaseAPI
 from api.endpoints import APIEndpoints
+from api.request.frame import RequestsFrame
 from api.request.models import HelpRequestData, RequestsListResponse
-from utils.helpers import handle_api_parsing_error
+from config.config import ALLURE_LIST_PREVIEW
+from core.cached_response import CachedResponse
+from core.json_stream import iter_json_array
+from core.validation import validate_body
+from utils.allure_utils import AllureUtils
+from utils.helpers import attach_models_preview, handle_api_parsing_error
 
 logger = logging.getLogger(__name__)
 
 
+def iter_help_requests(response: CachedResponse) -> Iterator[HelpRequestData]:
+    """
+    Разбирает тело ответа GET /api/request по одному элементу.
+
+    Массив не загружается через `json()` целиком: элементы разбираются инкрементально
+    и валидируются в HelpRequestData по мере итерации, так что в памяти одновременно
+    находятся только тело ответа и текущий элемент. После полного прохода к Allure
+    прикрепляется начало списка (см. ALLURE_LIST_PREVIEW).
+
+    Args:
+        response: Ответ 200 на GET /api/request.
+
+    Yields:
+        HelpRequestData для каждого элемента массива.
+
+    Raises:
+        AssertionError: Если тело не является JSON-массивом или элемент не прошел валидацию.
+    """
+    items = iter_json_array(response.body())
+    preview: list[HelpRequestData] = []
+    total = 0
+    try:
+        for item in items:
+            model = HelpRequestData.model_validate(item)
+            total += 1
+            if len(preview) < ALLURE_LIST_PREVIEW:
+                preview.append(model)
+            yield model
+    except (JSONDecodeError, ValidationError, TypeError) as e:
+        handle_api_parsing_error(e, response, context_message="Ошибка ответа iter_requests")
+    attach_models_preview("Список запросов (ответ 200 OK)", preview, total)
+
+
 class RequestClient(BaseAPI):
     """API клиент для эндпоинтов, связанных c запросами помощи (/api/request/*)."""
 
     @allure.step("Получение всех запросов помощи")
-    def get_all_requests(self, expected_status: int = 200) -> RequestsListResponse | APIResponse:
+    def get_all_requests(self, expected_status: int = 200) -> RequestsListResponse | CachedResponse:
         """
         Выполняет GET /api/request. Аутентификация не требуется по Swagger.
 
-        Возвращает список HelpRequestData при успехе (200) или APIResponse при ошибке (500).
+        Возвращает список HelpRequestData при успехе (200) или CachedResponse при ошибке (500).
         """
         endpoint = APIEndpoints.REQUESTS
         logger.info("Вызов GET %s", endpoint.value)
@@ -31,33 +69,56 @@ class RequestClient(BaseAPI):
 
         if expected_status == 200:
             try:
-                body_json = processed_response.json()
-                validated_list = [HelpRequestData.model_validate(item) for item in body_json]
+                validated_list = validate_body(processed_response, RequestsListResponse)
             except (JSONDecodeError, ValidationError, TypeError) as e:
                 handle_api_parsing_error(
                     e, processed_response, context_message="Ошибка ответа get_all_requests"
                 )
             else:
-                allure.attach(
-                    name="Список запросов (ответ 200 OK)",
-                    body=json.dumps(
-                        [m.model_dump(mode="json") for m in validated_list],
-                        indent=2,
-                        ensure_ascii=False,
-                    ),
-                    attachment_type=allure.attachment_type.JSON,
+                attach_models_preview(
+                    "Список запросов (ответ 200 OK)", validated_list, len(validated_list)
                 )
                 return validated_list
         return processed_response
 
+    def iter_requests(self) -> Iterator[HelpRequestData]:
+        """
+        Выполняет GET /api/request и возвращает итератор по запросам помощи.
+
+        Список не строится целиком, как в get_all_requests: элементы разбираются
+        и валидируются по одному (см. iter_help_requests). Статус 200 проверяется сразу,
+        до начала итерации.
+
+        Без @allure.step: итератор ленивый, и шаг закрылся бы до разбора первого элемента.
+        """
+        endpoint = APIEndpoints.REQUESTS
+        logger.info("Вызов GET %s (потоковый разбор)", endpoint.value)
+        response = self.http.get(endpoint=endpoint.value)
+        self._handle_response(response, 200)
+        return iter_help_requests(response)
+
+    @allure.step("Получение таблицы запросов помощи")
+    def get_requests_frame(self) -> RequestsFrame:
+        """
+        Выполняет GET /api/request и строит по ответу колоночную RequestsFrame.
+
+        Модели HelpRequestData не создаются: числовые поля, даты и категории читаются
+        из тела ответа в массивы NumPy за один проход (см. RequestsFrame).
+        """
+        endpoint = APIEndpoints.REQUESTS
+        logger.info("Вызов GET %s (колоночный разбор)", endpoint.value)
+        response = self.http.get(endpoint=endpoint.value)
+        self._handle_response(response, 200)
+        return RequestsFrame.from_response(response)
+
     @allure.step("Получение деталей запроса помощи: id={request_id}")
     def get_request_details(
         self, request_id: str, expected_status: int = 200
-    ) -> HelpRequestData | APIResponse:
+    ) -> HelpRequestData | CachedResponse:
         """
         Выполняет GET /api/request/{id}. Аутентификация не требуется по Swagger.
 
-        Возвращает HelpRequestData при успехе (200) или APIResponse при ошибке (400, 404, 500).
+        Возвращает HelpRequestData при успехе (200) или CachedResponse при ошибке (400, 404, 500).
         """
         endpoint = APIEndpoints.REQUEST_DETAIL.format(id=request_id)
         logger.info("Вызов GET %s", endpoint)
@@ -69,20 +130,20 @@ class RequestClient(BaseAPI):
         )
 
     @allure.step("Внесение вклада в запрос помощи: id={request_id}")
-    def contribute_to_request(self, request_id: str, expected_status: int = 200) -> APIResponse:
+    def contribute_to_request(self, request_id: str, expected_status: int = 200) -> CachedResponse:
         """
         Выполняет POST /api/request/{id}/contribution. Аутентификация не требуется по Swagger.
 
-        Возвращает APIResponse. Тело при успехе (200) - text/plain.
+        Возвращает CachedResponse. Тело при успехе (200) - text/plain.
         """
         endpoint = APIEndpoints.REQUEST_CONTRIBUTION.format(id=request_id)
         logger.info("Вызов POST %s", endpoint)
         response = self.http.post(endpoint=endpoint)  # POST без тела
         processed_response = self._handle_response(response, expected_status)
         if response.status == 200 and expected_status == 200:
-            allure.attach(
+            AllureUtils.attach(
                 name="Тело ответа (200 OK, text/plain)",
-                body=response.text(),
+                body=response.text,
                 attachment_type=allure.attachment_type.TEXT,
             )
         return processed_response
@@ -0,0 +1,284 @@
+import datetime as dt
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Any, Literal
+
+import numpy as np
+import numpy.typing as npt
+
+from api.request.models import HelpRequestData
+from core.cached_response import CachedResponse
+from core.json_stream import iter_json_array_spans
+
+NUMERIC_COLUMNS = ("request_goal", "request_goal_current_value", "contributors_count")
+CATEGORICAL_COLUMNS = ("help_type", "requester_type", "city")
+
+Aggregation = Literal["sum", "mean", "count"]
+
+
+def _wire_name(name: str) -> str:
+    """Name of a HelpRequestData field in the JSON body (its alias), as `row()` reads it."""
+    return HelpRequestData.model_fields[name].alias or name
+
+
+def _number(value: Any) -> float:  # noqa: ANN401
+    """JSON number as float, NaN for null and non-numbers."""
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return float(value)
+    return float("nan")
+
+
+def _category(value: Any) -> str | None:  # noqa: ANN401
+    """JSON string as a category, None for null and non-strings."""
+    return value if isinstance(value, str) else None
+
+
+def _day(value: Any) -> np.datetime64:  # noqa: ANN401
+    """ISO date (or datetime) string as datetime64[D], NaT if absent or invalid."""
+    if isinstance(value, str):
+        try:
+            return np.datetime64(value[:10], "D")
+        except ValueError:
+            pass
+    return np.datetime64("NaT", "D")
+
+
+class CategoricalColumn:
+    """
+    Dictionary-encoded column of strings.
+
+    Values are stored as int32 codes into `categories`; -1 stands for null.
+    """
+
+    __slots__ = ("categories", "codes")
+
+    def __init__(self, codes: npt.NDArray[np.int32], categories: tuple[str, ...]) -> None:
+        """
+        Initializes the column.
+
+        Args:
+            codes: Index of each value in `categories` (-1 for null).
+            categories: Distinct values, in order of first appearance.
+        """
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def from_values(cls, values: Iterable[str | None]) -> "CategoricalColumn":
+        """Encodes a sequence of values."""
+        index: dict[str, int] = {}
+        codes = array("i")
+        for value in values:
+            codes.append(-1 if value is None else index.setdefault(value, len(index)))
+        return cls(np.frombuffer(codes, dtype=np.int32).copy(), tuple(index))
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> str | None:
+        """Decoded value of a row."""
+        code = int(self.codes[row])
+        return None if code < 0 else self.categories[code]
+
+    def eq(self, value: str | None) -> npt.NDArray[np.bool_]:
+        """Mask of the rows equal to a value (None matches nulls)."""
+        return self.isin([value])
+
+    def isin(self, values: Iterable[str | None]) -> npt.NDArray[np.bool_]:
+        """Mask of the rows equal to any of the values (None matches nulls)."""
+        codes = [-1 if value is None else self._code(value) for value in values]
+        return np.isin(self.codes, [code for code in codes if code is not None])
+
+    def take(self, rows: npt.NDArray[np.intp]) -> "CategoricalColumn":
+        """Column of the given rows (categories are shared)."""
+        return CategoricalColumn(self.codes[rows], self.categories)
+
+    def _code(self, value: str) -> int | None:
+        """Code of a value, None if it does not occur."""
+        try:
+            return self.categories.index(value)
+        except ValueError:
+            return None
+
+
+class RequestsFrame:
+    """
+    Columnar view of a GET /api/request list for aggregations.
+
+    Numeric fields are float64 NumPy arrays (NaN for null), `ending_date` is datetime64[D]
+    (NaT for null), and `help_type`, `requester_type` and the location city are
+    dictionary-encoded. The frame is built from the body bytes in one streaming pass,
+    without creating HelpRequestData objects. It keeps a reference to the body and the
+    byte span of every item, so `row()` validates a single item on demand.
+
+    Filters take boolean masks built from the columns, e.g.
+    `frame.filter(frame.help_type.eq("finance") & frame.ending_within(days=7))`.
+    """
+
+    def __init__(
+        self,
+        *,
+        ids: npt.NDArray[np.object_],
+        numeric: dict[str, npt.NDArray[np.float64]],
+        ending_date: npt.NDArray[np.datetime64],
+        categorical: dict[str, CategoricalColumn],
+        body: bytes,
+        spans: npt.NDArray[np.int64],
+    ) -> None:
+        """
+        Initializes the frame from ready columns (use `from_body` / `from_response`).
+
+        Args:
+            ids: Request ids.
+            numeric: Columns of NUMERIC_COLUMNS.
+            ending_date: Ending dates.
+            categorical: Columns of CATEGORICAL_COLUMNS.
+            body: Body the rows come from.
+            spans: (start, end) byte offsets of every row in `body`, shape (n, 2).
+        """
+        self.ids = ids
+        self.request_goal = numeric["request_goal"]
+        self.request_goal_current_value = numeric["request_goal_current_value"]
+        self.contributors_count = numeric["contributors_count"]
+        self.ending_date = ending_date
+        self.help_type = categorical["help_type"]
+        self.requester_type = categorical["requester_type"]
+        self.city = categorical["city"]
+        self._body = body
+        self._spans = spans
+
+    @classmethod
+    def from_body(cls, body: bytes) -> "RequestsFrame":
+        """
+        Builds the frame from a raw GET /api/request body.
+
+        Args:
+            body: JSON array of help requests.
+
+        Raises:
+            json.JSONDecodeError: If the body is not a JSON array.
+        """
+        ids: list[str | None] = []
+        numeric = {name: array("d") for name in NUMERIC_COLUMNS}
+        days: list[np.datetime64] = []
+        categorical: dict[str, list[str | None]] = {name: [] for name in CATEGORICAL_COLUMNS}
+        spans = array("q")
+        wire = {name: _wire_name(name) for name in HelpRequestData.model_fields}
+        for item, start, end in iter_json_array_spans(body):
+            row = item if isinstance(item, dict) else {}
+            ids.append(row.get("id"))
+            for name, column in numeric.items():
+                column.append(_number(row.get(wire[name])))
+            days.append(_day(row.get(wire["ending_date"])))
+            location = row.get(wire["location"])
+            city = location.get("city") if isinstance(location, dict) else None
+            categorical["city"].append(_category(city))
+            categorical["help_type"].append(_category(row.get(wire["help_type"])))
+            categorical["requester_type"].append(_category(row.get(wire["requester_type"])))
+            spans.extend((start, end))
+        return cls(
+            ids=np.array(ids, dtype=object),
+            numeric={name: np.frombuffer(column).copy() for name, column in numeric.items()},
+            ending_date=np.array(days, dtype="datetime64[D]"),
+            categorical={
+                name: CategoricalColumn.from_values(values) for name, values in categorical.items()
+            },
+            body=body,
+            spans=np.frombuffer(spans, dtype=np.int64).reshape(-1, 2).copy(),
+        )
+
+    @classmethod
+    def from_response(cls, response: CachedResponse) -> "RequestsFrame":
+        """Builds the frame from a GET /api/request response."""
+        return cls.from_body(response.body())
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return len(self.ids)
+
+    def filter(self, mask: npt.NDArray[np.bool_]) -> "RequestsFrame":
+        """
+        Returns the rows selected by a boolean mask as a new frame.
+
+        Args:
+            mask: Boolean array of the frame length.
+        """
+        rows = np.flatnonzero(mask)
+        return RequestsFrame(
+            ids=self.ids[rows],
+            numeric={name: getattr(self, name)[rows] for name in NUMERIC_COLUMNS},
+            ending_date=self.ending_date[rows],
+            categorical={name: getattr(self, name).take(rows) for name in CATEGORICAL_COLUMNS},
+            body=self._body,
+            spans=self._spans[rows],
+        )
+
+    def funding_progress(self) -> npt.NDArray[np.float64]:
+        """Share of the goal collected per row (NaN if the goal is null or zero)."""
+        goal = np.where(self.request_goal > 0, self.request_goal, np.nan)
+        return self.request_goal_current_value / goal
+
+    def ending_within(self, days: int, today: dt.date | None = None) -> npt.NDArray[np.bool_]:
+        """
+        Mask of the rows ending from today up to `days` days later (inclusive).
+
+        Args:
+            days: Length of the window in days.
+            today: First day of the window (the current date by default).
+        """
+        start = np.datetime64(today or dt.datetime.now(dt.UTC).date(), "D")
+        return (self.ending_date >= start) & (self.ending_date <= start + np.timedelta64(days, "D"))
+
+    def group_by(
+        self, by: str, column: str | None = None, how: Aggregation = "sum"
+    ) -> dict[str | None, float]:
+        """
+        Aggregates a numeric column per value of a categorical column.
+
+        Nulls in the numeric column are skipped. Rows with a null key are grouped under None.
+
+        Args:
+            by: One of CATEGORICAL_COLUMNS.
+            column: One of NUMERIC_COLUMNS (not needed for "count").
+            how: "sum", "mean" or "count" (number of rows).
+
+        Returns:
+            Mapping of the key to the aggregate, for the keys present in the frame.
+
+        Raises:
+            ValueError: If `column` is not given for "sum" or "mean".
+        """
+        keys: CategoricalColumn = getattr(self, by)
+        groups = keys.codes + 1  # null keys (-1) become group 0
+        size = len(keys.categories) + 1
+        counts = np.bincount(groups, minlength=size)
+        if how == "count":
+            result = counts.astype(np.float64)
+        elif column is None:
+            msg = f'group_by(how="{how}") requires a column, one of {NUMERIC_COLUMNS}'
+            raise ValueError(msg)
+        else:
+            values = getattr(self, column)
+            present = ~np.isnan(values)
+            result = np.bincount(groups[present], weights=values[present], minlength=size)
+            if how == "mean":
+                valid = np.bincount(groups[present], minlength=size)
+                result = np.divide(result, valid, out=np.full(size, np.nan), where=valid > 0)
+        labels: list[str | None] = [None, *keys.categories]
+        return {labels[group]: float(result[group]) for group in np.flatnonzero(counts)}
+
+    def row(self, index: int) -> HelpRequestData:
+        """
+        Validates one row into HelpRequestData.
+
+        Raises:
+            pydantic.ValidationError: If the item is not a valid help request.
+        """
+        start, end = self._spans[index]
+        return HelpRequestData.model_validate_json(self._body[start:end])
+
+    def rows(self) -> Iterator[HelpRequestData]:
+        """Validates the rows one by one."""
+        for index in range(len(self)):
+            yield self.row(index)
@@ -10,14 +10,16 @@ class Organization(BaseModel):
     """Модель организации (из HelpRequestData)."""
 
     title: str | None = Field(None, examples=["Благотворительная организация"])
-    is_verified: bool | None = None
+    is_verified: bool | None = Field(None, alias="isVerified")
+    model_config = {"populate_by_name": True, "extra": "ignore"}
 
 
 class ActionStep(BaseModel):
     """Модель шага в плане действий (из HelpRequestData)."""
 
-    step_label: str | None = Field(None, examples=["Шаг 1"])
-    is_done: bool | None = None
+    step_label: str | None = Field(None, alias="stepLabel", examples=["Шаг 1"])
+    is_done: bool | None = Field(None, alias="isDone")
+    model_config = {"populate_by_name": True, "extra": "ignore"}
 
 
 class RequestContacts(BaseModel):
@@ -26,14 +28,16 @@ class RequestContacts(BaseModel):
     email: EmailStr | None = Field(None, examples=["contact@example.com"])
     phone: str | None = Field(None, examples=["+123456789"])
     website: AnyUrl | None = Field(None, examples=["https://example.com"])
+    model_config = {"populate_by_name": True, "extra": "ignore"}
 
 
 class HelperRequirements(BaseModel):
     """Модель требований к помощнику (из HelpRequestData)."""
 
-    helper_type: Literal["group", "single"] | None = None
-    is_online: bool | None = None
+    helper_type: Literal["group", "single"] | None = Field(None, alias="helperType")
+    is_online: bool | None = Field(None, alias="isOnline")
     qualification: Literal["professional", "common"] | None = None
+    model_config = {"populate_by_name": True, "extra": "ignore"}
 
 
 class HelpRequestData(BaseModel):
@@ -43,17 +47,23 @@ class HelpRequestData(BaseModel):
     title: str | None = Field(None, examples=["Помощь в проекте"])
     organization: Organization | None = None
     description: str | None = Field(None, examples=["Описание запроса на помощь."])
-    goal_description: str | None = Field(None, examples=["Цель данного запроса."])
-    actions_schedule: list[ActionStep] = Field(default_factory=list)
-    ending_date: datetime.date | None = Field(None, examples=["2023-12-31"])
+    goal_description: str | None = Field(
+        None, alias="goalDescription", examples=["Цель данного запроса."]
+    )
+    actions_schedule: list[ActionStep] = Field(default_factory=list, alias="actionsSchedule")
+    ending_date: datetime.date | None = Field(None, alias="endingDate", examples=["2023-12-31"])
     location: Location | None = None
     contacts: RequestContacts | None = None
-    requester_type: Literal["person", "organization"] | None = None
-    help_type: Literal["finance", "material"] | None = None
-    helper_requirements: HelperRequirements | None = None
-    contributors_count: int | None = Field(None, examples=[10])
-    request_goal: int | None = Field(None, examples=[10000])
-    request_goal_current_value: int | None = Field(None, examples=[2500])
+    requester_type: Literal["person", "organization"] | None = Field(None, alias="requesterType")
+    help_type: Literal["finance", "material"] | None = Field(None, alias="helpType")
+    helper_requirements: HelperRequirements | None = Field(None, alias="helperRequirements")
+    contributors_count: int | None = Field(None, alias="contributorsCount", examples=[10])
+    request_goal: int | None = Field(None, alias="requestGoal", examples=[10000])
+    request_goal_current_value: int | None = Field(
+        None, alias="requestGoalCurrentValue", examples=[2500]
+    )
+
+    model_config = {"extra": "ignore", "populate_by_name": True}
 
 
 RequestsListResponse = list[HelpRequestData]
@@ -0,0 +1,114 @@
+import json
+import logging
+
+import allure
+
+from api.base_api import AsyncBaseAPI
+from api.endpoints import APIEndpoints
+from api.user.models import (
+    AddToFavouritesPayload,
+    FavouritesListResponse,
+    FavouritesSet,
+    UserDataResponse,
+)
+from core.cached_response import CachedResponse
+from core.validation import validate_body
+from utils.allure_utils import AllureUtils
+from utils.helpers import handle_api_parsing_error
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncUserClient(AsyncBaseAPI):
+    """Асинхронный API клиент для эндпоинтов, связанных c пользователем (/api/user/*)."""
+
+    async def get_favourites(
+        self, expected_status: int = 200, *, as_set: bool = False
+    ) -> FavouritesListResponse | FavouritesSet | CachedResponse:
+        """
+        Выполняет GET /api/user/favourites. Требует аутентификации.
+
+        Возвращает список ID (List[str]) при успехе (200) или CachedResponse при ошибке (403, 500).
+        C `as_set=True` вместо списка возвращает FavouritesSet (проверка `in` за O(1),
+        операции множеств для сравнения c ожидаемым избранным).
+        """
+        endpoint = APIEndpoints.USER_FAVOURITES
+        response = await self.http.get(endpoint=endpoint.format())
+
+        processed_response = self._handle_response(response, expected_status)
+
+        if expected_status == 200:
+            try:
+                validated_list: FavouritesListResponse | FavouritesSet = validate_body(
+                    processed_response, FavouritesSet if as_set else FavouritesListResponse
+                )
+
+                AllureUtils.attach(
+                    name="Список избранного (ответ 200 OK)",
+                    body=lambda: str(list(validated_list)),
+                    attachment_type=allure.attachment_type.JSON,
+                )
+            except (json.JSONDecodeError, ValueError) as e:
+                handle_api_parsing_error(
+                    e, processed_response, context_message="Ошибка ответа get_favourites"
+                )
+            else:
+                return validated_list
+        return processed_response
+
+    async def add_to_favourites(
+        self, payload: AddToFavouritesPayload, expected_status: int = 200
+    ) -> CachedResponse:
+        """
+        Выполняет POST /api/user/favourites. Требует аутентификации.
+
+        Возвращает CachedResponse. Тело при успехе (200) - text/plain.
+        """
+        endpoint = APIEndpoints.USER_FAVOURITES
+        logger.info("Вызов POST %s c payload: %s", endpoint.value, payload)
+        response = await self.http.post(
+            endpoint=endpoint.value, json=payload.model_dump(by_alias=True)
+        )
+        processed_response = self._handle_response(response, expected_status)
+        if response.status == 200 and expected_status == 200:
+            AllureUtils.attach(
+                name="Тело ответа (200 OK, text/plain)",
+                body=response.text,
+                attachment_type=allure.attachment_type.TEXT,
+            )
+        return processed_response
+
+    async def remove_from_favourites(
+        self, request_id: str, expected_status: int = 200
+    ) -> CachedResponse:
+        """
+        Выполняет DELETE /api/user/favourites/{requestId}. Требует аутентификации.
+
+        Возвращает CachedResponse. Тело при успехе (200) - text/plain.
+        """
+        endpoint = APIEndpoints.USER_FAVOURITES_DETAIL.format(requestId=request_id)
+        logger.info("Вызов DELETE %s", endpoint)
+        response = await self.http.delete(endpoint=endpoint)
+        processed_response = self._handle_response(response, expected_status)
+        if response.status == 200 and expected_status == 200:
+            AllureUtils.attach(
+                name="Тело ответа (200 OK, text/plain)",
+                body=response.text,
+                attachment_type=allure.attachment_type.TEXT,
+            )
+        return processed_response
+
+    async def get_user_info(self, expected_status: int = 200) -> UserDataResponse | CachedResponse:
+        """
+        Выполняет GET /api/user. Требует аутентификации.
+
+        Возвращает UserDataResponse при успехе (200) или CachedResponse при ошибке (401, 500).
+        """
+        endpoint = APIEndpoints.USER
+        logger.info("Вызов GET %s", endpoint.value)
+        response = await self.http.get(endpoint=endpoint.value)
+        return self._handle_response(
+            response,
+            expected_status,
+            response_model=UserDataResponse if expected_status == 200 else None,
+        )
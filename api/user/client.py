@@ -2,16 +2,19 @@ import json
 import logging
 
 import allure
-from playwright.sync_api import APIResponse
 
 from api.base_api import BaseAPI
 from api.endpoints import APIEndpoints
 from api.user.models import (
     AddToFavouritesPayload,
     FavouritesListResponse,
+    FavouritesSet,
     UserDataResponse,
 )
-from utils.helpers import handle_api_parsing_error, validate_list_of_strings
+from core.cached_response import CachedResponse
+from core.validation import validate_body
+from utils.allure_utils import AllureUtils
+from utils.helpers import handle_api_parsing_error
 
 logger = logging.getLogger(__name__)
 
@@ -19,11 +22,15 @@ logger = logging.getLogger(__name__)
 class UserClient(BaseAPI):
     """API клиент для эндпоинтов, связанных c пользователем (/api/user/*)."""
 
-    def get_favourites(self, expected_status: int = 200) -> FavouritesListResponse | APIResponse:
+    def get_favourites(
+        self, expected_status: int = 200, *, as_set: bool = False
+    ) -> FavouritesListResponse | FavouritesSet | CachedResponse:
         """
         Выполняет GET /api/user/favourites. Требует аутентификации.
 
-        Возвращает список ID (List[str]) при успехе (200) или APIResponse при ошибке (403, 500).
+        Возвращает список ID (List[str]) при успехе (200) или CachedResponse при ошибке (403, 500).
+        C `as_set=True` вместо списка возвращает FavouritesSet (проверка `in` за O(1),
+        операции множеств для сравнения c ожидаемым избранным).
         """
         endpoint = APIEndpoints.USER_FAVOURITES
         response = self.http.get(endpoint=endpoint.format())
@@ -32,12 +39,13 @@ class UserClient(BaseAPI):
 
         if expected_status == 200:
             try:
-                body_json = processed_response.json()
-                validated_list: FavouritesListResponse = validate_list_of_strings(body_json)
+                validated_list: FavouritesListResponse | FavouritesSet = validate_body(
+                    processed_response, FavouritesSet if as_set else FavouritesListResponse
+                )
 
-                allure.attach(
+                AllureUtils.attach(
                     name="Список избранного (ответ 200 OK)",
-                    body=str(validated_list),
+                    body=lambda: str(list(validated_list)),
                     attachment_type=allure.attachment_type.JSON,
                 )
             except (json.JSONDecodeError, ValueError) as e:
@@ -51,49 +59,49 @@ class UserClient(BaseAPI):
     @allure.step("Добавление запроса в избранное")
     def add_to_favourites(
         self, payload: AddToFavouritesPayload, expected_status: int = 200
-    ) -> APIResponse:
+    ) -> CachedResponse:
         """
         Выполняет POST /api/user/favourites. Требует аутентификации.
 
-        Возвращает APIResponse. Тело при успехе (200) - text/plain.
+        Возвращает CachedResponse. Тело при успехе (200) - text/plain.
         """
         endpoint = APIEndpoints.USER_FAVOURITES
         logger.info("Вызов POST %s c payload: %s", endpoint.value, payload)
         response = self.http.post(endpoint=endpoint.value, json=payload.model_dump(by_alias=True))
         processed_response = self._handle_response(response, expected_status)
         if response.status == 200 and expected_status == 200:
-            allure.attach(
+            AllureUtils.attach(
                 name="Тело ответа (200 OK, text/plain)",
-                body=response.text(),
+                body=response.text,
                 attachment_type=allure.attachment_type.TEXT,
             )
         return processed_response
 
     @allure.step("Удаление запроса из избранного")
-    def remove_from_favourites(self, request_id: str, expected_status: int = 200) -> APIResponse:
+    def remove_from_favourites(self, request_id: str, expected_status: int = 200) -> CachedResponse:
         """
         Выполняет DELETE /api/user/favourites/{requestId}. Требует аутентификации.
 
-        Возвращает APIResponse. Тело при успехе (200) - text/plain.
+        Возвращает CachedResponse. Тело при успехе (200) - text/plain.
         """
         endpoint = APIEndpoints.USER_FAVOURITES_DETAIL.format(requestId=request_id)
         logger.info("Вызов DELETE %s", endpoint)
         response = self.http.delete(endpoint=endpoint)
         processed_response = self._handle_response(response, expected_status)
         if response.status == 200 and expected_status == 200:
-            allure.attach(
+            AllureUtils.attach(
                 name="Тело ответа (200 OK, text/plain)",
-                body=response.text(),
+                body=response.text,
                 attachment_type=allure.attachment_type.TEXT,
             )
         return processed_response
 
     @allure.step("Получение данных текущего пользователя")
-    def get_user_info(self, expected_status: int = 200) -> UserDataResponse | APIResponse:
+    def get_user_info(self, expected_status: int = 200) -> UserDataResponse | CachedResponse:
         """
         Выполняет GET /api/user. Требует аутентификации.
 
-        Возвращает UserDataResponse при успехе (200) или APIResponse при ошибке (401, 500).
+        Возвращает UserDataResponse при успехе (200) или CachedResponse при ошибке (401, 500).
         """
         endpoint = APIEndpoints.USER
         logger.info("Вызов GET %s", endpoint.value)
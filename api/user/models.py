@@ -1,7 +1,10 @@
 import datetime
-from typing import Literal
+from collections.abc import Iterable, Iterator
+from collections.abc import Set as AbstractSet
+from typing import Any, Literal
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, GetCoreSchemaHandler
+from pydantic_core import core_schema
 
 
 class AddToFavouritesPayload(BaseModel):
@@ -20,6 +23,63 @@ class AddToFavouritesPayload(BaseModel):
 FavouritesListResponse = list[str]
 
 
+class FavouritesSet(AbstractSet[str]):
+    """
+    Избранное пользователя как множество ID c сохранением исходного порядка.
+
+    Проверка `request_id in favourites` выполняется за O(1). Операции `-`, `|`, `&`, `^`
+    работают c любыми множествами и списками ID, например `expected - favourites` -
+    ожидаемые, но отсутствующие ID; сравнения (`==`, `<=`) - c множествами. Результаты
+    операций тоже FavouritesSet в порядке элементов. Повторяющиеся ID хранятся один раз.
+
+    Валидируется pydantic как список строк (за один проход при разборе тела ответа).
+    """
+
+    __slots__ = ("_ids",)
+
+    def __init__(self, ids: Iterable[str] = ()) -> None:
+        """
+        Создает множество.
+
+        Args:
+            ids: ID запросов в исходном порядке.
+        """
+        self._ids: dict[str, None] = dict.fromkeys(ids)
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls,
+        source: Any,  # noqa: ANN401
+        handler: GetCoreSchemaHandler,
+    ) -> core_schema.CoreSchema:
+        """Схема валидации: список строк, обернутый в FavouritesSet."""
+        return core_schema.no_info_after_validator_function(
+            cls,
+            core_schema.list_schema(core_schema.str_schema()),
+            serialization=core_schema.plain_serializer_function_ser_schema(list),
+        )
+
+    def __contains__(self, request_id: object) -> bool:
+        """Проверяет наличие ID за O(1)."""
+        return request_id in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        """Перебирает ID в исходном порядке."""
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        """Количество ID."""
+        return len(self._ids)
+
+    def __hash__(self) -> int:
+        """Хэш множества (оно неизменяемо), совпадает c хэшем frozenset тех же ID."""
+        return self._hash()
+
+    def __repr__(self) -> str:
+        """Представление для логов и Allure."""
+        return f"FavouritesSet({list(self._ids)!r})"
+
+
 class Location(BaseModel):
     """Модель местоположения."""
 
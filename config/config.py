@@ -11,6 +11,27 @@ load_dotenv(dotenv_path=dotenv_path)
 BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8080")
 API_PREFIX = "/api"
 TIMEOUT = int(os.getenv("API_TIMEOUT", "10000"))
+BATCH_MAX_CONCURRENCY = int(os.getenv("API_BATCH_CONCURRENCY", "8"))
+ALLURE_ATTACH_POLICY = os.getenv("ALLURE_ATTACH_POLICY", "always")
+ALLURE_LIST_PREVIEW = int(os.getenv("ALLURE_LIST_PREVIEW", "20"))
+RETRY_MAX_ATTEMPTS = int(os.getenv("API_RETRY_MAX_ATTEMPTS", "3"))
+RETRY_BACKOFF_BASE = float(os.getenv("API_RETRY_BACKOFF_BASE", "0.2"))
+RETRY_BACKOFF_MAX = float(os.getenv("API_RETRY_BACKOFF_MAX", "5.0"))
+BREAKER_CONSECUTIVE_FAILURES = int(os.getenv("API_BREAKER_CONSECUTIVE_FAILURES", "3"))
+BREAKER_FAILURE_RATE = float(os.getenv("API_BREAKER_FAILURE_RATE", "0.5"))
+BREAKER_RESET_TIMEOUT = float(os.getenv("API_BREAKER_RESET_TIMEOUT", "30"))
+TOKEN_REFRESH_MARGIN = float(os.getenv("AUTH_TOKEN_REFRESH_MARGIN", "60"))
+HTTP_CACHE_MAX_ENTRIES = int(os.getenv("API_HTTP_CACHE_MAX_ENTRIES", "256"))
+VALIDATION_LEVEL = os.getenv("API_VALIDATION_LEVEL", "full")
+JSON_CODEC = os.getenv("API_JSON_CODEC", "auto")
+SWAGGER_SPEC_PATH = Path(__file__).parent.parent / "docs" / "swagger.json"
+CONTRACT_CHECK = os.getenv("API_CONTRACT_CHECK", "false").lower() in {"1", "true", "yes", "on"}
+STANDIN_SERVER = os.getenv("API_STANDIN_SERVER", "false").lower() in {"1", "true", "yes", "on"}
+STANDIN_REQUESTS = int(os.getenv("API_STANDIN_REQUESTS", "20"))
+STANDIN_DESCRIPTION_LENGTH = int(os.getenv("API_STANDIN_DESCRIPTION_LENGTH", "0"))
+CASSETTE_RECORD = os.getenv("API_CASSETTE_RECORD") or None
+CASSETTE_REPLAY = os.getenv("API_CASSETTE_REPLAY") or None
+CODEGEN_DIR = Path(os.getenv("API_CODEGEN_DIR", str(Path(__file__).parent.parent / ".codegen")))
 
 login: EmailStr | None = os.getenv("TEST_USER_LOGIN")
 
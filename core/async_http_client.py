@@ -0,0 +1,175 @@
+import logging
+from typing import Any
+
+from playwright.async_api import APIRequestContext
+
+from config.config import TIMEOUT
+from core.cached_response import CachedResponse
+from core.request_spec import RequestSpec
+from utils.allure_utils import AllureUtils
+
+
+class AsyncHTTPClient:
+    """
+    Low-level asyncio HTTP client.
+
+    Async counterpart of HTTPClient: uses the Playwright async APIRequestContext, so a single
+    worker can keep many requests in flight (e.g. with asyncio.gather).
+    """
+
+    def __init__(self, api_context: APIRequestContext) -> None:
+        """
+        Initializes AsyncHTTPClient with the provided async APIRequestContext Playwright.
+
+        Args:
+            api_context: The async APIRequestContext instance configured with the base URL, etc.
+        """
+        self.api_request_context: APIRequestContext = api_context
+        self.logger = logging.getLogger(__name__)
+
+    async def get(
+        self,
+        endpoint: str,
+        headers: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> CachedResponse:
+        """
+        Sends a GET request to the specified endpoint.
+
+        Args:
+            endpoint: Relative path to the endpoint (relative to the base_url of the context).
+            headers: Optional dictionary of request headers.
+            params: Optional dictionary of URL request parameters.
+
+        Returns:
+            CachedResponse with the response body read once from the driver.
+        """
+        self.logger.info("Sending GET request to %s with params: %s", endpoint, params)
+        raw_response = await self.api_request_context.get(
+            endpoint, headers=headers, params=params, timeout=TIMEOUT
+        )
+        response = await CachedResponse.from_async_response(raw_response)
+        self.logger.info("Received response %s from %s", response.status, response.url)
+        AllureUtils.attach_response(response)
+        return response
+
+    async def post(
+        self,
+        endpoint: str,
+        headers: dict[str, Any] | None = None,
+        data: dict[str, Any] | str | bytes | None = None,
+        json: Any | None = None,  # noqa: ANN401
+    ) -> CachedResponse:
+        """
+        Sends a POST request to the specified endpoint.
+
+        Preferably use either `data` or `json`, not both at once.
+
+        Args:
+            endpoint: Relative path to the endpoint.
+            headers: Optional dictionary of request headers.
+            data: Optional data to be sent (e.g. form data).
+            json: Optional data to send in JSON format.
+
+        Returns:
+            CachedResponse with the response body read once from the driver.
+        """
+        self.logger.info("Sending POST request to %s", endpoint)
+        spec = RequestSpec("POST", endpoint, headers=headers, data=data, json=json)
+        raw_response = await self.api_request_context.post(
+            endpoint,
+            headers=spec.headers_with(),
+            data=spec.body,
+            timeout=TIMEOUT,
+        )
+        response = await CachedResponse.from_async_response(raw_response)
+        self.logger.info("Received response %s from %s", response.status, response.url)
+        AllureUtils.attach_response(response)
+        return response
+
+    async def put(
+        self,
+        endpoint: str,
+        headers: dict[str, Any] | None = None,
+        data: dict[str, Any] | str | bytes | None = None,
+        json: Any | None = None,  # noqa: ANN401
+    ) -> CachedResponse:
+        """
+        Sends a PUT request to the specified endpoint.
+
+        Args:
+            endpoint: Relative path to the endpoint.
+            headers: Optional dictionary of request headers.
+            data: Optional data to be sent (e.g. form data).
+            json: Optional data to send in JSON format.
+
+        Returns:
+            CachedResponse with the response body read once from the driver.
+        """
+        self.logger.info("Sending PUT request to %s", endpoint)
+        spec = RequestSpec("PUT", endpoint, headers=headers, data=data, json=json)
+        raw_response = await self.api_request_context.put(
+            endpoint,
+            headers=spec.headers_with(),
+            data=spec.body,
+            timeout=TIMEOUT,
+        )
+        response = await CachedResponse.from_async_response(raw_response)
+        self.logger.info("Received response %s from %s", response.status, response.url)
+        AllureUtils.attach_response(response)
+        return response
+
+    async def delete(
+        self,
+        endpoint: str,
+        headers: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> CachedResponse:
+        """
+        Sends a DELETE request to the specified endpoint.
+
+        Args:
+            endpoint: Relative path to the endpoint.
+            headers: Optional query header dictionary.
+            params: Optional dictionary of URL request parameters.
+
+        Returns:
+            CachedResponse with the response body read once from the driver.
+        """
+        self.logger.info("Sending DELETE request to %s", endpoint)
+        raw_response = await self.api_request_context.delete(
+            endpoint, headers=headers, params=params, timeout=TIMEOUT
+        )
+        response = await CachedResponse.from_async_response(raw_response)
+        self.logger.info("Received response %s from %s", response.status, response.url)
+        AllureUtils.attach_response(response)
+        return response
+
+    async def patch(
+        self,
+        endpoint: str,
+        headers: dict[str, Any] | None = None,
+        data: dict[str, Any] | str | bytes | None = None,
+        json: Any | None = None,  # noqa: ANN401
+    ) -> CachedResponse:
+        """
+        Sends a PATCH request to the specified endpoint.
+
+        Args:
+            endpoint: Relative path to the endpoint.
+            headers: Optional query header dictionary.
+            data: Optional data to send (e.g. form data).
+            json: Optional data to send in JSON format.
+
+        Returns:
+            CachedResponse with the response body read once from the driver.
+        """
+        self.logger.info("Sending PATCH request to %s", endpoint)
+        spec = RequestSpec("PATCH", endpoint, headers=headers, data=data, json=json)
+        raw_response = await self.api_request_context.patch(
+            endpoint, headers=spec.headers_with(), data=spec.body, timeout=TIMEOUT
+        )
+        response = await CachedResponse.from_async_response(raw_response)
+        self.logger.info("Received response %s from %s", response.status, response.url)
+        AllureUtils.attach_response(response)
+        return response
@@ -0,0 +1,174 @@
+import copy
+from collections.abc import Callable, Hashable
+from typing import Any, Self, TypeVar
+
+from playwright.async_api import APIResponse as AsyncAPIResponse
+from playwright.sync_api import APIResponse
+
+from core.json_codec import codec
+
+_NOT_PARSED = object()
+
+V = TypeVar("V")
+
+
+class CachedResponse:
+    """
+    Read-once snapshot of a Playwright APIResponse.
+
+    The body bytes are fetched from the Playwright driver once, when the response is received.
+    Text and parsed JSON are computed on first access and memoized, so repeated
+    `text()` / `json()` calls (Allure attachments, BaseAPI checks, client parsing) cost nothing.
+    Exposes the APIResponse attributes the clients use: `status`, `status_text`, `ok`, `url`,
+    `headers`, `body()`, `text()`, `json()`, plus `attempts` - how many times HTTPClient sent
+    the request before getting this response (see RetryPolicy).
+
+    Note: `json()` and `memoized()` return the same object on every call, callers must not
+    mutate it. This is what makes a response served again by the HTTP cache nearly free.
+    """
+
+    __slots__ = (
+        "_body",
+        "_json",
+        "_memo",
+        "_text",
+        "attempts",
+        "headers",
+        "status",
+        "status_text",
+        "url",
+    )
+
+    def __init__(
+        self,
+        *,
+        status: int,
+        url: str,
+        headers: dict[str, str],
+        body: bytes,
+        status_text: str = "",
+    ) -> None:
+        """
+        Initializes CachedResponse from already received response data.
+
+        Args:
+            status: HTTP status code.
+            url: Final URL of the response.
+            headers: Response headers (lower-case names, as in Playwright).
+            body: Raw response body.
+            status_text: HTTP status text.
+        """
+        self.status = status
+        self.status_text = status_text
+        self.url = url
+        self.headers = headers
+        self._body = body
+        self._text: str | None = None
+        self._json: Any = _NOT_PARSED
+        self._memo: dict[Hashable, Any] | None = None
+        self.attempts = 1
+
+    @classmethod
+    def from_response(cls, response: APIResponse) -> "CachedResponse":
+        """
+        Reads the sync APIResponse once and releases its body in the driver.
+
+        Args:
+            response: APIResponse object by Playwright.
+
+        Returns:
+            CachedResponse with the response body loaded into memory.
+        """
+        cached = cls(
+            status=response.status,
+            status_text=response.status_text,
+            url=response.url,
+            headers=response.headers,
+            body=response.body(),
+        )
+        response.dispose()
+        return cached
+
+    @classmethod
+    async def from_async_response(cls, response: AsyncAPIResponse) -> "CachedResponse":
+        """
+        Reads the async APIResponse once and releases its body in the driver.
+
+        Args:
+            response: Async APIResponse object by Playwright.
+
+        Returns:
+            CachedResponse with the response body loaded into memory.
+        """
+        cached = cls(
+            status=response.status,
+            status_text=response.status_text,
+            url=response.url,
+            headers=response.headers,
+            body=await response.body(),
+        )
+        await response.dispose()
+        return cached
+
+    @property
+    def ok(self) -> bool:
+        """True if the status code is in the 200-299 range (same as APIResponse.ok)."""
+        return 200 <= self.status <= 299
+
+    def body(self) -> bytes:
+        """Returns the raw response body."""
+        return self._body
+
+    def text(self) -> str:
+        """Returns the response body decoded as UTF-8 (decoded once)."""
+        if self._text is None:
+            self._text = self._body.decode("utf-8", errors="replace")
+        return self._text
+
+    def json(self) -> Any:  # noqa: ANN401
+        """
+        Returns the parsed JSON body (parsed once, by the process JSON codec).
+
+        Raises:
+            json.JSONDecodeError: If the body is not valid JSON.
+        """
+        if self._json is _NOT_PARSED:
+            self._json = codec.loads(self._body)
+        return self._json
+
+    def memoized(self, key: Hashable, factory: Callable[[], V]) -> V:
+        """
+        Returns a value derived from this response, computed on first access.
+
+        Used for validated Pydantic models: a response served again from the HTTP cache
+        is not re-validated.
+
+        Args:
+            key: Identity of the derived value (e.g. the model class).
+            factory: Computes the value; if it raises, nothing is stored.
+        """
+        if self._memo is None:
+            self._memo = {}
+        if key not in self._memo:
+            self._memo[key] = factory()
+        return self._memo[key]
+
+    def fresh_copy(self) -> Self:
+        """
+        Returns a copy to serve as a new response to another request.
+
+        The body, text and parsed JSON are shared (they are never mutated); `attempts` and
+        the memoized values are per copy, so the retry count and the validated models of
+        one call do not leak into another.
+        """
+        clone = copy.copy(self)
+        clone.attempts = 1
+        clone._memo = None  # noqa: SLF001
+        return clone
+
+    def dispose(self) -> None:
+        """Kept for APIResponse compatibility: the driver-side body is already released."""
+
+    def __repr__(self) -> str:
+        """Short representation for logs and Allure."""
+        return f"<CachedResponse url={self.url!r} status={self.status!r}>"
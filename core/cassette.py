@@ -0,0 +1,288 @@
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from collections import Counter
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+from core.cached_response import CachedResponse
+from core.interceptors import Interceptor
+from core.json_codec import codec
+from core.request_spec import RequestSpec
+
+MAGIC = b"FITYMCS1"
+"""File signature and format version."""
+
+_HEADER = struct.Struct("<8sQ")
+"""Magic, number of index entries."""
+_ENTRY = struct.Struct("<16sIQI")
+"""Fingerprint, sequence number, record offset, record length."""
+_RECORD = struct.Struct("<HHHII")
+"""Status, then lengths of status text, URL, headers JSON and body."""
+
+
+def _unscoped() -> str:
+    """Default scope: requests are not told apart by where they were sent from."""
+    return ""
+
+
+def fingerprint(spec: RequestSpec, scope: str = "") -> bytes:
+    """
+    Identity of a request for replay: method, path, query parameters and body.
+
+    Headers are not part of it: tokens and conditional headers differ from run to run.
+
+    Args:
+        spec: The request.
+        scope: Where the request was sent from (e.g. the test id), "" for any place.
+
+    Returns:
+        16-byte BLAKE2b digest.
+    """
+    body = spec.body
+    if isinstance(body, str):
+        body = body.encode()
+    elif body is not None and not isinstance(body, bytes):
+        body = codec.dumps(body)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{scope}\0{spec.method.upper()} {spec.endpoint}\0".encode())
+    digest.update(codec.dumps(sorted((spec.params or {}).items())))
+    digest.update(b"\0")
+    digest.update(body or b"")
+    return digest.digest()
+
+
+def _encode(response: CachedResponse) -> bytes:
+    """Serializes a response into a cassette record."""
+    parts = (
+        response.status_text.encode(),
+        response.url.encode(),
+        codec.dumps(response.headers),
+        response.body(),
+    )
+    return _RECORD.pack(response.status, *map(len, parts)) + b"".join(parts)
+
+
+def _decode(record: bytes) -> CachedResponse:
+    """Restores a response from a cassette record."""
+    status, *lengths = _RECORD.unpack_from(record)
+    fields: list[bytes] = []
+    offset = _RECORD.size
+    for length in lengths:
+        fields.append(record[offset : offset + length])
+        offset += length
+    status_text, url, headers, body = fields
+    return CachedResponse(
+        status=status,
+        status_text=status_text.decode(),
+        url=url.decode(),
+        headers=codec.loads(headers),
+        body=body,
+    )
+
+
+class CassetteRecorder(Interceptor):
+    """
+    Interceptor recording the request / response pairs of an HTTPClient into a cassette.
+
+    Register it first in the chain so it records what the caller gets (after the HTTP
+    cache replaced a 304). Every response is indexed twice: under the fingerprint scoped
+    to where it was sent from (the test) and under the unscoped one. Repeated requests
+    with the same fingerprint are stored in order and replayed in that order.
+    """
+
+    def __init__(self, scope: Callable[[], str] = _unscoped) -> None:
+        """
+        Initializes an empty recording.
+
+        Args:
+            scope: Returns where the current request is sent from, e.g. the current test id
+                ("" by default: only unscoped fingerprints are recorded).
+        """
+        self.scope = scope
+        self._lock = threading.Lock()
+        self._records: list[bytes] = []
+        self._entries: list[tuple[bytes, int, int]] = []
+        self._sequence: Counter[bytes] = Counter()
+
+    def __len__(self) -> int:
+        """Number of recorded responses."""
+        return len(self._records)
+
+    def on_response(self, spec: RequestSpec, response: CachedResponse) -> CachedResponse:
+        """Records the response of the request."""
+        scope = self.scope()
+        keys = {fingerprint(spec), fingerprint(spec, scope)}
+        record = _encode(response)
+        with self._lock:
+            for key in keys:
+                self._entries.append((key, self._sequence[key], len(self._records)))
+                self._sequence[key] += 1
+            self._records.append(record)
+        return response
+
+    def save(self, path: Path) -> None:
+        """
+        Writes the cassette: header, index sorted by fingerprint, then the records.
+
+        The file is replaced atomically, so a reader never sees a partial cassette.
+        """
+        with self._lock:
+            records = list(self._records)
+            entries = sorted(self._entries)
+        offsets = [_HEADER.size + _ENTRY.size * len(entries)]
+        for record in records:
+            offsets.append(offsets[-1] + len(record))
+        index = bytearray(_HEADER.pack(MAGIC, len(entries)))
+        for key, sequence, number in entries:
+            index += _ENTRY.pack(key, sequence, offsets[number], len(records[number]))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        with os.fdopen(fd, "wb") as file:
+            file.write(index)
+            file.writelines(records)
+        Path(temp).replace(path)
+
+
+class Cassette:
+    """
+    Recorded responses, memory-mapped from a cassette file.
+
+    Opening reads only the header; lookups binary-search the index in the mapping and
+    decode just the matching records. The mapping is read-only, so xdist workers replaying
+    the same cassette share its pages in the OS page cache.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Opens a cassette.
+
+        Raises:
+            ValueError: If the file is not a cassette of this format.
+        """
+        self.path = path
+        with path.open("rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count = (
+            _HEADER.unpack_from(self._map) if len(self._map) >= _HEADER.size else (b"", 0)
+        )
+        if magic != MAGIC:
+            self._map.close()
+            msg = f"{path} is not a cassette (expected signature {MAGIC!r})"
+            raise ValueError(msg)
+
+    def __len__(self) -> int:
+        """Number of index entries."""
+        return self._count
+
+    def _key_at(self, index: int) -> bytes:
+        """Fingerprint of the index entry."""
+        start = _HEADER.size + index * _ENTRY.size
+        return self._map[start : start + 16]
+
+    def responses(self, key: bytes) -> list[CachedResponse]:
+        """Responses recorded for a fingerprint, in recording order."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        found: list[CachedResponse] = []
+        while low < self._count and self._key_at(low) == key:
+            _, _, offset, length = _ENTRY.unpack_from(self._map, _HEADER.size + low * _ENTRY.size)
+            found.append(_decode(self._map[offset : offset + length]))
+            low += 1
+        return found
+
+    def close(self) -> None:
+        """Unmaps the file."""
+        self._map.close()
+
+
+class CassetteMissError(RuntimeError):
+    """Raised when a replayed request was never recorded."""
+
+
+class CassetteReplay:
+    """
+    Serves recorded responses as the backend of MockHTTPClient.
+
+    Requests are looked up by the fingerprint scoped to the current test first, so a test
+    gets the responses recorded for it whatever tests ran before it and on whichever xdist
+    worker; requests the test did not send while recording (e.g. a session login that
+    happened in another test) fall back to the unscoped fingerprint. The n-th identical
+    request gets the n-th recorded response, the last one is repeated after that, so
+    stateful flows (add a favourite, then list) replay as recorded. Decoded responses are
+    kept, so a repeated response comes with its already validated models.
+    """
+
+    def __init__(self, cassettes: Sequence[Cassette], scope: Callable[[], str] = _unscoped) -> None:
+        """
+        Initializes CassetteReplay.
+
+        Args:
+            cassettes: Cassettes to serve from; responses of the same request from several
+                cassettes (e.g. recorded by different xdist workers) are served in this order.
+            scope: Returns where the current request is sent from, as when recording.
+        """
+        self.cassettes = list(cassettes)
+        self.scope = scope
+        self._lock = threading.Lock()
+        self._responses: dict[bytes, list[CachedResponse]] = {}
+        self._served: Counter[bytes] = Counter()
+
+    def handle(self, spec: RequestSpec, headers: dict[str, Any] | None = None) -> CachedResponse:
+        """
+        Serves a request from the cassettes.
+
+        Raises:
+            CassetteMissError: If the request was never recorded.
+        """
+        with self._lock:
+            key = fingerprint(spec, self.scope())
+            responses = self._lookup(key)
+            if not responses:
+                key = fingerprint(spec)
+                responses = self._lookup(key)
+            served = self._served[key]
+            self._served[key] += 1
+        if not responses:
+            msg = f"No recorded response for {spec.method.upper()} {spec.endpoint}"
+            raise CassetteMissError(msg)
+        return responses[min(served, len(responses) - 1)]
+
+    def _lookup(self, key: bytes) -> list[CachedResponse]:
+        """Responses of a fingerprint from all cassettes (decoded once)."""
+        responses = self._responses.get(key)
+        if responses is None:
+            responses = [r for cassette in self.cassettes for r in cassette.responses(key)]
+            self._responses[key] = responses
+        return responses
+
+    def close(self) -> None:
+        """Closes the cassettes."""
+        for cassette in self.cassettes:
+            cassette.close()
+
+
+def cassette_paths(path: Path) -> list[Path]:
+    """
+    Cassette files of a recording.
+
+    Returns:
+        The file itself, or the per-worker files `<stem>.gw*<suffix>` of an xdist run.
+    """
+    if path.exists():
+        return [path]
+    return sorted(path.parent.glob(f"{path.stem}.gw*{path.suffix}"))
+
+
+def worker_cassette_path(path: Path, worker: str | None) -> Path:
+    """Path a worker records to: `<stem>.<worker><suffix>` under xdist, else the path itself."""
+    return path.with_name(f"{path.stem}.{worker}{path.suffix}") if worker else path
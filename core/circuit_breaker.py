@@ -0,0 +1,237 @@
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import StrEnum
+
+from api.endpoints import APIEndpoints
+
+SERVER_ERROR_STATUSES = frozenset(range(500, 600))
+
+
+class CircuitState(StrEnum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of sending a request while the endpoint's circuit is open."""
+
+    def __init__(self, key: str, retry_after: float) -> None:
+        """
+        Initializes the error.
+
+        Args:
+            key: Circuit key (templated endpoint name).
+            retry_after: Seconds until the circuit lets a trial request through.
+        """
+        self.key = key
+        self.retry_after = retry_after
+        super().__init__(
+            f"Circuit for {key} is open, failing fast (next trial in {retry_after:.1f}s)"
+        )
+
+
+@dataclass(frozen=True)
+class BreakerConfig:
+    """
+    Thresholds of a circuit breaker.
+
+    The circuit opens after `consecutive_failures` failures in a row, or when at least
+    `min_calls` of the last `window` calls were made and the share of failures among them
+    reaches `failure_rate`. After `reset_timeout` seconds it lets `half_open_max_calls` trial
+    requests through: a success closes the circuit, a failure opens it again.
+
+    Attributes:
+        consecutive_failures: Failures in a row that open the circuit.
+        failure_rate: Failure share in the window that opens the circuit (0..1).
+        window: Number of most recent calls the failure rate is computed over.
+        min_calls: Minimum number of calls in the window before the rate is checked.
+        reset_timeout: Seconds the circuit stays open before a trial request.
+        half_open_max_calls: Trial requests allowed at the same time in half-open state.
+        failure_statuses: Response statuses counted as failures (transport errors always are).
+    """
+
+    consecutive_failures: int = 3
+    failure_rate: float = 0.5
+    window: int = 20
+    min_calls: int = 10
+    reset_timeout: float = 30.0
+    half_open_max_calls: int = 1
+    failure_statuses: frozenset[int] = SERVER_ERROR_STATUSES
+
+    def __post_init__(self) -> None:
+        """Validates the thresholds."""
+        if self.consecutive_failures < 1 or self.window < 1 or self.half_open_max_calls < 1:
+            msg = "consecutive_failures, window and half_open_max_calls must be at least 1"
+            raise ValueError(msg)
+        if not 0.0 < self.failure_rate <= 1.0:
+            msg = f"failure_rate must be in (0, 1], got {self.failure_rate}"
+            raise ValueError(msg)
+        if self.reset_timeout < 0:
+            msg = f"reset_timeout must not be negative, got {self.reset_timeout}"
+            raise ValueError(msg)
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker for a single key (templated endpoint)."""
+
+    def __init__(
+        self,
+        key: str,
+        config: BreakerConfig,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initializes a closed circuit.
+
+        Args:
+            key: Circuit key, used in logs and errors.
+            config: Thresholds of the circuit.
+            clock: Monotonic clock in seconds (injectable for tests).
+        """
+        self.key = key
+        self.config = config
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._calls: deque[bool] = deque(maxlen=config.window)
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trials_in_flight = 0
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (an expired open circuit is reported as half-open)."""
+        with self._lock:
+            if self._state is CircuitState.OPEN and self._retry_after() <= 0:
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def before_call(self) -> None:
+        """
+        Admits a call or fails fast.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all trials in flight.
+        """
+        with self._lock:
+            if self._state is CircuitState.OPEN:
+                retry_after = self._retry_after()
+                if retry_after > 0:
+                    raise CircuitOpenError(self.key, retry_after)
+                self._state = CircuitState.HALF_OPEN
+                self._trials_in_flight = 0
+                self.logger.info("Circuit for %s is half-open, sending a trial request", self.key)
+            if self._state is CircuitState.HALF_OPEN:
+                if self._trials_in_flight >= self.config.half_open_max_calls:
+                    raise CircuitOpenError(self.key, 0.0)
+                self._trials_in_flight += 1
+
+    def record_status(self, status: int) -> None:
+        """Records a call that returned a response with the given status."""
+        if status in self.config.failure_statuses:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def record_success(self) -> None:
+        """Records a successful call."""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self.logger.info("Circuit for %s is closed again", self.key)
+                self._reset(CircuitState.CLOSED)
+                return
+            self._calls.append(False)
+            self._consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        """Records a failed call (server error status or transport error)."""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._open("trial request failed")
+                return
+            self._calls.append(True)
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self.config.consecutive_failures:
+                self._open(f"{self._consecutive_failures} consecutive failures")
+            elif len(self._calls) >= self.config.min_calls:
+                rate = sum(self._calls) / len(self._calls)
+                if rate >= self.config.failure_rate:
+                    self._open(f"failure rate {rate:.0%} over {len(self._calls)} calls")
+
+    def _open(self, reason: str) -> None:
+        """Opens the circuit (the caller holds the lock)."""
+        self._reset(CircuitState.OPEN)
+        self._opened_at = self._clock()
+        self.logger.warning(
+            "Circuit for %s is open after %s, failing fast for %.1fs",
+            self.key,
+            reason,
+            self.config.reset_timeout,
+        )
+
+    def _reset(self, state: CircuitState) -> None:
+        """Switches to `state` and clears the counters (the caller holds the lock)."""
+        self._state = state
+        self._calls.clear()
+        self._consecutive_failures = 0
+        self._trials_in_flight = 0
+
+    def _retry_after(self) -> float:
+        """Seconds until an open circuit lets a trial request through."""
+        return self._opened_at + self.config.reset_timeout - self._clock()
+
+
+class CircuitBreakerRegistry:
+    """
+    Circuit breakers keyed by templated endpoint, shared by all clients of a session.
+
+    `/api/request/1` and `/api/request/2` share the REQUEST_DETAIL circuit, so a dead
+    backend trips it once instead of timing out on every request id.
+    """
+
+    def __init__(
+        self,
+        config: BreakerConfig | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initializes an empty registry.
+
+        Args:
+            config: Thresholds used for every circuit (defaults to BreakerConfig()).
+            clock: Monotonic clock in seconds (injectable for tests).
+        """
+        self.config = config or BreakerConfig()
+        self._clock = clock
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(endpoint: str) -> str:
+        """Returns the circuit key: the APIEndpoints member name, or the bare path."""
+        member = APIEndpoints.resolve(endpoint)
+        return member.name if member is not None else endpoint.partition("?")[0]
+
+    def for_endpoint(self, endpoint: str) -> CircuitBreaker:
+        """Returns the circuit breaker of the endpoint, creating it on first use."""
+        key = self.key_for(endpoint)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(key, self.config, self._clock)
+                self._breakers[key] = breaker
+            return breaker
+
+    def states(self) -> dict[str, CircuitState]:
+        """Returns the current state of every known circuit."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.key: breaker.state for breaker in breakers}
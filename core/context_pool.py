@@ -0,0 +1,132 @@
+import logging
+import threading
+from collections import defaultdict
+from collections.abc import Generator, Mapping
+from contextlib import contextmanager
+from typing import Any
+
+from playwright.sync_api import APIRequest, APIRequestContext
+
+ContextKey = tuple[str, str | None, tuple[tuple[str, str], ...]]
+
+
+class ContextPool:
+    """
+    Pool of warm APIRequestContexts keyed by (base_url, auth token, extra headers).
+
+    Creating a context and disposing it after every test throws away its connection pool and
+    keep-alive sockets. The pool leases an idle context with the same key instead and takes it
+    back when the test is done, so only the first test of each key pays for the setup.
+
+    Note: a context keeps its cookie storage between leases. The auth token is part of the key,
+    so only requests made as the same user share a context.
+    """
+
+    def __init__(
+        self,
+        request: APIRequest,
+        max_idle_per_key: int = 4,
+        **context_options: Any,  # noqa: ANN401
+    ) -> None:
+        """
+        Initializes an empty pool.
+
+        Args:
+            request: Playwright APIRequest used to create contexts (`playwright.request`).
+            max_idle_per_key: Idle contexts kept per key, extra ones are disposed on release.
+            **context_options: Options passed to every `new_context` call
+                (e.g. `ignore_https_errors=True`).
+        """
+        self._request = request
+        self._max_idle_per_key = max_idle_per_key
+        self._context_options = context_options
+        self._idle: defaultdict[ContextKey, list[APIRequestContext]] = defaultdict(list)
+        self._keys: dict[int, ContextKey] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self.created = 0
+        self.reused = 0
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def make_key(
+        base_url: str, token: str | None = None, headers: Mapping[str, str] | None = None
+    ) -> ContextKey:
+        """Builds the pool key of a context configuration."""
+        return base_url, token, tuple(sorted((headers or {}).items()))
+
+    def acquire(
+        self,
+        base_url: str,
+        token: str | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> APIRequestContext:
+        """
+        Takes an idle context with this configuration or creates a new one.
+
+        Args:
+            base_url: Base URL of the context.
+            token: Optional bearer token, sent as the Authorization header.
+            headers: Optional extra headers sent with every request of the context.
+
+        Returns:
+            APIRequestContext leased to the caller until `release`.
+        """
+        key = self.make_key(base_url, token, headers)
+        with self._lock:
+            if self._idle[key]:
+                self.reused += 1
+                context = self._idle[key].pop()
+                self._keys[id(context)] = key
+                return context
+            self.created += 1
+        extra_headers = dict(headers or {})
+        if token is not None:
+            extra_headers["Authorization"] = f"Bearer {token}"
+        self.logger.info("Creating pooled APIRequestContext for %s", base_url)
+        context = self._request.new_context(
+            base_url=base_url, extra_http_headers=extra_headers, **self._context_options
+        )
+        with self._lock:
+            self._keys[id(context)] = key
+        return context
+
+    def release(self, context: APIRequestContext) -> None:
+        """
+        Returns a leased context to the pool (or disposes it if the pool is full).
+
+        Args:
+            context: Context obtained from `acquire`.
+        """
+        with self._lock:
+            key = self._keys.pop(id(context))
+            if not self._closed and len(self._idle[key]) < self._max_idle_per_key:
+                self._idle[key].append(context)
+                return
+        context.dispose()
+
+    @contextmanager
+    def lease(
+        self,
+        base_url: str,
+        token: str | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> Generator[APIRequestContext]:
+        """Leases a context for the duration of a `with` block (see `acquire`)."""
+        context = self.acquire(base_url, token, headers)
+        try:
+            yield context
+        finally:
+            self.release(context)
+
+    def close(self) -> None:
+        """Disposes all idle contexts, contexts still leased are disposed on release."""
+        with self._lock:
+            self._closed = True
+            contexts = [context for idle in self._idle.values() for context in idle]
+            self._idle.clear()
+        for context in contexts:
+            context.dispose()
+        self.logger.info(
+            "Context pool closed: %s contexts created, %s leases reused", self.created, self.reused
+        )
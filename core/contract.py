@@ -0,0 +1,166 @@
+import re
+import threading
+import types
+from collections import Counter
+
+from pydantic import ValidationError
+
+from core.cached_response import CachedResponse
+from core.interceptors import Interceptor
+from core.request_spec import RequestSpec
+from core.swagger_codegen import load_generated
+
+MAX_ERRORS_PER_VIOLATION = 3
+"""Validation errors quoted per violation, the rest are summarized by count."""
+
+
+class ContractReport:
+    """
+    Thread-safe counters of contract violations, for the end-of-session report.
+
+    Keys are "METHOD /path/{template} STATUS: problem", so the same drift seen by many
+    requests is reported once with its count.
+    """
+
+    def __init__(self) -> None:
+        """Initializes empty counters."""
+        self._violations: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, request: str, problem: str) -> None:
+        """
+        Records one violation.
+
+        Args:
+            request: "METHOD /path/{template} STATUS" of the response.
+            problem: What does not match the spec.
+        """
+        with self._lock:
+            self._violations[f"{request}: {problem}"] += 1
+
+    @property
+    def total(self) -> int:
+        """Total number of violations recorded."""
+        with self._lock:
+            return self._violations.total()
+
+    def merge(self, counts: dict[str, int]) -> None:
+        """Adds counters collected elsewhere (e.g. by an xdist worker)."""
+        with self._lock:
+            self._violations.update(counts)
+
+    def snapshot(self) -> dict[str, int]:
+        """Returns a copy of the counters, most frequent violations first."""
+        with self._lock:
+            return dict(self._violations.most_common())
+
+
+def _describe(error: ValidationError) -> str:
+    """Short description of a validation error: field locations and messages."""
+    errors = error.errors(include_url=False, include_input=False)
+    described = [
+        f"{'.'.join(map(str, item['loc'])) or '<body>'}: {item['msg']}"
+        for item in errors[:MAX_ERRORS_PER_VIOLATION]
+    ]
+    if len(errors) > MAX_ERRORS_PER_VIOLATION:
+        described.append(f"... {len(errors) - MAX_ERRORS_PER_VIOLATION} more")
+    return "; ".join(described)
+
+
+class ContractValidator(Interceptor):
+    """
+    Checks every response against docs/swagger.json and records mismatches in a report.
+
+    The operation is found by method and path template, then the status must be documented
+    for it and the body must match the documented schema (JSON bodies are validated from
+    the raw bytes, text/plain bodies as text). Validators come precompiled from the module
+    generated by core/swagger_codegen.py. The result is memoized on the response, so
+    a response served again by the HTTP cache is not checked twice.
+
+    Violations never fail the request: they are only recorded, to be reported at the end.
+    """
+
+    def __init__(self, report: ContractReport, generated: types.ModuleType | None = None) -> None:
+        """
+        Initializes the validator.
+
+        Args:
+            report: Where violations are recorded.
+            generated: Module generated from the spec (`load_generated()` by default).
+        """
+        self.report = report
+        self._generated = generated or load_generated()
+        self._routes: list[tuple[str, re.Pattern[str], str, str]] = []
+        for operation, (method, template) in self._generated.ENDPOINTS.items():
+            parts = re.split(r"\{\w+\}", template)
+            pattern = re.compile("[^/]+".join(map(re.escape, parts)))
+            self._routes.append((method, pattern, template, operation))
+
+    def resolve(self, method: str, path: str) -> tuple[str, str] | None:
+        """
+        Finds the operation of a request.
+
+        Args:
+            method: HTTP method.
+            path: Request path (the query string is ignored).
+
+        Returns:
+            (operation name, path template), or None if the spec does not describe the request.
+        """
+        method = method.upper()
+        path = path.partition("?")[0]
+        for route_method, pattern, template, operation in self._routes:
+            if route_method == method and pattern.fullmatch(path):
+                return operation, template
+        return None
+
+    def check(self, spec: RequestSpec, response: CachedResponse) -> str | None:
+        """
+        Checks a response against the spec.
+
+        Returns:
+            Description of the mismatch, or None if the response conforms.
+        """
+        resolved = self.resolve(spec.method, spec.endpoint)
+        if resolved is None:
+            return "endpoint is not described in the spec"
+        operation, _ = resolved
+        if response.status not in self._generated.STATUSES[operation]:
+            return "status is not documented"
+        return self._check_body((operation, response.status), response)
+
+    def _check_body(self, key: tuple[str, int], response: CachedResponse) -> str | None:
+        """Validates the body against the schema documented for (operation, status), if any."""
+        validator = self._generated.VALIDATORS.get(key)
+        if validator is None:
+            return None
+        try:
+            if self._generated.MEDIA_TYPES[key] == "application/json":
+                validator.validate_json(response.body())
+            else:
+                validator.validate_python(response.text())
+        except ValidationError as error:
+            return _describe(error)
+        return None
+
+    def on_response(self, spec: RequestSpec, response: CachedResponse) -> CachedResponse:
+        """
+        Checks the response once and records a violation, if any.
+
+        The result is memoized on the response, so a response served again from the HTTP
+        cache is neither re-checked nor counted again.
+        """
+        response.memoized(
+            (ContractValidator, self._generated.SPEC_KEY),
+            lambda: self._check_and_record(spec, response),
+        )
+        return response
+
+    def _check_and_record(self, spec: RequestSpec, response: CachedResponse) -> str | None:
+        """Checks the response and records its violation in the report."""
+        problem = self.check(spec, response)
+        if problem is not None:
+            resolved = self.resolve(spec.method, spec.endpoint)
+            template = resolved[1] if resolved else spec.endpoint.partition("?")[0]
+            self.report.record(f"{spec.method.upper()} {template} {response.status}", problem)
+        return problem
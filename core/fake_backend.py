@@ -0,0 +1,292 @@
+import base64
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from api.endpoints import APIEndpoints
+from core.cached_response import CachedResponse
+from core.fake_response import FakeAPIResponse
+from core.json_codec import codec
+from core.request_spec import RequestSpec
+from core.route_trie import RouteTrie
+
+TOKEN_TTL = 3600
+"""Lifetime of issued tokens in seconds (written to the JWT `exp` claim)."""
+
+FAVOURITE_ADDED_TEXT = "Запрос успешно добавлен в избранное."
+FAVOURITE_REMOVED_TEXT = "Запрос успешно удален из избранного."
+CONTRIBUTION_TEXT = "Вклад успешно внесен."
+
+
+def _error(status: int, error: str, message: str) -> FakeAPIResponse:
+    """Error response in the shape the server uses."""
+    return FakeAPIResponse(status, json_data={"error": error, "message": message})
+
+
+def _b64(data: bytes) -> str:
+    """Unpadded base64url, as in JWT."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+@dataclass(frozen=True)
+class FakeCall:
+    """Request as seen by a FakeCharityBackend handler."""
+
+    spec: RequestSpec
+    params: dict[str, str]
+    """Path parameters bound by the route template."""
+    headers: dict[str, Any]
+    """Request headers merged with the client default headers."""
+
+    def payload(self) -> dict[str, Any]:
+        """
+        JSON object of the request body, or an empty dict if there is none.
+
+        `data`, even empty, takes precedence over `json`, as in RequestSpec.body.
+        """
+        if self.spec.data is None:
+            body = self.spec.json
+        else:
+            try:
+                body = codec.loads(self.spec.data)  # type: ignore[arg-type]
+            except (ValueError, TypeError):
+                body = None
+        return body if isinstance(body, dict) else {}
+
+    def bearer_token(self) -> str | None:
+        """Token of the `Authorization: Bearer` header, if any."""
+        for name, value in self.headers.items():
+            if name.lower() == "authorization" and str(value).startswith("Bearer "):
+                return str(value)[len("Bearer ") :]
+        return None
+
+
+@dataclass
+class _Account:
+    """User record: credentials, profile and favourites in insertion order."""
+
+    password: str
+    profile: dict[str, Any]
+    favourites: dict[str, None] = field(default_factory=dict)
+
+
+Handler = Callable[[FakeCall], CachedResponse]
+
+
+class FakeCharityBackend:
+    """
+    Stateful in-memory implementation of the API, served through MockHTTPClient.
+
+    Implements auth, user, favourites and help request semantics over dict-indexed stores:
+    a favourite added by POST shows up in later GET /api/user/favourites and GET /api/user,
+    a contribution increments `contributorsCount`. Routes are matched by the API endpoint
+    templates through a RouteTrie. Response bodies of help requests are serialized once and
+    reused until the request changes, so the backend costs microseconds per call and whole
+    user journeys run without a server.
+
+    Status codes follow docs/swagger.json: 400 for bad credentials and failed favourite
+    operations, 401 without a valid bearer token, 404 for unknown help requests.
+    """
+
+    def __init__(self, token_ttl: int = TOKEN_TTL) -> None:
+        """
+        Initializes an empty backend.
+
+        Args:
+            token_ttl: Lifetime of issued tokens in seconds.
+        """
+        self.token_ttl = token_ttl
+        self._accounts: dict[str, _Account] = {}
+        self._tokens: dict[str, str] = {}
+        self._requests: dict[str, dict[str, Any]] = {}
+        self._responses: dict[str, FakeAPIResponse] = {}
+        self._token_ids = itertools.count(1)
+        self._lock = threading.RLock()
+        self._routes = RouteTrie()
+        handlers: dict[tuple[str, APIEndpoints], Handler] = {
+            ("POST", APIEndpoints.AUTH): self._login,
+            ("GET", APIEndpoints.USER): self._user_info,
+            ("GET", APIEndpoints.USER_FAVOURITES): self._favourites,
+            ("POST", APIEndpoints.USER_FAVOURITES): self._add_favourite,
+            ("DELETE", APIEndpoints.USER_FAVOURITES_DETAIL): self._remove_favourite,
+            ("GET", APIEndpoints.REQUESTS): self._requests_list,
+            ("GET", APIEndpoints.REQUEST_DETAIL): self._request_details,
+            ("POST", APIEndpoints.REQUEST_CONTRIBUTION): self._contribute,
+        }
+        for (method, endpoint), handler in handlers.items():
+            self._routes.add(method, endpoint.value, handler)
+
+    def add_user(self, login: str, password: str, profile: dict[str, Any]) -> None:
+        """
+        Registers a user.
+
+        Args:
+            login: Login for POST /api/auth.
+            password: Password for POST /api/auth.
+            profile: Body of GET /api/user (camelCase fields); `favouriteRequests` seeds
+                the favourites.
+        """
+        favourites = dict.fromkeys(profile.get("favouriteRequests", ()))
+        with self._lock:
+            self._accounts[login] = _Account(password, dict(profile), favourites)
+
+    def add_request(self, data: dict[str, Any]) -> None:
+        """
+        Registers or replaces a help request.
+
+        Args:
+            data: Body of GET /api/request/{id} (camelCase fields, `id` required).
+        """
+        with self._lock:
+            self._requests[data["id"]] = dict(data)
+            self._invalidate(data["id"])
+
+    def help_request(self, request_id: str) -> dict[str, Any] | None:
+        """
+        Current state of a help request, or None if it does not exist.
+
+        Stored requests are replaced on change, never mutated, so the returned dict and
+        the bodies of responses already served stay as they were.
+        """
+        return self._requests.get(request_id)
+
+    def favourites_of(self, login: str) -> list[str]:
+        """Current favourites of a user, in insertion order."""
+        return list(self._accounts[login].favourites)
+
+    def serves(self, method: str, path: str) -> bool:
+        """True if the backend implements the route of a request."""
+        return self._routes.match(method, path) is not None
+
+    def handle(self, spec: RequestSpec, headers: dict[str, Any] | None = None) -> CachedResponse:
+        """
+        Serves a request.
+
+        Args:
+            spec: The request.
+            headers: Request headers merged with the client default headers
+                (`spec.headers` if not given).
+
+        Returns:
+            The response; 404 if no route matches.
+        """
+        match = self._routes.match(spec.method, spec.endpoint)
+        if match is None:
+            return _error(404, "Not Found", f"Нет маршрута {spec.method.upper()} {spec.endpoint}")
+        call = FakeCall(spec, match.params, headers or spec.headers or {})
+        with self._lock:
+            return match.value(call)
+
+    def _account(self, call: FakeCall) -> _Account | None:
+        """Account of the bearer token of the call."""
+        token = call.bearer_token()
+        login = self._tokens.get(token) if token else None
+        return self._accounts.get(login) if login else None
+
+    def _issue_token(self, login: str) -> str:
+        """Issues an unsigned JWT whose `exp` is honoured by TokenProvider."""
+        claims = {
+            "sub": login,
+            "jti": next(self._token_ids),
+            "exp": int(time.time()) + self.token_ttl,
+        }
+        token = ".".join(
+            (_b64(codec.dumps({"alg": "none", "typ": "JWT"})), _b64(codec.dumps(claims)), "")
+        )
+        self._tokens[token] = login
+        return token
+
+    def _invalidate(self, request_id: str) -> None:
+        """Drops the serialized responses that include a help request."""
+        self._responses.pop(request_id, None)
+        self._responses.pop("", None)
+
+    def _login(self, call: FakeCall) -> CachedResponse:
+        """POST /api/auth."""
+        payload = call.payload()
+        login, password = payload.get("login"), payload.get("password")
+        if not login or not password:
+            return _error(400, "Bad Request", "Требуются login и password")
+        account = self._accounts.get(login)
+        if account is None or account.password != password:
+            return _error(400, "Invalid credentials", "Неверный логин или пароль")
+        return FakeAPIResponse(200, json_data={"auth": True, "token": self._issue_token(login)})
+
+    def _user_info(self, call: FakeCall) -> CachedResponse:
+        """GET /api/user."""
+        account = self._account(call)
+        if account is None:
+            return _error(401, "Unauthorized", "Требуется аутентификация")
+        return FakeAPIResponse(
+            200, json_data={**account.profile, "favouriteRequests": list(account.favourites)}
+        )
+
+    def _favourites(self, call: FakeCall) -> CachedResponse:
+        """GET /api/user/favourites."""
+        account = self._account(call)
+        if account is None:
+            return _error(401, "Unauthorized", "Требуется аутентификация")
+        return FakeAPIResponse(200, json_data=list(account.favourites))
+
+    def _add_favourite(self, call: FakeCall) -> CachedResponse:
+        """
+        POST /api/user/favourites.
+
+        Like the real server, any request id is accepted, and adding an already added
+        one succeeds.
+        """
+        account = self._account(call)
+        if account is None:
+            return _error(401, "Unauthorized", "Требуется аутентификация")
+        request_id = call.payload().get("requestId")
+        if not request_id or not isinstance(request_id, str):
+            return _error(400, "Bad Request", "Требуется requestId")
+        account.favourites[request_id] = None
+        return FakeAPIResponse(200, text_data=FAVOURITE_ADDED_TEXT)
+
+    def _remove_favourite(self, call: FakeCall) -> CachedResponse:
+        """DELETE /api/user/favourites/{requestId}."""
+        account = self._account(call)
+        if account is None:
+            return _error(401, "Unauthorized", "Требуется аутентификация")
+        request_id = call.params["requestId"]
+        if request_id not in account.favourites:
+            return _error(400, "Bad Request", f"Запроса {request_id!r} нет в избранном")
+        del account.favourites[request_id]
+        return FakeAPIResponse(200, text_data=FAVOURITE_REMOVED_TEXT)
+
+    def _requests_list(self, _call: FakeCall) -> CachedResponse:
+        """GET /api/request: the list body is serialized once per change."""
+        response = self._responses.get("")
+        if response is None:
+            response = FakeAPIResponse(
+                200, json_data=list(self._requests.values()), url=APIEndpoints.REQUESTS.value
+            )
+            self._responses[""] = response
+        return response
+
+    def _request_details(self, call: FakeCall) -> CachedResponse:
+        """GET /api/request/{id}: the body is serialized once per change."""
+        request_id = call.params["id"]
+        response = self._responses.get(request_id)
+        if response is None:
+            data = self._requests.get(request_id)
+            if data is None:
+                return _error(404, "Not Found", f"Запрос {request_id!r} не найден")
+            response = FakeAPIResponse(200, json_data=data, url=call.spec.endpoint)
+            self._responses[request_id] = response
+        return response
+
+    def _contribute(self, call: FakeCall) -> CachedResponse:
+        """POST /api/request/{id}/contribution: increments `contributorsCount`."""
+        request_id = call.params["id"]
+        data = self._requests.get(request_id)
+        if data is None:
+            return _error(404, "Not Found", f"Запрос {request_id!r} не найден")
+        count = (data.get("contributorsCount") or 0) + 1
+        self._requests[request_id] = {**data, "contributorsCount": count}
+        self._invalidate(request_id)
+        return FakeAPIResponse(200, text_data=CONTRIBUTION_TEXT)
@@ -0,0 +1,63 @@
+from typing import Any
+
+from core.cached_response import CachedResponse
+from core.json_codec import codec
+
+_JSON_CONTENT_TYPE = "application/json"
+_TEXT_CONTENT_TYPE = "text/plain; charset=utf-8"
+
+
+class FakeAPIResponse(CachedResponse):
+    """
+    Prebuilt response served by MockHTTPClient instead of a `unittest.mock.Mock`.
+
+    The body is serialized once, when the mock is configured; text and JSON are stored
+    up front, so serving the response costs no more than reading slots. Being a
+    CachedResponse, it goes through the same code paths as a real one: validation from
+    the body bytes, memoized models, streaming list parsing, the contract check.
+    """
+
+    __slots__ = ("_ok",)
+
+    def __init__(
+        self,
+        status: int,
+        *,
+        json_data: Any = None,  # noqa: ANN401
+        text_data: str | None = None,
+        ok: bool | None = None,
+        url: str = "",
+    ) -> None:
+        """
+        Initializes FakeAPIResponse.
+
+        Args:
+            status: HTTP status code.
+            json_data: JSON body; takes precedence over `text_data`.
+            text_data: Plain text body.
+            ok: Overrides `ok`, which otherwise follows the status code.
+            url: URL reported by the response.
+        """
+        if json_data is not None:
+            try:
+                body = codec.dumps(json_data)
+            except TypeError:
+                body = str(json_data).encode()
+            content_type = _JSON_CONTENT_TYPE
+        else:
+            body = (text_data or "").encode()
+            content_type = _TEXT_CONTENT_TYPE
+        super().__init__(status=status, url=url, headers={"content-type": content_type}, body=body)
+        if json_data is not None:
+            self._json = json_data
+        self._text = body.decode()
+        self._ok = ok
+
+    @property
+    def ok(self) -> bool:
+        """The `ok` override if given, otherwise True for a 2xx status."""
+        return self._ok if self._ok is not None else 200 <= self.status <= 299
+
+    def __repr__(self) -> str:
+        """Short representation for logs and Allure."""
+        return f"<FakeAPIResponse url={self.url!r} status={self.status!r}>"
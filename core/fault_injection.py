@@ -0,0 +1,224 @@
+import math
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Protocol
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from config.config import TIMEOUT
+from core.cached_response import CachedResponse
+from core.fake_response import FakeAPIResponse
+from core.request_spec import RequestSpec
+from core.route_trie import RouteTrie
+
+PLANNED_SERVER_ERROR = "Planned Server Error"
+"""Body of the injected errors, as sent by the real server (docs/BUG_REPORTS.md, #2)."""
+
+
+class Latency(Protocol):
+    """Distribution of the delay of a response."""
+
+    def sample(self, rng: random.Random) -> float:
+        """Draws a delay in seconds."""
+        ...
+
+
+@dataclass(frozen=True)
+class FixedLatency:
+    """Every response is delayed by the same time."""
+
+    seconds: float
+
+    def sample(self, rng: random.Random) -> float:
+        """Returns the fixed delay."""
+        return self.seconds
+
+
+@dataclass(frozen=True)
+class UniformLatency:
+    """Delay uniformly distributed in [low, high] seconds."""
+
+    low: float
+    high: float
+
+    def sample(self, rng: random.Random) -> float:
+        """Draws a delay in [low, high]."""
+        return rng.uniform(self.low, self.high)
+
+
+@dataclass(frozen=True)
+class LogNormalLatency:
+    """
+    Log-normal delay: most responses close to the median, a heavy tail of slow ones.
+
+    With sigma 1 the 99th percentile is about ten times the median, as in a typical
+    latency histogram of a loaded service.
+
+    Attributes:
+        median: Median delay in seconds.
+        sigma: Standard deviation of the log of the delay (tail weight).
+        cap: Upper bound of a single delay in seconds (no bound if None).
+    """
+
+    median: float
+    sigma: float = 1.0
+    cap: float | None = None
+
+    def sample(self, rng: random.Random) -> float:
+        """Draws a delay from the distribution."""
+        delay = rng.lognormvariate(math.log(self.median), self.sigma) if self.median > 0 else 0.0
+        return delay if self.cap is None else min(delay, self.cap)
+
+
+@dataclass(frozen=True)
+class FaultProfile:
+    """
+    Faults injected into the responses of a route.
+
+    Attributes:
+        latency: Delay of every response (none if not given).
+        error_rate: Share of calls answered with `error_status` instead (0..1).
+        fail_first: Number of first calls that always fail, e.g. to test retries.
+        error_status: Status of the injected errors.
+        error_body: Text body of the injected errors.
+        bytes_per_second: Simulated body transfer rate: adds `len(body) / rate` to the delay
+            (no slow body if None).
+    """
+
+    latency: Latency | None = None
+    error_rate: float = 0.0
+    fail_first: int = 0
+    error_status: int = 500
+    error_body: str = PLANNED_SERVER_ERROR
+    bytes_per_second: float | None = None
+
+    def __post_init__(self) -> None:
+        """Validates the profile parameters."""
+        if not 0 <= self.error_rate <= 1:
+            msg = f"error_rate must be within [0, 1], got {self.error_rate}"
+            raise ValueError(msg)
+        if self.fail_first < 0:
+            msg = f"fail_first must not be negative, got {self.fail_first}"
+            raise ValueError(msg)
+        if self.bytes_per_second is not None and self.bytes_per_second <= 0:
+            msg = f"bytes_per_second must be positive, got {self.bytes_per_second}"
+            raise ValueError(msg)
+
+
+class _RouteState:
+    """Random generator and call counter of one route."""
+
+    __slots__ = ("calls", "rng")
+
+    def __init__(self, seed: str) -> None:
+        """Initializes the state with a generator seeded for the route."""
+        self.rng = random.Random(seed)
+        self.calls = 0
+
+
+class FaultInjector:
+    """
+    Injects latency, errors, slow bodies and timeouts into the responses of MockHTTPClient.
+
+    Profiles are registered per route template (`POST /api/auth`,
+    `GET /api/request/{id}`) and matched through a RouteTrie; a default profile covers
+    the other routes. Faults are applied in the transport, so every attempt of a retried
+    request draws its own fault, and the retry policy and circuit breakers react as to
+    a flaky server.
+
+    Every route has its own generator seeded from `seed` and the route, so the faults of
+    a route depend only on the number of calls to it: the same seed gives the same
+    sequence whatever other routes are called in between. A delay longer than `timeout`
+    raises Playwright's TimeoutError after sleeping `timeout`, like a real request whose
+    response came too late (the response is still produced, the server did the work).
+    """
+
+    def __init__(
+        self,
+        profiles: Mapping[tuple[str, str], FaultProfile] | None = None,
+        *,
+        default: FaultProfile | None = None,
+        seed: int = 0,
+        timeout: float = TIMEOUT / 1000,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initializes FaultInjector.
+
+        Args:
+            profiles: Profiles by (method, path template).
+            default: Profile of the routes without their own (no faults if not given).
+            seed: Seed of the fault sequences.
+            timeout: Request timeout in seconds (the client timeout, API_TIMEOUT, by default).
+            sleep: Waits for the injected delay (pass a recorder to run in virtual time).
+        """
+        self.default = default
+        self.seed = seed
+        self.timeout = timeout
+        self.sleep = sleep
+        self.injected: Counter[str] = Counter()
+        """Injected faults by kind ("error", "timeout") and route, for reports."""
+        self._routes = RouteTrie()
+        self._states: dict[str, _RouteState] = {}
+        self._lock = threading.Lock()
+        for (method, template), profile in (profiles or {}).items():
+            self.add(method, template, profile)
+
+    def add(self, method: str, template: str, profile: FaultProfile) -> None:
+        """Registers the profile of a route, replacing the previous one."""
+        self._routes.add(method, str(template), profile)
+
+    def inject(self, spec: RequestSpec, respond: Callable[[], CachedResponse]) -> CachedResponse:
+        """
+        Serves one attempt of a request with the faults of its route.
+
+        Args:
+            spec: The request.
+            respond: Produces the undisturbed response.
+
+        Returns:
+            The response, or the injected error, after the drawn delay.
+
+        Raises:
+            playwright.sync_api.TimeoutError: If the delay exceeds the timeout.
+        """
+        match = self._routes.match(spec.method, spec.endpoint)
+        profile = self.default if match is None else match.value
+        if profile is None:
+            return respond()
+        route = f"{spec.method.upper()} {'*' if match is None else match.template}"
+        with self._lock:
+            state = self._states.get(route)
+            if state is None:
+                state = self._states[route] = _RouteState(f"{self.seed}:{route}")
+            call = state.calls
+            state.calls += 1
+            delay = profile.latency.sample(state.rng) if profile.latency is not None else 0.0
+            failed = state.rng.random() < profile.error_rate or call < profile.fail_first
+        if failed:
+            response = FakeAPIResponse(
+                profile.error_status, text_data=profile.error_body, url=spec.endpoint
+            )
+        else:
+            response = respond()
+        if profile.bytes_per_second is not None:
+            delay += len(response.body()) / profile.bytes_per_second
+        if delay > self.timeout:
+            self._record("timeout", route)
+            self.sleep(self.timeout)
+            msg = f"Timeout {self.timeout * 1000:.0f}ms exceeded."
+            raise PlaywrightTimeoutError(msg)
+        if failed:
+            self._record("error", route)
+        if delay > 0:
+            self.sleep(delay)
+        return response
+
+    def _record(self, kind: str, route: str) -> None:
+        """Counts an injected fault."""
+        with self._lock:
+            self.injected[f"{kind} {route}"] += 1
@@ -0,0 +1,174 @@
+import dataclasses
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from core.cached_response import CachedResponse
+from core.interceptors import Interceptor
+from core.request_spec import RequestSpec
+
+CONDITIONAL_HEADERS = frozenset({"if-none-match", "if-modified-since"})
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...], tuple[tuple[str, str], ...]]
+
+
+@dataclass
+class _CacheEntry:
+    """Stored GET response with its validators and freshness deadline."""
+
+    response: CachedResponse
+    etag: str | None
+    last_modified: str | None
+    fresh_until: float
+
+
+def _cache_control(headers: dict[str, str]) -> dict[str, str]:
+    """Parses the Cache-Control header into lower-case directives."""
+    directives: dict[str, str] = {}
+    for part in headers.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"')
+    return directives
+
+
+class HTTPCache(Interceptor):
+    """
+    Conditional GET cache for HTTPClient, implemented as an interceptor.
+
+    A 200 GET response carrying an `ETag`, a `Last-Modified` or a `Cache-Control: max-age`
+    is stored. While it is fresh (max-age, minus `Age`), the same GET is answered from the
+    cache without a request. Afterwards the GET is sent with `If-None-Match` /
+    `If-Modified-Since`, and a 304 is answered with the stored response. The stored
+    CachedResponse is returned as is, so its parsed JSON and validated models are reused.
+    `no-store` responses are never stored; `no-cache` ones are always revalidated.
+    Any other method invalidates the entries of its path, its parents and its children
+    (e.g. a contribution invalidates the request details and the request list).
+
+    Register it first in the chain, so that it wraps logging and Allure attachments.
+    One cache must serve a single identity (auth token): stored responses are not keyed
+    by the credentials of the APIRequestContext.
+    """
+
+    def __init__(self, max_entries: int = 256, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_entries: Maximum number of stored responses (least recently used are evicted).
+            clock: Monotonic clock in seconds (injectable for tests).
+        """
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self.logger = logging.getLogger(__name__)
+
+    def on_request(self, spec: RequestSpec) -> RequestSpec | CachedResponse:
+        """Serves fresh entries, adds validators to stale ones, invalidates on writes."""
+        if spec.method.upper() == "GET":
+            return self._lookup(spec)
+        self.invalidate(spec.endpoint)
+        return spec
+
+    def on_response(self, spec: RequestSpec, response: CachedResponse) -> CachedResponse:
+        """Answers 304 from the cache and stores cacheable 200 responses."""
+        if spec.method.upper() != "GET":
+            return response
+        key = self._key(spec)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and response is entry.response:
+                return response
+            if response.status == 304 and entry is not None:
+                self.revalidations += 1
+                entry.fresh_until = self._fresh_until(response.headers)
+                self.logger.debug("HTTP cache revalidated %s (304)", spec.endpoint)
+                response = entry.response
+            elif response.status == 200:
+                self._store(key, response)
+        return response
+
+    def invalidate(self, endpoint: str) -> None:
+        """Drops the entries of the endpoint path, its parent paths and its child paths."""
+        path = endpoint.partition("?")[0].rstrip("/")
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if key[0] == path or path.startswith(f"{key[0]}/") or key[0].startswith(f"{path}/")
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drops all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, spec: RequestSpec) -> RequestSpec | CachedResponse:
+        """Returns the fresh stored response, or the spec with validators if there is one."""
+        key = self._key(spec)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return spec
+            self._entries.move_to_end(key)
+            if self._clock() < entry.fresh_until:
+                self.hits += 1
+                self.logger.debug("HTTP cache hit for %s", spec.endpoint)
+                return entry.response
+        validators: dict[str, Any] = {}
+        if entry.etag is not None:
+            validators["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            validators["If-Modified-Since"] = entry.last_modified
+        return dataclasses.replace(spec, headers={**validators, **(spec.headers or {})})
+
+    def _store(self, key: CacheKey, response: CachedResponse) -> None:
+        """Stores a 200 response if its headers allow it (the caller holds the lock)."""
+        directives = _cache_control(response.headers)
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        fresh_until = self._fresh_until(response.headers)
+        if "no-store" in directives:
+            return
+        if etag is None and last_modified is None and fresh_until <= self._clock():
+            return
+        self._entries[key] = _CacheEntry(response, etag, last_modified, fresh_until)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _fresh_until(self, headers: dict[str, str]) -> float:
+        """Freshness deadline from Cache-Control max-age and Age (now if not cacheable)."""
+        now = self._clock()
+        directives = _cache_control(headers)
+        if "no-cache" in directives or "max-age" not in directives:
+            return now
+        try:
+            max_age = int(directives["max-age"]) - int(headers.get("age", "0"))
+        except ValueError:
+            return now
+        return now + max(max_age, 0)
+
+    @staticmethod
+    def _key(spec: RequestSpec) -> CacheKey:
+        """Cache key: path, query parameters and request headers (validators excluded)."""
+        params = tuple(sorted((str(k), str(v)) for k, v in (spec.params or {}).items()))
+        headers = tuple(
+            sorted(
+                (name.lower(), str(value))
+                for name, value in (spec.headers or {}).items()
+                if name.lower() not in CONDITIONAL_HEADERS
+            )
+        )
+        return spec.endpoint.partition("?")[0].rstrip("/"), params, headers
@@ -1,10 +1,17 @@
+import asyncio
 import logging
+import time
+from collections.abc import Sequence
 from typing import Any
 
 from playwright.sync_api import APIRequestContext, APIResponse
 
-from config.config import TIMEOUT
-from utils.allure_utils import AllureUtils
+from config.config import BATCH_MAX_CONCURRENCY, TIMEOUT
+from core.cached_response import CachedResponse
+from core.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from core.interceptors import Interceptor, InterceptorChain, default_interceptors
+from core.request_spec import BatchResult, RequestSpec
+from core.retry import RetryPolicy, RetryStats
 
 
 class HTTPClient:
@@ -12,16 +19,43 @@ class HTTPClient:
     Low-level HTTP client.
 
     Uses the Playwright APIRequestContext to make requests to the API.
+    Every verb goes through `_request`: the interceptor chain (logging and Allure attachments
+    by default, see core.interceptors) wraps the transport, which applies the retry policy
+    and the circuit breakers. Transient failures cost one extra request instead of a full
+    test rerun; requests to an endpoint that keeps failing raise CircuitOpenError without
+    being sent.
     """
 
-    def __init__(self, api_context: APIRequestContext) -> None:
+    def __init__(
+        self,
+        api_context: APIRequestContext,
+        retry_policy: RetryPolicy | None = None,
+        retry_stats: RetryStats | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+        default_headers: dict[str, str] | None = None,
+        interceptors: Sequence[Interceptor] | None = None,
+    ) -> None:
         """
         Initializes HTTPClient with the provided APIRequestContext Playwright.
 
         Args:
             api_context: The APIRequestContext instance configured with the base URL, etc.
+            retry_policy: Retry policy for all requests (no retries if not given).
+            retry_stats: Counters to record retries in (e.g. shared for the whole session).
+            circuit_breakers: Per-endpoint circuit breakers (no fast-fail if not given).
+            default_headers: Headers injected into every request (request headers win). Lets
+                several clients, e.g. with different auth tokens, share one warm context.
+            interceptors: Interceptor chain (logging and Allure by default). Pass an empty
+                list to run the bare transport.
         """
         self.api_request_context: APIRequestContext = api_context
+        self.retry_policy = retry_policy or RetryPolicy.disabled()
+        self.retry_stats = retry_stats or RetryStats()
+        self.circuit_breakers = circuit_breakers
+        self.default_headers = default_headers or {}
+        self.interceptors = InterceptorChain(
+            default_interceptors() if interceptors is None else interceptors
+        )
         self.logger = logging.getLogger(__name__)
 
     def get(
@@ -29,7 +63,9 @@ class HTTPClient:
         endpoint: str,
         headers: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
-    ) -> APIResponse:
+        *,
+        idempotent: bool | None = None,
+    ) -> CachedResponse:
         """
         Sends a GET request to the specified endpoint.
 
@@ -37,17 +73,13 @@ class HTTPClient:
             endpoint: Relative path to the endpoint (relative to the base_url of the context).
             headers: Optional dictionary of request headers.
             params: Optional dictionary of URL request parameters.
+            idempotent: Overrides the retry policy idempotency check for this call.
 
         Returns:
-            APIResponse object by Playwright.
+            CachedResponse with the response body read once from the driver.
         """
-        self.logger.info("Sending GET request to %s with params: %s", endpoint, params)
-        response: APIResponse = self.api_request_context.get(
-            endpoint, headers=headers, params=params, timeout=TIMEOUT
-        )
-        self.logger.info("Received response %s from %s", response.status, response.url)
-        AllureUtils.attach_response(response)
-        return response
+        spec = RequestSpec("GET", endpoint, headers=headers, params=params, idempotent=idempotent)
+        return self._request(spec)
 
     def post(
         self,
@@ -55,7 +87,9 @@ class HTTPClient:
         headers: dict[str, Any] | None = None,
         data: dict[str, Any] | str | bytes | None = None,
         json: Any | None = None,  # noqa: ANN401
-    ) -> APIResponse:
+        *,
+        idempotent: bool | None = None,
+    ) -> CachedResponse:
         """
         Sends a POST request to the specified endpoint.
 
@@ -66,20 +100,15 @@ class HTTPClient:
             headers: Optional dictionary of request headers.
             data: Optional data to be sent (e.g. form data).
             json: Optional data to send in JSON format.
+            idempotent: Overrides the retry policy idempotency check for this call.
 
         Returns:
-            APIResponse object by Playwright.
+            CachedResponse with the response body read once from the driver.
         """
-        self.logger.info("Sending POST request to %s", endpoint)
-        response: APIResponse = self.api_request_context.post(
-            endpoint,
-            headers=headers,
-            data=data or json,
-            timeout=TIMEOUT,
+        spec = RequestSpec(
+            "POST", endpoint, headers=headers, data=data, json=json, idempotent=idempotent
         )
-        self.logger.info("Received response %s from %s", response.status, response.url)
-        AllureUtils.attach_response(response)
-        return response
+        return self._request(spec)
 
     def put(
         self,
@@ -87,7 +116,9 @@ class HTTPClient:
         headers: dict[str, Any] | None = None,
         data: dict[str, Any] | str | bytes | None = None,
         json: Any | None = None,  # noqa: ANN401
-    ) -> APIResponse:
+        *,
+        idempotent: bool | None = None,
+    ) -> CachedResponse:
         """
         Sends a PUT request to the specified endpoint.
 
@@ -96,27 +127,24 @@ class HTTPClient:
             headers: Optional dictionary of request headers.
             data: Optional data to be sent (e.g. form data).
             json: Optional data to send in JSON format.
+            idempotent: Overrides the retry policy idempotency check for this call.
 
         Returns:
-            APIResponse object by Playwright.
+            CachedResponse with the response body read once from the driver.
         """
-        self.logger.info("Sending PUT request to %s", endpoint)
-        response: APIResponse = self.api_request_context.put(
-            endpoint,
-            headers=headers,
-            data=data or json,
-            timeout=TIMEOUT,
+        spec = RequestSpec(
+            "PUT", endpoint, headers=headers, data=data, json=json, idempotent=idempotent
         )
-        self.logger.info("Received response %s from %s", response.status, response.url)
-        AllureUtils.attach_response(response)
-        return response
+        return self._request(spec)
 
     def delete(
         self,
         endpoint: str,
         headers: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
-    ) -> APIResponse:
+        *,
+        idempotent: bool | None = None,
+    ) -> CachedResponse:
         """
         Sends a DELETE request to the specified endpoint.
 
@@ -124,17 +152,15 @@ class HTTPClient:
             endpoint: Relative path to the endpoint.
             headers: Optional query header dictionary.
             params: Optional dictionary of URL request parameters.
+            idempotent: Overrides the retry policy idempotency check for this call.
 
         Returns:
-            APIResponse object by Playwright.
+            CachedResponse with the response body read once from the driver.
         """
-        self.logger.info("Sending DELETE request to %s", endpoint)
-        response: APIResponse = self.api_request_context.delete(
-            endpoint, headers=headers, params=params, timeout=TIMEOUT
+        spec = RequestSpec(
+            "DELETE", endpoint, headers=headers, params=params, idempotent=idempotent
         )
-        self.logger.info("Received response %s from %s", response.status, response.url)
-        AllureUtils.attach_response(response)
-        return response
+        return self._request(spec)
 
     def patch(
         self,
@@ -142,7 +168,9 @@ class HTTPClient:
         headers: dict[str, Any] | None = None,
         data: dict[str, Any] | str | bytes | None = None,
         json: Any | None = None,  # noqa: ANN401
-    ) -> APIResponse:
+        *,
+        idempotent: bool | None = None,
+    ) -> CachedResponse:
         """
         Sends a PATCH request to the specified endpoint.
 
@@ -151,14 +179,360 @@ class HTTPClient:
             headers: Optional query header dictionary.
             data: Optional data to send (e.g. form data).
             json: Optional data to send in JSON format.
+            idempotent: Overrides the retry policy idempotency check for this call.
+
+        Returns:
+            CachedResponse with the response body read once from the driver.
+        """
+        spec = RequestSpec(
+            "PATCH", endpoint, headers=headers, data=data, json=json, idempotent=idempotent
+        )
+        return self._request(spec)
+
+    def send(self, spec: RequestSpec) -> CachedResponse:
+        """
+        Sends the request described by a RequestSpec through the matching verb method.
+
+        Args:
+            spec: Request description (method, endpoint, headers, params, body).
+
+        Returns:
+            CachedResponse with the response body read once from the driver.
+
+        Raises:
+            ValueError: If the spec method is not supported.
+        """
+        method = spec.method.upper()
+        if method in {"GET", "DELETE"}:
+            verb = self.get if method == "GET" else self.delete
+            return verb(
+                spec.endpoint,
+                headers=spec.headers,
+                params=spec.params,
+                idempotent=spec.idempotent,
+            )
+        if method in {"POST", "PUT", "PATCH"}:
+            verb = {"POST": self.post, "PUT": self.put, "PATCH": self.patch}[method]
+            return verb(
+                spec.endpoint,
+                headers=spec.headers,
+                data=spec.data,
+                json=spec.json,
+                idempotent=spec.idempotent,
+            )
+        msg = f"Unsupported HTTP method in request spec: {spec.method}"
+        raise ValueError(msg)
+
+    def execute_many(
+        self,
+        specs: Sequence[RequestSpec],
+        max_concurrency: int = BATCH_MAX_CONCURRENCY,
+    ) -> list[BatchResult]:
+        """
+        Executes a batch of requests concurrently, at most `max_concurrency` at a time.
+
+        Errors are captured per spec in BatchResult.error instead of being raised.
+
+        Args:
+            specs: Requests to execute.
+            max_concurrency: Maximum number of requests in flight at the same time.
 
         Returns:
-            APIResponse object by Playwright.
+            One BatchResult per spec, in the same order as `specs`.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
         """
-        self.logger.info("Sending PATCH request to %s", endpoint)
-        response: APIResponse = self.api_request_context.patch(
-            endpoint, headers=headers, data=data or json, timeout=TIMEOUT
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(msg)
+        self.logger.info(
+            "Executing batch of %s requests (max_concurrency=%s)", len(specs), max_concurrency
         )
-        self.logger.info("Received response %s from %s", response.status, response.url)
-        AllureUtils.attach_response(response)
+        outcomes = self._send_many(specs, max_concurrency)
+        results = [
+            BatchResult(spec=spec, error=outcome)
+            if isinstance(outcome, Exception)
+            else BatchResult(spec=spec, response=outcome)
+            for spec, outcome in zip(specs, outcomes, strict=True)
+        ]
+        failed = sum(result.failed for result in results)
+        self.logger.info("Batch finished: %s succeeded, %s failed", len(results) - failed, failed)
+        return results
+
+    @property
+    def supports_concurrent_batches(self) -> bool:
+        """
+        True if execute_many can overlap the requests on the Playwright event loop.
+
+        The batch bridge relies on private attributes of the sync API (`_impl_obj` and
+        `_sync`), checked against the Playwright versions pyproject.toml allows. If a
+        release drops them, batches run sequentially instead of failing at runtime.
+        """
+        context = self.api_request_context
+        impl = getattr(context, "_impl_obj", None)
+        return callable(getattr(impl, "fetch", None)) and callable(getattr(context, "_sync", None))
+
+    def _request(self, spec: RequestSpec) -> CachedResponse:
+        """
+        Sends the request through the interceptor chain and the retrying transport.
+
+        Args:
+            spec: Request description.
+
+        Returns:
+            CachedResponse returned by the transport or by an interceptor.
+        """
+        if not self.interceptors:
+            return self._send_with_retry(spec)
+        prepared = self.interceptors.before(spec)
+        if not isinstance(prepared, RequestSpec):
+            return self.interceptors.after(spec, prepared)
+        try:
+            response = self._send_with_retry(prepared)
+        except Exception as e:  # noqa: BLE001
+            response = self.interceptors.recover(prepared, e)
+        return self.interceptors.after(prepared, response)
+
+    def _send_with_retry(self, spec: RequestSpec) -> CachedResponse:
+        """
+        Sends the request, retrying it according to the retry policy.
+
+        Intermediate failed responses are only logged, the last one is returned.
+
+        Args:
+            spec: Request description.
+
+        Returns:
+            CachedResponse of the last attempt, with `attempts` set.
+
+        Raises:
+            Exception: The transport error of the last attempt, if it is not retried.
+        """
+        retryable = self.retry_policy.allows(spec.method, spec.idempotent)
+        attempt = 1
+        while True:
+            try:
+                response = self._send_once(spec)
+            except Exception as e:
+                reason = self._retry_reason(retryable, attempt, error=e)
+                if reason is None:
+                    raise
+            else:
+                reason = self._retry_reason(retryable, attempt, status=response.status)
+                if reason is None:
+                    break
+            time.sleep(self._before_retry(spec, attempt, reason))
+            attempt += 1
+        response.attempts = attempt
         return response
+
+    def _send_once(self, spec: RequestSpec) -> CachedResponse:
+        """
+        Performs a single attempt of the request, guarded by the endpoint circuit breaker.
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open (nothing is sent).
+        """
+        breaker = self._breaker_for(spec)
+        if breaker is not None:
+            breaker.before_call()
+        try:
+            response = self._transport(spec)
+        except Exception:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        if breaker is not None:
+            breaker.record_status(response.status)
+        return response
+
+    def _transport(self, spec: RequestSpec) -> CachedResponse:
+        """Sends the request over the APIRequestContext and reads the response once."""
+        raw_response = self.api_request_context.fetch(
+            spec.endpoint,
+            method=spec.method.upper(),
+            headers=self._headers_for(spec),
+            params=spec.params,
+            data=spec.body,
+            timeout=TIMEOUT,
+        )
+        return CachedResponse.from_response(raw_response)
+
+    def _headers_for(self, spec: RequestSpec) -> dict[str, Any] | None:
+        """Merges the client default headers with the spec headers."""
+        return spec.headers_with(self.default_headers)
+
+    def _breaker_for(self, spec: RequestSpec) -> CircuitBreaker | None:
+        """Returns the circuit breaker guarding the spec endpoint, if breakers are enabled."""
+        if self.circuit_breakers is None:
+            return None
+        return self.circuit_breakers.for_endpoint(spec.endpoint)
+
+    def _retry_reason(
+        self,
+        retryable: bool,
+        attempt: int,
+        status: int | None = None,
+        error: Exception | None = None,
+    ) -> str | None:
+        """
+        Decides whether a failed attempt is retried.
+
+        Args:
+            retryable: Whether the request may be retried at all (method idempotency).
+            attempt: Number of the attempt that has just finished (1-based).
+            status: Response status of the attempt, if a response was received.
+            error: Transport error of the attempt, if it raised.
+
+        Returns:
+            Human-readable reason for the retry, or None if the outcome is final.
+        """
+        reason = None
+        if retryable and attempt < self.retry_policy.max_attempts:
+            if error is not None and self.retry_policy.is_retryable_error(error):
+                message = str(error).partition("\n")[0]
+                reason = f"{type(error).__name__}: {message}"
+            elif status is not None and self.retry_policy.is_retryable_status(status):
+                reason = f"status {status}"
+        return reason
+
+    def _before_retry(self, spec: RequestSpec, attempt: int, reason: str) -> float:
+        """Records and logs a retry, returns the backoff delay in seconds."""
+        delay = self.retry_policy.backoff(attempt)
+        self.retry_stats.record(spec.method, spec.endpoint)
+        self.logger.warning(
+            "Retrying %s %s after %s (attempt %s/%s) in %.2fs",
+            spec.method.upper(),
+            spec.endpoint,
+            reason,
+            attempt + 1,
+            self.retry_policy.max_attempts,
+            delay,
+        )
+        return delay
+
+    def _send_many(
+        self, specs: Sequence[RequestSpec], max_concurrency: int
+    ) -> list[CachedResponse | Exception]:
+        """
+        Sends the batch through the interceptor chain, the transport runs concurrently.
+
+        Requests short-circuited by an interceptor are not sent; errors not recovered by an
+        interceptor are returned in place of the response.
+        """
+        if not self.interceptors:
+            return self._dispatch_many(specs, max_concurrency)
+        prepared = [self.interceptors.before(spec) for spec in specs]
+        to_send = [spec for spec in prepared if isinstance(spec, RequestSpec)]
+        sent = iter(self._dispatch_many(to_send, max_concurrency))
+        outcomes: list[CachedResponse | Exception] = []
+        for spec, item in zip(specs, prepared, strict=True):
+            if not isinstance(item, RequestSpec):
+                outcomes.append(self.interceptors.after(spec, item))
+                continue
+            outcome = next(sent)
+            try:
+                if isinstance(outcome, Exception):
+                    outcome = self.interceptors.recover(item, outcome)
+                outcomes.append(self.interceptors.after(item, outcome))
+            except Exception as e:  # noqa: BLE001
+                outcomes.append(e)
+        return outcomes
+
+    def _dispatch_many(
+        self, specs: Sequence[RequestSpec], max_concurrency: int
+    ) -> list[CachedResponse | Exception]:
+        """
+        Sends the specs concurrently over the shared APIRequestContext.
+
+        The sync Playwright API runs every call to completion on its own event loop, so
+        requests can only overlap if the underlying async calls are scheduled on that loop
+        together. This is the same bridge the sync API uses for every single call.
+        Retries follow the same policy as `_send_with_retry`, the backoff sleeps on the loop.
+        Without the bridge (see `supports_concurrent_batches`) the specs are sent one by one.
+        """
+        if not specs:
+            return []
+        if not self.supports_concurrent_batches:
+            self.logger.warning(
+                "APIRequestContext has no async bridge, running the batch of %s sequentially",
+                len(specs),
+            )
+            return [self._send_capturing(spec) for spec in specs]
+        context_impl: Any = self.api_request_context._impl_obj  # noqa: SLF001
+
+        async def fetch(spec: RequestSpec, semaphore: asyncio.Semaphore) -> tuple[Any, int]:
+            async with semaphore:
+                return await self._fetch_with_retry(context_impl, spec)
+
+        async def fetch_all() -> list[tuple[Any, int]]:
+            semaphore = asyncio.Semaphore(max_concurrency)
+            return await asyncio.gather(*(fetch(spec, semaphore) for spec in specs))
+
+        outcomes: list[CachedResponse | Exception] = []
+        for outcome, attempts in self.api_request_context._sync(fetch_all()):  # noqa: SLF001
+            if isinstance(outcome, Exception):
+                outcomes.append(outcome)
+                continue
+            response = CachedResponse.from_response(APIResponse(outcome))
+            response.attempts = attempts
+            outcomes.append(response)
+        return outcomes
+
+    def _send_capturing(self, spec: RequestSpec) -> CachedResponse | Exception:
+        """Sends the request with retries, returning the error instead of raising it."""
+        try:
+            return self._send_with_retry(spec)
+        except Exception as e:  # noqa: BLE001
+            return e
+
+    async def _fetch_with_retry(
+        self,
+        context_impl: Any,  # noqa: ANN401
+        spec: RequestSpec,
+    ) -> tuple[Any, int]:
+        """
+        Async counterpart of `_send_with_retry` for the batch bridge.
+
+        Returns:
+            The impl-level response or the captured exception, and the number of attempts.
+        """
+        retryable = self.retry_policy.allows(spec.method, spec.idempotent)
+        attempt = 1
+        while True:
+            try:
+                outcome = await self._fetch_once(context_impl, spec)
+            except Exception as e:  # noqa: BLE001
+                outcome = e
+                reason = self._retry_reason(retryable, attempt, error=e)
+            else:
+                reason = self._retry_reason(retryable, attempt, status=outcome.status)
+            if reason is None:
+                return outcome, attempt
+            if not isinstance(outcome, Exception):
+                await outcome.dispose()
+            await asyncio.sleep(self._before_retry(spec, attempt, reason))
+            attempt += 1
+
+    async def _fetch_once(self, context_impl: Any, spec: RequestSpec) -> Any:  # noqa: ANN401
+        """Async counterpart of `_send_once`, returns the impl-level response."""
+        breaker = self._breaker_for(spec)
+        if breaker is not None:
+            breaker.before_call()
+        try:
+            raw_response = await context_impl.fetch(
+                spec.endpoint,
+                method=spec.method.upper(),
+                headers=self._headers_for(spec),
+                params=spec.params,
+                data=spec.body,
+                timeout=TIMEOUT,
+            )
+        except Exception:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        if breaker is not None:
+            breaker.record_status(raw_response.status)
+        return raw_response
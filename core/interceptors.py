@@ -0,0 +1,173 @@
+import logging
+from collections.abc import Iterable, Iterator
+
+from core.cached_response import CachedResponse
+from core.request_spec import RequestSpec
+from utils.allure_utils import AllureUtils
+
+
+class Interceptor:
+    """
+    Base class of HTTPClient interceptors; every hook is a no-op by default.
+
+    Request hooks run in registration order before the request is sent, response and error
+    hooks run in reverse order after it (the first interceptor wraps all the others).
+    Retries happen inside the transport, so the hooks see one logical request.
+    """
+
+    def on_request(self, spec: RequestSpec) -> RequestSpec | CachedResponse:
+        """
+        Called before the request is sent.
+
+        Args:
+            spec: Request about to be sent.
+
+        Returns:
+            The spec to send (possibly modified), or a response to short-circuit the transport
+            and the remaining request hooks (e.g. a cache hit).
+        """
+        return spec
+
+    def on_response(self, spec: RequestSpec, response: CachedResponse) -> CachedResponse:
+        """
+        Called with the response of the request (also for short-circuited responses).
+
+        Returns:
+            The response passed on to the next hook and finally to the caller.
+        """
+        return response
+
+    def on_error(self, spec: RequestSpec, error: Exception) -> CachedResponse | None:
+        """
+        Called when the transport raised.
+
+        Returns:
+            A response to recover with, or None to let the error propagate.
+        """
+        return None
+
+
+class LoggingInterceptor(Interceptor):
+    """Logs every request, response and transport error."""
+
+    def __init__(self, logger: logging.Logger | None = None) -> None:
+        """
+        Initializes the interceptor.
+
+        Args:
+            logger: Logger to write to (the HTTP client logger by default).
+        """
+        self.logger = logger or logging.getLogger("core.http_client")
+
+    def on_request(self, spec: RequestSpec) -> RequestSpec:
+        """Logs the outgoing request."""
+        if spec.params:
+            self.logger.info(
+                "Sending %s request to %s with params: %s",
+                spec.method.upper(),
+                spec.endpoint,
+                spec.params,
+            )
+        else:
+            self.logger.info("Sending %s request to %s", spec.method.upper(), spec.endpoint)
+        return spec
+
+    def on_response(self, spec: RequestSpec, response: CachedResponse) -> CachedResponse:
+        """Logs the received response."""
+        self.logger.info("Received response %s from %s", response.status, response.url)
+        return response
+
+    def on_error(self, spec: RequestSpec, error: Exception) -> None:
+        """Logs the transport error."""
+        self.logger.warning(
+            "%s request to %s failed: %s", spec.method.upper(), spec.endpoint, error
+        )
+
+
+class AllureInterceptor(Interceptor):
+    """Attaches every response (and its retry count) to the Allure report."""
+
+    def on_response(self, spec: RequestSpec, response: CachedResponse) -> CachedResponse:
+        """Attaches the response according to the active attachment policy."""
+        AllureUtils.attach_response(response)
+        if response.attempts > 1:
+            AllureUtils.attach(
+                f"{spec.method.upper()} {spec.endpoint}: {response.attempts} attempts",
+                name=f"Retries: {response.attempts - 1}",
+            )
+        return response
+
+
+def default_interceptors() -> list[Interceptor]:
+    """Interceptors used when HTTPClient is created without an explicit list."""
+    return [LoggingInterceptor(), AllureInterceptor()]
+
+
+class InterceptorChain:
+    """Ordered list of interceptors with the hook-running logic shared by the clients."""
+
+    def __init__(self, interceptors: Iterable[Interceptor] = ()) -> None:
+        """
+        Initializes the chain.
+
+        Args:
+            interceptors: Interceptors in registration order.
+        """
+        self._interceptors: list[Interceptor] = list(interceptors)
+
+    def __bool__(self) -> bool:
+        """False for an empty chain (the clients then skip the hooks entirely)."""
+        return bool(self._interceptors)
+
+    def __iter__(self) -> Iterator[Interceptor]:
+        """Iterates over the interceptors in registration order."""
+        return iter(self._interceptors)
+
+    def __len__(self) -> int:
+        """Number of registered interceptors."""
+        return len(self._interceptors)
+
+    def add(self, interceptor: Interceptor, index: int | None = None) -> None:
+        """
+        Registers an interceptor.
+
+        Args:
+            interceptor: Interceptor to add.
+            index: Position in the chain (appended to the end by default).
+        """
+        if index is None:
+            self._interceptors.append(interceptor)
+        else:
+            self._interceptors.insert(index, interceptor)
+
+    def remove(self, interceptor: Interceptor) -> None:
+        """Unregisters an interceptor."""
+        self._interceptors.remove(interceptor)
+
+    def before(self, spec: RequestSpec) -> RequestSpec | CachedResponse:
+        """Runs the request hooks, stops at the first one returning a response."""
+        for interceptor in self._interceptors:
+            result = interceptor.on_request(spec)
+            if not isinstance(result, RequestSpec):
+                return result
+            spec = result
+        return spec
+
+    def after(self, spec: RequestSpec, response: CachedResponse) -> CachedResponse:
+        """Runs the response hooks in reverse order."""
+        for interceptor in reversed(self._interceptors):
+            response = interceptor.on_response(spec, response)
+        return response
+
+    def recover(self, spec: RequestSpec, error: Exception) -> CachedResponse:
+        """
+        Runs the error hooks in reverse order until one of them recovers.
+
+        Raises:
+            Exception: The original error if no hook returned a response.
+        """
+        for interceptor in reversed(self._interceptors):
+            response = interceptor.on_error(spec, error)
+            if response is not None:
+                return response
+        raise error
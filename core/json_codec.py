@@ -0,0 +1,125 @@
+import importlib.util
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic_core import PydanticSerializationError, from_json, to_json
+
+from config.config import JSON_CODEC
+
+
+@dataclass(frozen=True)
+class JSONCodec:
+    """
+    JSON encoder / decoder used by the whole client stack.
+
+    Every backend raises the stdlib exceptions: `loads` raises json.JSONDecodeError on
+    malformed input and `dumps` raises TypeError for a value the backend cannot encode, so
+    callers keep catching the same exceptions whatever backend is active.
+
+    Output is the same for every backend only for plain JSON values: dicts with string
+    keys, lists, tuples, str, int, float, bool and None. Other values depend on the
+    backend. The stdlib rejects all of them. orjson encodes datetime, UUID, Enum and
+    dataclasses, and rejects non-string dict keys. pydantic-core additionally encodes
+    Decimal, bytes and sets. Convert such values before encoding (e.g. `model_dump(mode="json")`).
+    """
+
+    name: str
+    """Backend name: "orjson", "pydantic" or "stdlib"."""
+    loads: Callable[[bytes | str], Any]
+    """Parses a JSON document."""
+    dumps: Callable[[Any], bytes]
+    """
+    Encodes a value as compact UTF-8 JSON (non-ASCII characters are not escaped).
+
+    Raises TypeError for a value the backend cannot encode (see the class docstring for
+    which values are portable).
+    """
+    dumps_pretty: Callable[[Any], str]
+    """Encodes a value as JSON text indented by 2 spaces, for reports and logs."""
+
+
+def _stdlib_codec() -> JSONCodec:
+    """Codec on the `json` module: always available, the slowest."""
+    return JSONCodec(
+        name="stdlib",
+        loads=json.loads,
+        dumps=lambda value: json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode(),
+        dumps_pretty=lambda value: json.dumps(value, ensure_ascii=False, indent=2),
+    )
+
+
+def _pydantic_loads(data: bytes | str) -> Any:  # noqa: ANN401
+    """`pydantic_core.from_json` raising json.JSONDecodeError like the stdlib."""
+    try:
+        return from_json(data)
+    except ValueError as e:
+        document = data if isinstance(data, str) else data.decode("utf-8", errors="replace")
+        raise json.JSONDecodeError(str(e), document, 0) from e
+
+
+def _pydantic_dumps(value: Any, indent: int | None = None) -> bytes:  # noqa: ANN401
+    """`pydantic_core.to_json` raising TypeError like the stdlib (it encodes more types)."""
+    try:
+        return to_json(value, indent=indent)
+    except PydanticSerializationError as e:
+        raise TypeError(str(e)) from e
+
+
+def _pydantic_codec() -> JSONCodec:
+    """Codec on pydantic-core (Rust): always installed together with pydantic."""
+    return JSONCodec(
+        name="pydantic",
+        loads=_pydantic_loads,
+        dumps=_pydantic_dumps,
+        dumps_pretty=lambda value: _pydantic_dumps(value, indent=2).decode(),
+    )
+
+
+def _orjson_codec() -> JSONCodec:
+    """Codec on orjson, the fastest; only if the optional package is installed."""
+    import orjson  # noqa: PLC0415
+
+    return JSONCodec(
+        name="orjson",
+        loads=orjson.loads,
+        dumps=orjson.dumps,
+        dumps_pretty=lambda value: orjson.dumps(value, option=orjson.OPT_INDENT_2).decode(),
+    )
+
+
+CODECS: dict[str, Callable[[], JSONCodec]] = {
+    "orjson": _orjson_codec,
+    "pydantic": _pydantic_codec,
+    "stdlib": _stdlib_codec,
+}
+"""Codec factories by backend name, fastest first."""
+
+
+def available_codecs() -> list[str]:
+    """Names of the backends that can be used in this environment, fastest first."""
+    return [name for name in CODECS if name != "orjson" or importlib.util.find_spec("orjson")]
+
+
+def select_codec(name: str = "auto") -> JSONCodec:
+    """
+    Creates the codec of a backend.
+
+    Args:
+        name: Backend name, or "auto" for the fastest available one.
+
+    Raises:
+        ValueError: If the backend is unknown or not installed.
+    """
+    available = available_codecs()
+    if name == "auto":
+        name = available[0]
+    if name not in available:
+        msg = f"Unknown or unavailable JSON codec {name!r}, available: {', '.join(available)}"
+        raise ValueError(msg)
+    return CODECS[name]()
+
+
+codec = select_codec(JSON_CODEC)
+"""Codec of the process, chosen by API_JSON_CODEC (the fastest available by default)."""
@@ -0,0 +1,143 @@
+import codecs
+import json
+import re
+from collections.abc import Iterator
+from typing import Any
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _ChunkedText:
+    """UTF-8 text of a byte body, decoded chunk by chunk into a sliding buffer."""
+
+    def __init__(self, data: bytes, chunk_size: int) -> None:
+        """
+        Initializes the reader.
+
+        Args:
+            data: Raw UTF-8 body.
+            chunk_size: Number of bytes decoded per read.
+        """
+        self._view = memoryview(data)
+        self._offset = 0
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self._mark = 0
+        self._mark_bytes = 0
+
+    @property
+    def exhausted(self) -> bool:
+        """True if the whole body has been decoded into the buffer."""
+        return self._offset >= len(self._view)
+
+    def read_more(self) -> None:
+        """Drops the consumed part of the buffer and appends the next decoded chunk."""
+        chunk = self._view[self._offset : self._offset + self._chunk_size]
+        self._offset += len(chunk)
+        self._mark_bytes = self.byte_offset(self.pos)
+        self._mark = 0
+        self.buffer = self.buffer[self.pos :] + self._decoder.decode(chunk, final=self.exhausted)
+        self.pos = 0
+
+    def byte_offset(self, index: int) -> int:
+        """
+        Offset in the body bytes of a buffer position.
+
+        Positions must be asked in increasing order: only the text since the previous
+        position is encoded, so the total cost is linear in the body size.
+        """
+        text = self.buffer[self._mark : index]
+        self._mark_bytes += len(text) if text.isascii() else len(text.encode())
+        self._mark = index
+        return self._mark_bytes
+
+    def skip_whitespace(self) -> str:
+        """Moves past whitespace, reading more if needed; returns the next char ('' at the end)."""
+        while True:
+            match = _WHITESPACE.match(self.buffer, self.pos)
+            self.pos = match.end() if match else self.pos
+            if self.pos < len(self.buffer) or self.exhausted:
+                return self.buffer[self.pos : self.pos + 1]
+            self.read_more()
+
+    def fail(self, message: str) -> json.JSONDecodeError:
+        """Builds a decode error pointing at the current position."""
+        return json.JSONDecodeError(message, self.buffer, self.pos)
+
+
+def iter_json_array(data: bytes, chunk_size: int = 64 * 1024) -> Iterator[Any]:
+    """
+    Parses a JSON array incrementally and yields its items one at a time.
+
+    See iter_json_array_spans, this is the same without the item offsets.
+    """
+    for item, _, _ in iter_json_array_spans(data, chunk_size):
+        yield item
+
+
+def iter_json_array_spans(
+    data: bytes, chunk_size: int = 64 * 1024
+) -> Iterator[tuple[Any, int, int]]:
+    """
+    Parses a JSON array incrementally and yields its items with their byte offsets.
+
+    Only one chunk of decoded text and the item being parsed are held in memory, unlike
+    `json.loads`, which builds the text of the whole body and every item at once.
+
+    Args:
+        data: Raw UTF-8 body holding a JSON array.
+        chunk_size: Number of bytes decoded per step (items larger than that are still
+            parsed, the buffer grows until they fit).
+
+    Yields:
+        The array items, in order, each with the start and end offsets of its JSON text
+        in `data` (`data[start:end]` is the item as sent).
+
+    Raises:
+        json.JSONDecodeError: If the body is not a well-formed JSON array.
+    """
+    decoder = json.JSONDecoder()
+    text = _ChunkedText(data, chunk_size)
+    if text.skip_whitespace() != "[":
+        msg = "Expecting '['"
+        raise text.fail(msg)
+    text.pos += 1
+    if text.skip_whitespace() == "]":
+        text.pos += 1
+    else:
+        while True:
+            yield _decode_item(decoder, text)
+            delimiter = text.skip_whitespace()
+            text.pos += 1
+            if delimiter == "]":
+                break
+            if delimiter != ",":
+                text.pos -= 1
+                msg = "Expecting ',' delimiter"
+                raise text.fail(msg)
+            text.skip_whitespace()
+    if text.skip_whitespace():
+        msg = "Extra data"
+        raise text.fail(msg)
+
+
+def _decode_item(decoder: json.JSONDecoder, text: _ChunkedText) -> tuple[Any, int, int]:
+    """Decodes the array item at the current position, reading more until it is complete."""
+    while True:
+        try:
+            item, end = decoder.raw_decode(text.buffer, text.pos)
+        except json.JSONDecodeError:
+            if text.exhausted:
+                raise
+        else:
+            # A number cut by the chunk boundary still decodes ("12" of "123", "1" of "1.5"),
+            # so the item only counts once the delimiter after it is in the buffer.
+            match = _WHITESPACE.match(text.buffer, end)
+            following = match.end() if match else end
+            if text.buffer[following : following + 1] in {",", "]"} or text.exhausted:
+                start = text.byte_offset(text.pos)
+                text.pos = end
+                return item, start, text.byte_offset(end)
+        text.read_more()
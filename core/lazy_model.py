@@ -0,0 +1,88 @@
+import typing
+from functools import cache
+from typing import Any, ClassVar, cast
+
+from pydantic import BaseModel, PrivateAttr, TypeAdapter, create_model
+
+
+def _has_model(annotation: Any) -> bool:  # noqa: ANN401
+    """True if the annotation is, or contains, a pydantic model (e.g. `list[Step] | None`)."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_has_model(arg) for arg in typing.get_args(annotation))
+
+
+class LazyModel(BaseModel):
+    """
+    Subclass of a pydantic model whose nested models are validated on access.
+
+    Scalar fields are validated up front (in one pass, together with the rest of the body).
+    Fields holding nested models are typed as Any, so they are kept as parsed JSON, and are
+    validated on first access through a property; the result is cached. `full()` validates
+    everything and returns the regular model.
+
+    Being a subclass of the model, an instance passes `isinstance` checks against it and
+    runs its validators: field validators of the scalar fields and model validators (a model
+    validator touching a nested field validates that field). Field validators of the nested
+    fields receive the raw JSON value, as the field is typed Any here.
+
+    Subclasses are created by `lazy_model()`, one per model class.
+    """
+
+    model: ClassVar[type[BaseModel]]
+    """The model this view stands for."""
+    nested_adapters: ClassVar[dict[str, TypeAdapter[Any]]]
+    """Validators of the nested fields, by field name."""
+
+    _nested: dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def full(self) -> BaseModel:
+        """
+        Validates the remaining nested fields and returns the regular model instance.
+
+        Raises:
+            pydantic.ValidationError: If a nested field is invalid.
+        """
+        values = {name: getattr(self, name) for name in type(self).model_fields}
+        return self.model.model_construct(self.model_fields_set, **values)
+
+
+def _nested_property(name: str, adapter: TypeAdapter[Any]) -> property:
+    """Property validating a nested field on first access and caching the result."""
+
+    def get(self: LazyModel) -> Any:  # noqa: ANN401
+        nested = self._nested
+        if name not in nested:
+            nested[name] = adapter.validate_python(vars(self)[name])
+        return nested[name]
+
+    def set_(self: LazyModel, value: Any) -> None:  # noqa: ANN401
+        vars(self)[name] = value
+        self._nested.pop(name, None)
+
+    return property(get, set_)
+
+
+@cache
+def lazy_model(model: type[BaseModel]) -> type[LazyModel]:
+    """
+    Returns the LazyModel subclass of a model, built once per model.
+
+    Args:
+        model: Pydantic model class.
+    """
+    nested = {
+        name: field.annotation
+        for name, field in model.model_fields.items()
+        if field.annotation is not None and _has_model(field.annotation)
+    }
+    fields: Any = {name: (Any, model.model_fields[name]) for name in nested}
+    view = cast(
+        "type[LazyModel]",
+        create_model(f"Lazy{model.__name__}", __base__=(model, LazyModel), **fields),
+    )
+    view.model = model
+    view.nested_adapters = {name: TypeAdapter(annotation) for name, annotation in nested.items()}
+    for name, adapter in view.nested_adapters.items():
+        setattr(view, name, _nested_property(name, adapter))
+    return view
@@ -1,26 +1,84 @@
 import logging
-from typing import Any
-from unittest.mock import Mock
-
-from playwright.sync_api import APIRequestContext, APIResponse
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Protocol, cast
 
+from core.cached_response import CachedResponse
 from core.http_client import HTTPClient
+from core.interceptors import Interceptor
+from core.request_spec import RequestSpec
+from core.route_trie import RouteTrie
+
+if TYPE_CHECKING:
+    from playwright.sync_api import APIRequestContext
+
+    from core.fault_injection import FaultInjector
 
 logger = logging.getLogger(__name__)
 
 
+class MockBackend(Protocol):
+    """Обработчик запросов без мока: FakeCharityBackend, CassetteReplay."""
+
+    def handle(self, spec: RequestSpec, headers: dict[str, Any] | None = None) -> CachedResponse:
+        """Возвращает ответ на запрос."""
+        ...
+
+
+class _OfflineContext:
+    """Контекст-заглушка: MockHTTPClient не отправляет запросы, любое обращение - ошибка."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> None:
+        """Сообщает o попытке использовать транспорт Playwright."""
+        msg = f"MockHTTPClient не использует APIRequestContext (обращение к {name!r})"
+        raise RuntimeError(msg)
+
+
 class MockHTTPClient(HTTPClient):
     """
     Мок HTTP клиент для тестирования API. Перехватывает вызовы методов.
 
     и возвращает заранее настроенные ответы вместо реальных запросов.
+    Подменяется только транспорт, поэтому перехватчики, повторы и circuit breaker
+    работают так же, как в HTTPClient.
+
+    Мок можно зарегистрировать на шаблон эндпоинта (`APIEndpoints.REQUEST_DETAIL`,
+    `/api/request/{id}`): один мок отвечает на запросы c любым id. Поиск идет через
+    RouteTrie - точное совпадение пути проверяется одним обращением к словарю, шаблоны
+    сопоставляются по сегментам пути. Мок на конкретный путь важнее мока на шаблон.
+
+    C `backend` запросы без настроенного мока обслуживает фейковый бэкенд c состоянием
+    (FakeCharityBackend) или записанная сессия (CassetteReplay); моки при этом
+    по-прежнему важнее, например для подмены одного ответа ошибкой.
+
+    C `faults` ответы (и моки, и бэкенд) проходят через FaultInjector: задержки, ошибки
+    и таймауты по профилям маршрутов. Они вносятся в каждую попытку, поэтому повторы
+    и circuit breaker видят нестабильный сервер, a пакеты выполняются параллельно.
     """
 
-    def __init__(self) -> None:
-        """Инициализирует HTTP клиент c фиктивным контекстом и хранилищем моков."""
-        mock_api_context = Mock(spec=APIRequestContext)
-        super().__init__(api_context=mock_api_context)
-        self.mocks: dict[str, Mock] = {}
+    def __init__(
+        self,
+        backend: MockBackend | None = None,
+        interceptors: Sequence[Interceptor] | None = None,
+        faults: "FaultInjector | None" = None,
+    ) -> None:
+        """
+        Инициализирует HTTP клиент без транспорта Playwright и хранилищем моков.
+
+        Args:
+            backend: Обработчик запросов без мока (без него такие запросы - ошибка).
+            interceptors: Цепочка перехватчиков (по умолчанию как в HTTPClient).
+            faults: Профили задержек и ошибок (без них ответы мгновенные).
+        """
+        super().__init__(
+            api_context=cast("APIRequestContext", _OfflineContext()), interceptors=interceptors
+        )
+        self.backend = backend
+        self.faults = faults
+        self.mocks: dict[str, CachedResponse] = {}
+        self._routes = RouteTrie()
         logger.info("MockHTTPClient ID %s инициализирован. Mocks: %s", id(self), self.mocks)
 
     def _get_mock_key(self, method: str, endpoint: str) -> str:
@@ -30,81 +88,68 @@ class MockHTTPClient(HTTPClient):
         logger.debug("Генерация ключа мока: '%s'", key)
         return key
 
-    def _mock_request(self, endpoint: str, method: str = "GET") -> Mock:
+    def _mock_request(self, endpoint: str, method: str = "GET") -> CachedResponse:
         """Основная логика перехвата. Ищет мок и возвращает ego или вызывает ошибку."""
-        key = self._get_mock_key(method, endpoint)
-        logger.info(
-            "MockHTTPClient ID %s ищет мок для ключа: '%s'. Текущие моки: %s",
-            id(self),
-            key,
-            list(self.mocks.keys()),
-        )
-
-        if key in self.mocks:
-            logger.info("Найден и возвращен мок для: %s", key)
-            return self.mocks[key]
+        match = self._routes.match(method, str(endpoint))
+        if match is not None:
+            logger.info(
+                "Найден и возвращен мок для: %s (шаблон %s, параметры %s)",
+                self._get_mock_key(method, endpoint),
+                match.template,
+                match.params,
+            )
+            return match.value
 
         msg = f"Мок не настроен для запроса: {method.upper()} {endpoint}"
-        logger.error(msg)
+        logger.error("%s. Текущие моки: %s", msg, list(self.mocks.keys()))
         raise RuntimeError(msg)
 
-    def get(
-        self,
-        endpoint: str,
-        headers: dict[str, Any] | None = None,
-        params: dict[str, Any] | None = None,
-        **kwargs: dict,
-    ) -> APIResponse:
-        """Перехватывает GET запросы и возвращает мок-ответ."""
-        return self._mock_request(endpoint, method="GET", **kwargs)
-
-    def post(
-        self,
-        endpoint: str,
-        headers: dict[str, Any] | None = None,
-        data: dict[str, Any] | str | bytes | None = None,
-        json: dict[str, Any] | None = None,
-        **kwargs: dict,
-    ) -> APIResponse:
-        """Перехватывает POST запросы и возвращает мок-ответ."""
-        return self._mock_request(endpoint, method="POST", **kwargs)
-
-    def put(
-        self,
-        endpoint: str,
-        headers: dict[str, Any] | None = None,
-        data: dict[str, Any] | str | bytes | None = None,
-        json: dict[str, Any] | None = None,
-        **kwargs: dict,
-    ) -> APIResponse:
-        """Перехватывает PUT запросы и возвращает мок-ответ."""
-        return self._mock_request(endpoint, method="PUT", **kwargs)
-
-    def delete(
-        self,
-        endpoint: str,
-        headers: dict[str, Any] | None = None,
-        params: dict[str, Any] | None = None,
-        **kwargs: dict,
-    ) -> APIResponse:
-        """Перехватывает DELETE запросы и возвращает мок-ответ."""
-        return self._mock_request(endpoint, method="DELETE", **kwargs)
-
-    def patch(
-        self,
-        endpoint: str,
-        headers: dict[str, Any] | None = None,
-        data: dict[str, Any] | str | bytes | None = None,
-        json: dict[str, Any] | None = None,
-        **kwargs: dict,
-    ) -> APIResponse:
-        """Перехватывает PATCH запросы и возвращает мок-ответ."""
-        return self._mock_request(endpoint, method="PATCH", **kwargs)
-
-    def set_mock_response(self, method: str, endpoint: str, response: Mock) -> None:
-        """Настраивает мок-ответ."""
+    def _transport(self, spec: RequestSpec) -> CachedResponse:
+        """Подменяет отправку запроса: возвращает мок-ответ или ответ фейкового бэкенда."""
+        if self.faults is not None:
+            return self.faults.inject(spec, lambda: self._respond(spec))
+        return self._respond(spec)
+
+    def _respond(self, spec: RequestSpec) -> CachedResponse:
+        """
+        Возвращает мок-ответ или ответ фейкового бэкенда.
+
+        Мок и закэшированный ответ бэкенда отдаются на каждый вызов, поэтому каждому
+        вызову достается своя копия (fresh_copy): число попыток и запомненные модели
+        одного запроса не видны другим, в том числе в параллельном пакете.
+        """
+        if self.backend is not None and self._routes.match(spec.method, spec.endpoint) is None:
+            response = self.backend.handle(spec, spec.headers_with(self.default_headers))
+        else:
+            response = self._mock_request(spec.endpoint, method=spec.method)
+        return response.fresh_copy()
+
+    def _dispatch_many(
+        self, specs: Sequence[RequestSpec], max_concurrency: int
+    ) -> list[CachedResponse | Exception]:
+        """
+        Выполняет пакет: последовательно, если моки отвечают мгновенно.
+
+        C FaultInjector задержки ответов накладываются до `max_concurrency` одновременно,
+        как при отправке пакета по сети.
+        """
+        if self.faults is None or max_concurrency == 1 or len(specs) < 2:
+            return [self._send_capturing(spec) for spec in specs]
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(specs))) as executor:
+            return list(executor.map(self._send_capturing, specs))
+
+    def set_mock_response(self, method: str, endpoint: str, response: CachedResponse) -> None:
+        """
+        Настраивает мок-ответ.
+
+        Args:
+            method: HTTP метод.
+            endpoint: Путь (`/api/request/42`) или шаблон пути (`/api/request/{id}`).
+            response: Мок-ответ (обычно FakeAPIResponse).
+        """
         key = self._get_mock_key(method, str(endpoint))
         self.mocks[key] = response
+        self._routes.add(method, str(endpoint), response)
         logger.info(
             "MockHTTPClient ID %s установил мок для: '%s' (Статус: %s). Текущие моки: %s",
             id(self),
@@ -119,3 +164,4 @@ class MockHTTPClient(HTTPClient):
             "MockHTTPClient ID %s очищает моки. Было: %s", id(self), list(self.mocks.keys())
         )
         self.mocks.clear()
+        self._routes.clear()
@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+from core.cached_response import CachedResponse
+from core.json_codec import codec
+
+
+@dataclass(frozen=True)
+class RequestSpec:
+    """
+    Description of a single HTTP request for batch execution.
+
+    Attributes:
+        method: HTTP method (GET, POST, PUT, DELETE, PATCH).
+        endpoint: Relative path to the endpoint (relative to the base_url of the context).
+        headers: Optional dictionary of request headers.
+        params: Optional dictionary of URL request parameters.
+        data: Optional data to be sent (e.g. form data).
+        json: Optional data to send in JSON format.
+        idempotent: Per-request override of the retry policy idempotency check
+            (None means "decide by method").
+    """
+
+    method: str
+    endpoint: str
+    headers: dict[str, Any] | None = None
+    params: dict[str, Any] | None = None
+    data: dict[str, Any] | str | bytes | None = None
+    json: Any | None = None
+    idempotent: bool | None = None
+
+    @cached_property
+    def body(self) -> Any | None:  # noqa: ANN401
+        """
+        Request body as passed to Playwright (`data`, even empty, takes precedence over `json`).
+
+        `json` is encoded by the process JSON codec (once, even if the request is retried)
+        instead of leaving it to the stdlib encoder inside Playwright.
+        """
+        if self.data is not None or self.json is None:
+            return self.data
+        return codec.dumps(self.json)
+
+    def headers_with(self, defaults: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        """
+        Request headers: `defaults` overridden by the spec headers.
+
+        Adds `content-type: application/json` for a body encoded from `json`, unless
+        the headers already set a content type.
+        """
+        headers = {**defaults, **(self.headers or {})} if defaults else self.headers
+        if self.data is not None or self.json is None:
+            return headers
+        if headers and any(name.lower() == "content-type" for name in headers):
+            return headers
+        return {**(headers or {}), "content-type": "application/json"}
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """
+    Outcome of one RequestSpec executed by HTTPClient.execute_many.
+
+    Exactly one of `response` and `error` is set: transport errors are captured per spec
+    instead of being raised, so one failed request does not abort the whole batch.
+    """
+
+    spec: RequestSpec
+    response: CachedResponse | None = None
+    error: Exception | None = None
+
+    @property
+    def failed(self) -> bool:
+        """True if the request raised instead of returning a response."""
+        return self.error is not None
@@ -0,0 +1,117 @@
+import random
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+
+from playwright.sync_api import Error as PlaywrightError
+
+RETRYABLE_STATUSES = frozenset({500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Request-level retry policy for HTTPClient.
+
+    Retries use exponential backoff with full jitter: before attempt N+1 the client sleeps
+    a random time in [0, min(backoff_max, backoff_base * 2 ** (N - 1))] seconds.
+    Only idempotent methods are retried by default, so e.g. POST contributions are never
+    repeated; a single call can override this with `idempotent=True` (as login does).
+
+    Attributes:
+        max_attempts: Total number of attempts including the first one (1 disables retries).
+        backoff_base: Base backoff in seconds.
+        backoff_max: Upper bound of a single backoff in seconds.
+        retry_statuses: Response status codes that trigger a retry.
+        retry_exceptions: Transport exceptions that trigger a retry.
+        idempotent_methods: Methods that are retried without an explicit `idempotent=True`.
+        rng: Random generator for jitter (pass a seeded one for deterministic tests).
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.2
+    backoff_max: float = 5.0
+    retry_statuses: frozenset[int] = RETRYABLE_STATUSES
+    retry_exceptions: tuple[type[Exception], ...] = (PlaywrightError,)
+    idempotent_methods: frozenset[str] = IDEMPOTENT_METHODS
+    rng: random.Random = field(default_factory=random.Random, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Validates the policy parameters."""
+        if self.max_attempts < 1:
+            msg = f"max_attempts must be at least 1, got {self.max_attempts}"
+            raise ValueError(msg)
+        if self.backoff_base < 0 or self.backoff_max < 0:
+            msg = "Backoff values must not be negative"
+            raise ValueError(msg)
+
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        """Policy that never retries (a single attempt per request)."""
+        return cls(max_attempts=1)
+
+    def allows(self, method: str, idempotent: bool | None = None) -> bool:
+        """
+        Checks whether requests with this method may be retried at all.
+
+        Args:
+            method: HTTP method of the request.
+            idempotent: Explicit per-call override; None means "decide by method".
+
+        Returns:
+            True if the request may be sent more than once.
+        """
+        if self.max_attempts <= 1:
+            return False
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in self.idempotent_methods
+
+    def is_retryable_status(self, status: int) -> bool:
+        """True if a response with this status should be retried."""
+        return status in self.retry_statuses
+
+    def is_retryable_error(self, error: Exception) -> bool:
+        """True if this transport error should be retried."""
+        return isinstance(error, self.retry_exceptions)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns the delay before the next attempt (full jitter).
+
+        Args:
+            attempt: Number of the attempt that has just failed (1-based).
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return self.rng.uniform(0, ceiling)
+
+
+class RetryStats:
+    """Thread-safe retry counters, keyed by "METHOD endpoint", for logs and reports."""
+
+    def __init__(self) -> None:
+        """Initializes empty counters."""
+        self._retries: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, method: str, endpoint: str) -> None:
+        """Records one retry of the given request."""
+        with self._lock:
+            self._retries[f"{method.upper()} {endpoint}"] += 1
+
+    @property
+    def total(self) -> int:
+        """Total number of retries recorded."""
+        with self._lock:
+            return self._retries.total()
+
+    def merge(self, counts: dict[str, int]) -> None:
+        """Adds counters collected elsewhere (e.g. by an xdist worker)."""
+        with self._lock:
+            self._retries.update(counts)
+
+    def snapshot(self) -> dict[str, int]:
+        """Returns a copy of the counters, most retried requests first."""
+        with self._lock:
+            return dict(self._retries.most_common())
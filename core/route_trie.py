@@ -0,0 +1,136 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True)
+class RouteMatch:
+    """Route found for a request path."""
+
+    value: Any
+    """Value registered for the route."""
+    template: str
+    """Registered path template, e.g. `/api/request/{id}`."""
+    params: dict[str, str] = field(default_factory=dict)
+    """Path parameters bound by the template, e.g. `{"id": "42"}`."""
+
+
+class _Node:
+    """Trie node: static children by segment, at most one parameter child."""
+
+    __slots__ = ("children", "param", "param_name", "route")
+
+    def __init__(self) -> None:
+        """Initializes an empty node."""
+        self.children: dict[str, _Node] = {}
+        self.param: _Node | None = None
+        self.param_name = ""
+        self.route: tuple[str, Any] | None = None
+
+
+def _is_param(segment: str) -> bool:
+    """True for a `{name}` template segment."""
+    return segment.startswith("{") and segment.endswith("}")
+
+
+class RouteTrie:
+    """
+    Maps (method, path template) to values and finds the value of a concrete path.
+
+    Templates without parameters are kept in a dict keyed by the exact path, so the common
+    case is a single lookup. Templates with `{name}` segments go into a per-method trie of
+    path segments: matching walks it once per segment, static segments take precedence over
+    parameters, and the parameter values are bound on the way.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty trie."""
+        self._exact: dict[tuple[str, str], tuple[str, Any]] = {}
+        self._roots: dict[str, _Node] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Number of registered routes."""
+        return len(self._exact) + self._size
+
+    def add(self, method: str, template: str, value: Any) -> None:  # noqa: ANN401
+        """
+        Registers a route, replacing the value of an already registered one.
+
+        Args:
+            method: HTTP method (case-insensitive).
+            template: Path or path template, e.g. `/api/request/{id}/contribution`.
+            value: Value returned by `match` for the route.
+
+        Raises:
+            ValueError: If a parameter at the same position already has another name.
+        """
+        method = method.upper()
+        segments = template.strip("/").split("/")
+        if not any(map(_is_param, segments)):
+            self._exact[method, template] = (template, value)
+            return
+        node = self._roots.setdefault(method, _Node())
+        for segment in segments:
+            if not _is_param(segment):
+                node = node.children.setdefault(segment, _Node())
+                continue
+            name = segment[1:-1]
+            if node.param is None:
+                node.param, node.param_name = _Node(), name
+            elif node.param_name != name:
+                msg = f"{template}: parameter {{{name}}} conflicts with {{{node.param_name}}}"
+                raise ValueError(msg)
+            node = node.param
+        if node.route is None:
+            self._size += 1
+        node.route = (template, value)
+
+    def match(self, method: str, path: str) -> RouteMatch | None:
+        """
+        Finds the route of a request.
+
+        Args:
+            method: HTTP method (case-insensitive).
+            path: Request path (the query string is ignored).
+
+        Returns:
+            The match, or None if no route fits.
+        """
+        method = method.upper()
+        path = path.partition("?")[0]
+        exact = self._exact.get((method, path))
+        if exact is not None:
+            return RouteMatch(exact[1], exact[0])
+        root = self._roots.get(method)
+        params: dict[str, str] = {}
+        node = None if root is None else self._walk(root, path.strip("/").split("/"), 0, params)
+        if node is None or node.route is None:
+            return None
+        return RouteMatch(node.route[1], node.route[0], params)
+
+    def _walk(
+        self, node: _Node, segments: list[str], index: int, params: dict[str, str]
+    ) -> _Node | None:
+        """
+        Descends from a node along the segments, backtracking from static to parameter.
+
+        Returns:
+            The node of the matching route, or None.
+        """
+        if index == len(segments):
+            return node if node.route is not None else None
+        segment = segments[index]
+        child = node.children.get(segment)
+        found = None if child is None else self._walk(child, segments, index + 1, params)
+        if found is None and node.param is not None and segment:
+            params[node.param_name] = segment
+            found = self._walk(node.param, segments, index + 1, params)
+            if found is None:
+                del params[node.param_name]
+        return found
+
+    def clear(self) -> None:
+        """Removes all routes."""
+        self._exact.clear()
+        self._roots.clear()
+        self._size = 0
@@ -0,0 +1,328 @@
+import argparse
+import asyncio
+import contextlib
+import datetime as dt
+import sys
+import threading
+from collections.abc import Iterator
+from http import HTTPStatus
+from typing import Any
+
+from config.config import (
+    STANDIN_DESCRIPTION_LENGTH,
+    STANDIN_REQUESTS,
+    SWAGGER_SPEC_PATH,
+    TEST_USER_LOGIN,
+    TEST_USER_PASSWORD,
+)
+from core.cached_response import CachedResponse
+from core.fake_backend import FakeCharityBackend
+from core.fake_response import FakeAPIResponse
+from core.json_codec import codec
+from core.request_spec import RequestSpec
+from core.route_trie import RouteTrie
+
+_REF_PREFIX = "#/components/schemas/"
+_MAX_HEAD = 64 * 1024
+_STRING_DEFAULTS = {
+    "date": lambda: dt.datetime.now(dt.UTC).date().isoformat(),
+    "date-time": lambda: dt.datetime.now(dt.UTC).isoformat().replace("+00:00", "Z"),
+    "email": lambda: "user@example.com",
+}
+_TYPE_DEFAULTS: dict[str, Any] = {"integer": 0, "number": 0.0, "boolean": True}
+
+
+def example_value(schema: dict[str, Any], schemas: dict[str, Any]) -> Any:  # noqa: ANN401
+    """
+    Builds a value conforming to an OpenAPI schema, preferring the spec examples.
+
+    Args:
+        schema: The schema.
+        schemas: `components.schemas` of the spec, to resolve `$ref`.
+
+    Returns:
+        The `example`, else the first `enum` value, else a value built from the type:
+        every property of an object, a one-item array, a format-aware string.
+    """
+    if "$ref" in schema:
+        schema = schemas[schema["$ref"].removeprefix(_REF_PREFIX)]
+    kind = schema.get("type")
+    if "example" in schema:
+        value = schema["example"]
+    elif "enum" in schema:
+        value = schema["enum"][0]
+    elif kind == "object":
+        properties = schema.get("properties", {})
+        value = {name: example_value(prop, schemas) for name, prop in properties.items()}
+    elif kind == "array":
+        value = [example_value(schema.get("items", {}), schemas)]
+    elif kind == "string":
+        value = _STRING_DEFAULTS.get(schema.get("format", ""), lambda: "string")()
+    else:
+        value = _TYPE_DEFAULTS.get(kind or "")
+    return value
+
+
+def _operations(spec: dict[str, Any]) -> Iterator[tuple[str, str, dict[str, Any]]]:
+    """Yields (method, path, operation) of every operation of the spec."""
+    for path, item in spec.get("paths", {}).items():
+        for method, operation in item.items():
+            if isinstance(operation, dict) and "responses" in operation:
+                yield method.upper(), path, operation
+
+
+def _example_response(operation: dict[str, Any], schemas: dict[str, Any]) -> FakeAPIResponse:
+    """Response of an operation built from its first documented 2xx status."""
+    status = min(
+        (int(code) for code in operation["responses"] if code.startswith("2")), default=200
+    )
+    content = operation["responses"].get(str(status), {}).get("content", {})
+    if "application/json" in content:
+        body = example_value(content["application/json"].get("schema", {}), schemas)
+        return FakeAPIResponse(status, json_data=body)
+    text = next(iter(content.values()), {}).get("schema", {})
+    return FakeAPIResponse(status, text_data=str(example_value(text, schemas) or ""))
+
+
+def _response_schema(spec: dict[str, Any], method: str, path: str) -> dict[str, Any]:
+    """JSON schema of the 200 response of an operation."""
+    operation = spec["paths"][path][method.lower()]
+    return operation["responses"]["200"]["content"]["application/json"]["schema"]
+
+
+def seed_backend(
+    spec: dict[str, Any],
+    *,
+    requests: int = STANDIN_REQUESTS,
+    description_length: int = STANDIN_DESCRIPTION_LENGTH,
+    login: str = TEST_USER_LOGIN,
+    password: str = TEST_USER_PASSWORD,
+) -> FakeCharityBackend:
+    """
+    Creates a FakeCharityBackend filled with schema-conformant data.
+
+    Args:
+        spec: Parsed docs/swagger.json.
+        requests: Number of help requests (items of GET /api/request), with ids
+            `request-id-1` ... `request-id-N`.
+        description_length: Pads each request description to this many characters
+            (0 keeps the spec example), to scale the body size.
+        login: Login of the test user.
+        password: Password of the test user.
+    """
+    schemas = spec.get("components", {}).get("schemas", {})
+    request = example_value(_response_schema(spec, "GET", "/api/request/{id}"), schemas)
+    profile = example_value(_response_schema(spec, "GET", "/api/user"), schemas)
+    backend = FakeCharityBackend()
+    backend.add_user(login, password, {**profile, "favouriteRequests": []})
+    description = str(request.get("description", ""))
+    if description_length:
+        description = (description * (description_length // max(len(description), 1) + 1))[
+            :description_length
+        ]
+    for index in range(1, requests + 1):
+        backend.add_request({**request, "id": f"request-id-{index}", "description": description})
+    return backend
+
+
+class StandInServer:
+    """
+    Local HTTP/1.1 server on asyncio standing in for charity-api.
+
+    Serves every operation of docs/swagger.json: the ones FakeCharityBackend implements
+    with its stateful semantics, the rest with a static body built from the schema of the
+    first 2xx response. Connections are kept alive (HTTP/1.1 default, `Connection: close`
+    honoured), so the Playwright transport, the context pool and the batch concurrency can
+    be measured end to end without network access to the real API.
+    """
+
+    def __init__(
+        self,
+        backend: FakeCharityBackend,
+        spec: dict[str, Any],
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """
+        Initializes StandInServer.
+
+        Args:
+            backend: Backend serving the requests it has routes for.
+            spec: Parsed docs/swagger.json, for the operations the backend does not implement.
+            host: Interface to listen on.
+            port: Port to listen on (0 picks a free one, see `base_url`).
+        """
+        self.backend = backend
+        self.host = host
+        self.port = port
+        self._server: asyncio.Server | None = None
+        self._connections: set[asyncio.StreamWriter] = set()
+        self._static = RouteTrie()
+        schemas = spec.get("components", {}).get("schemas", {})
+        for method, path, operation in _operations(spec):
+            if not backend.serves(method, path):
+                self._static.add(method, path, _example_response(operation, schemas))
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the running server."""
+        return f"http://{self.host}:{self.port}"
+
+    def dispatch(
+        self, method: str, target: str, headers: dict[str, str], body: bytes
+    ) -> CachedResponse:
+        """
+        Serves one request without the HTTP framing.
+
+        Returns:
+            The backend response, the static response of the spec operation, or 404.
+        """
+        static = None if self.backend.serves(method, target) else self._static.match(method, target)
+        if static is not None:
+            return static.value
+        spec = RequestSpec(method, target, headers=headers, data=body or None)
+        return self.backend.handle(spec, headers)
+
+    async def start(self) -> None:
+        """Starts listening; resolves the port if 0 was given."""
+        self._server = await asyncio.start_server(
+            self._serve_connection, self.host, self.port, limit=_MAX_HEAD
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Stops listening and closes the open connections."""
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._connections):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    @contextlib.contextmanager
+    def run_in_thread(self) -> Iterator[str]:
+        """
+        Runs the server on its own event loop in a daemon thread.
+
+        Yields:
+            The base URL of the server.
+        """
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, name="standin-server", daemon=True)
+        thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(self.start(), loop).result()
+            yield self.base_url
+        finally:
+            asyncio.run_coroutine_threadsafe(self.close(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    async def _serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serves the requests of one connection until it is closed."""
+        self._connections.add(writer)
+        try:
+            keep_alive = True
+            while keep_alive:
+                keep_alive = await self._serve_request(reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _serve_request(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        """
+        Reads one request and writes its response.
+
+        Returns:
+            True if the connection stays open for the next request.
+        """
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+            request_line, *lines = head[:-4].decode("latin-1").split("\r\n")
+            method, target, version = request_line.split(" ")
+        except (asyncio.LimitOverrunError, ValueError):
+            error = FakeAPIResponse(400, json_data={"error": "Bad Request"})
+            writer.write(_render(error, keep_alive=False))
+            await writer.drain()
+            return False
+        headers = {}
+        for line in lines:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length") or 0)
+        body = await reader.readexactly(length) if length else b""
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection == "keep-alive" or (version == "HTTP/1.1" and connection != "close")
+        response = self.dispatch(method, target, headers, body)
+        writer.write(_render(response, keep_alive=keep_alive))
+        await writer.drain()
+        return keep_alive
+
+
+def _render(response: CachedResponse, *, keep_alive: bool) -> bytes:
+    """Serializes a response as HTTP/1.1."""
+    body = response.body()
+    phrase = HTTPStatus(response.status).phrase
+    lines = [f"HTTP/1.1 {response.status} {phrase}"]
+    lines.extend(f"{name}: {value}" for name, value in response.headers.items())
+    lines.append(f"content-length: {len(body)}")
+    lines.append(f"connection: {'keep-alive' if keep_alive else 'close'}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+def build_server(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    *,
+    requests: int = STANDIN_REQUESTS,
+    description_length: int = STANDIN_DESCRIPTION_LENGTH,
+) -> StandInServer:
+    """
+    Creates a stand-in server for docs/swagger.json with a freshly seeded backend.
+
+    Args:
+        host: Interface to listen on.
+        port: Port to listen on (0 picks a free one).
+        requests: Number of items of GET /api/request.
+        description_length: Length of each request description (0 keeps the example).
+    """
+    spec = codec.loads(SWAGGER_SPEC_PATH.read_bytes())
+    backend = seed_backend(spec, requests=requests, description_length=description_length)
+    return StandInServer(backend, spec, host, port)
+
+
+async def _serve(server: StandInServer) -> None:
+    """Runs the server until cancelled."""
+    await server.start()
+    sys.stdout.write(f"{server.base_url}\n")
+    sys.stdout.flush()
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in server for docs/swagger.json")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--requests", type=int, default=STANDIN_REQUESTS)
+    parser.add_argument("--description-length", type=int, default=STANDIN_DESCRIPTION_LENGTH)
+    args = parser.parse_args()
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(
+            _serve(
+                build_server(
+                    args.host,
+                    args.port,
+                    requests=args.requests,
+                    description_length=args.description_length,
+                )
+            )
+        )
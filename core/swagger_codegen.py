@@ -0,0 +1,269 @@
+import hashlib
+import importlib.util
+import keyword
+import logging
+import os
+import re
+import sys
+import types
+from pathlib import Path
+from typing import Any
+
+from config.config import CODEGEN_DIR, SWAGGER_SPEC_PATH
+from core.json_codec import codec
+
+logger = logging.getLogger(__name__)
+
+GENERATOR_VERSION = "2"
+"""Part of the cache key: bump it when the generated code changes for the same spec."""
+
+_PRIMITIVES = {"string": "str", "integer": "int", "number": "float", "boolean": "bool"}
+_STRING_FORMATS = {"date": "datetime.date", "date-time": "datetime.datetime", "email": "EmailStr"}
+_SUMMARY_NAME = re.compile(r"^\((\w+)\)")
+_REF_PREFIX = "#/components/schemas/"
+_METHODS = frozenset({"get", "put", "post", "delete", "options", "head", "patch", "trace"})
+
+_HEADER = '''\
+"""
+Generated by core/swagger_codegen.py from {source} (sha256 key {digest}). Do not edit.
+
+ENDPOINTS: operation name -> (HTTP method, path template).
+REQUEST_BODIES: operation name -> model of the JSON request body.
+STATUSES: operation name -> documented response statuses.
+RESPONSES: (operation name, status) -> type of the response body.
+MEDIA_TYPES: (operation name, status) -> media type of the response body.
+VALIDATORS: (operation name, status) -> TypeAdapter of RESPONSES, compiled at import.
+"""
+
+import datetime
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, TypeAdapter
+
+from core.validation import type_adapter
+
+SPEC_KEY = "{digest}"'''
+
+
+def spec_key(spec_bytes: bytes) -> str:
+    """Cache key of a spec: hash of the spec bytes and the generator version."""
+    return hashlib.sha256(GENERATOR_VERSION.encode() + b"\0" + spec_bytes).hexdigest()[:16]
+
+
+def _pascal(name: str) -> str:
+    """`baseLocations` / `base_locations` -> `BaseLocations`."""
+    parts = re.split(r"[^0-9A-Za-z]+", name)
+    return "".join(part[:1].upper() + part[1:] for part in parts)
+
+
+def _snake(name: str) -> str:
+    """`requestGoalCurrentValue` -> `request_goal_current_value`, a valid identifier."""
+    snake = re.sub(r"\W", "_", re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", name)).lower()
+    if not snake.isidentifier() or keyword.iskeyword(snake):
+        snake = f"field_{snake}" if not snake[:1].isalpha() else f"{snake}_"
+    return snake
+
+
+class _Renderer:
+    """Renders the schemas of a spec into pydantic model classes, each class once."""
+
+    def __init__(self, spec: dict[str, Any]) -> None:
+        """
+        Initializes the renderer.
+
+        Args:
+            spec: Parsed OpenAPI document.
+        """
+        self._schemas: dict[str, Any] = spec.get("components", {}).get("schemas", {})
+        self._rendered: dict[str, str] = {}
+        self.classes: list[str] = []
+
+    def type_of(self, schema: dict[str, Any], name: str, where: str) -> str:
+        """
+        Returns the annotation of a schema, rendering the models it needs.
+
+        Args:
+            schema: Schema object.
+            name: Class name to use if the schema is an inline object.
+            where: Location of the schema in the spec (for docstrings).
+        """
+        if "$ref" in schema:
+            ref = schema["$ref"].removeprefix(_REF_PREFIX)
+            annotation = self.model(ref, self._schemas[ref], f"components.schemas.{ref}")
+        elif "enum" in schema:
+            annotation = f"Literal[{', '.join(map(repr, schema['enum']))}]"
+        elif schema.get("type") == "array":
+            item = self.type_of(schema.get("items", {}), f"{name}Item", f"{where}[]")
+            annotation = f"list[{item}]"
+        elif schema.get("properties"):
+            annotation = self.model(name, schema, where)
+        elif schema.get("type") == "object":
+            annotation = "dict[str, Any]"
+        elif schema.get("type") == "string":
+            annotation = _STRING_FORMATS.get(schema.get("format", ""), "str")
+        else:
+            annotation = _PRIMITIVES.get(schema.get("type", ""), "Any")
+        return annotation
+
+    def model(self, name: str, schema: dict[str, Any], where: str) -> str:
+        """Renders an object schema as a model class (once) and returns the class name."""
+        if name in self._rendered:
+            return self._rendered[name]
+        self._rendered[name] = name
+        required = set(schema.get("required", ()))
+        lines = [
+            f"class {name}(BaseModel):",
+            f'    """Schema `{where}`."""',
+            "",
+            '    model_config = ConfigDict(populate_by_name=True, extra="ignore")',
+            "",
+        ]
+        for wire_name, field_schema in schema.get("properties", {}).items():
+            annotation = self.type_of(
+                field_schema, name + _pascal(wire_name), f"{where}.{wire_name}"
+            )
+            lines.append(self._field(wire_name, field_schema, annotation, wire_name in required))
+        self.classes.append("\n".join(lines))
+        return name
+
+    @staticmethod
+    def _field(wire_name: str, schema: dict[str, Any], annotation: str, required: bool) -> str:
+        """Renders one field; the snake_case attribute is aliased to the wire name."""
+        attribute = _snake(wire_name)
+        arguments = [] if required else ["None"]
+        if attribute != wire_name:
+            arguments.append(f"alias={wire_name!r}")
+        if "example" in schema:
+            arguments.append(f"examples=[{schema['example']!r}]")
+        if not required:
+            annotation = f"{annotation} | None"
+        if arguments == ["None"]:
+            return f"    {attribute}: {annotation} = None"
+        if not arguments:
+            return f"    {attribute}: {annotation}"
+        return f"    {attribute}: {annotation} = Field({', '.join(arguments)})"
+
+
+def _operation_name(method: str, path: str, operation: dict[str, Any]) -> str:
+    """Operation name: `operationId`, the `(Name)` prefix of the summary, or method + path."""
+    if "operationId" in operation:
+        return _pascal(operation["operationId"])
+    match = _SUMMARY_NAME.match(operation.get("summary", ""))
+    if match:
+        return match.group(1)
+    return _pascal(f"{method}_{re.sub(r'[{}]', '', path)}")
+
+
+def _json_schema(body: dict[str, Any]) -> tuple[str, dict[str, Any]] | None:
+    """Media type and schema of a request / response body (JSON preferred)."""
+    content = body.get("content", {})
+    for media_type in ("application/json", *content):
+        if media_type in content and "schema" in content[media_type]:
+            return media_type, content[media_type]["schema"]
+    return None
+
+
+def generate_source(spec: dict[str, Any], key: str, source: str = "docs/swagger.json") -> str:
+    """
+    Compiles an OpenAPI document into the source of a Python module.
+
+    Args:
+        spec: Parsed OpenAPI document.
+        key: Cache key of the spec (see `spec_key`), recorded in the module.
+        source: Spec location, for the module docstring.
+    """
+    renderer = _Renderer(spec)
+    endpoints: list[str] = []
+    bodies: list[str] = []
+    statuses: list[str] = []
+    responses: list[str] = []
+    media_types: list[str] = []
+    for name in spec.get("components", {}).get("schemas", {}):
+        renderer.model(name, spec["components"]["schemas"][name], f"components.schemas.{name}")
+    for path, methods in spec.get("paths", {}).items():
+        for method, operation in methods.items():
+            if method not in _METHODS:
+                continue
+            name = _operation_name(method, path, operation)
+            endpoints.append(f"    {name!r}: ({method.upper()!r}, {path!r}),")
+            request = _json_schema(operation.get("requestBody", {}))
+            if request is not None and request[0] == "application/json":
+                body = renderer.type_of(request[1], f"{name}Request", f"{path} {method} body")
+                bodies.append(f"    {name!r}: {body},")
+            documented = {
+                status: response
+                for status, response in operation.get("responses", {}).items()
+                if status.isdigit()
+            }
+            statuses.append(f"    {name!r}: ({''.join(f'{status}, ' for status in documented)}),")
+            for status, response in documented.items():
+                content = _json_schema(response)
+                if content is None:
+                    continue
+                where = f"{path} {method} {status}"
+                annotation = renderer.type_of(content[1], f"{name}Response", where)
+                responses.append(f"    ({name!r}, {status}): {annotation},")
+                media_types.append(f"    ({name!r}, {status}): {content[0]!r},")
+    parts = [
+        _HEADER.format(source=source, digest=key),
+        *renderer.classes,
+        "ENDPOINTS: dict[str, tuple[str, str]] = {\n" + "\n".join(endpoints) + "\n}",
+        "REQUEST_BODIES: dict[str, Any] = {\n" + "\n".join(bodies) + "\n}",
+        "STATUSES: dict[str, tuple[int, ...]] = {\n" + "\n".join(statuses) + "\n}",
+        "RESPONSES: dict[tuple[str, int], Any] = {\n" + "\n".join(responses) + "\n}",
+        "MEDIA_TYPES: dict[tuple[str, int], str] = {\n" + "\n".join(media_types) + "\n}",
+        (
+            "VALIDATORS: dict[tuple[str, int], TypeAdapter[Any]] = {\n"
+            "    key: type_adapter(tp) for key, tp in RESPONSES.items()\n}"
+        ),
+    ]
+    return "\n\n\n".join(parts) + "\n"
+
+
+def load_generated(
+    spec_path: Path = SWAGGER_SPEC_PATH, cache_dir: Path = CODEGEN_DIR
+) -> types.ModuleType:
+    """
+    Imports the module generated from a spec, generating it on the first call for the spec.
+
+    The module is written to `cache_dir/swagger_<key>.py`, where the key is a hash of the spec
+    bytes. Later sessions import the cached module (and its bytecode) without regenerating;
+    editing the spec produces a new key and a new module.
+
+    Args:
+        spec_path: OpenAPI document (JSON).
+        cache_dir: Directory of the generated modules.
+
+    Returns:
+        The generated module (see the module docstring for its contents).
+    """
+    spec_bytes = spec_path.read_bytes()
+    key = spec_key(spec_bytes)
+    module_name = f"swagger_{key}"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    module_path = cache_dir / f"{module_name}.py"
+    if not module_path.exists():
+        logger.info("Generating %s from %s", module_path, spec_path)
+        source = generate_source(codec.loads(spec_bytes), key, spec_path.name)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Written aside and renamed, so parallel workers never import a partial file.
+        partial_path = module_path.with_suffix(f".{os.getpid()}.tmp")
+        partial_path.write_text(source, encoding="utf-8")
+        partial_path.replace(module_path)
+    module_spec = importlib.util.spec_from_file_location(module_name, module_path)
+    if module_spec is None or module_spec.loader is None:
+        msg = f"Cannot import the generated module {module_path}"
+        raise ImportError(msg)
+    module = importlib.util.module_from_spec(module_spec)
+    sys.modules[module_name] = module
+    try:
+        module_spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+if __name__ == "__main__":
+    sys.stdout.write(f"{load_generated().__file__}\n")
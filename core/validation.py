@@ -0,0 +1,260 @@
+import copy
+import threading
+import types
+import typing
+from collections.abc import Callable, Generator
+from collections.abc import Set as AbstractSet
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import cache, partial
+from typing import Any, cast
+
+from pydantic import BaseModel, TypeAdapter
+
+from config.config import VALIDATION_LEVEL
+from core.cached_response import CachedResponse
+from core.json_codec import codec
+from core.lazy_model import lazy_model
+
+
+class ValidationLevel(StrEnum):
+    """How thoroughly response bodies are validated."""
+
+    FULL = "full"
+    """Regular pydantic validation (lax mode, e.g. "2024-01-01" becomes a date)."""
+    STRICT = "strict"
+    """Strict mode: no type coercion, a mismatching JSON type is an error."""
+    LAZY = "lazy"
+    """Scalar fields are validated up front, nested models on first access (see LazyModel).
+
+    Applies to model types and lists of models; other types are validated fully.
+    """
+    TRUSTED = "trusted"
+    """No validation: models are built with `model_construct` from the parsed JSON.
+
+    Meant for load runs against known-good responses; values keep their JSON types.
+    """
+
+
+@cache
+def type_adapter(tp: Any) -> TypeAdapter[Any]:  # noqa: ANN401
+    """
+    Returns the TypeAdapter of a type, built once per process.
+
+    Building an adapter compiles the pydantic-core validator of the whole type, which costs
+    far more than validating a typical response; the cache makes it a one-time cost.
+
+    Args:
+        tp: Type to validate against, e.g. `list[HelpRequestData]` (must be hashable).
+    """
+    return TypeAdapter(tp)
+
+
+@dataclass(frozen=True)
+class Validator:
+    """Precompiled validation of one type at one level."""
+
+    validate_json: Callable[[bytes], Any]
+    """Validates raw JSON bytes."""
+    validate_python: Callable[[Any], Any]
+    """Validates already parsed JSON (mocked responses)."""
+
+
+@cache
+def _constructor(tp: Any) -> Callable[[Any], Any]:  # noqa: ANN401
+    """
+    Builds a function turning parsed JSON into `tp` without validation.
+
+    Models (also nested, in lists and in optional fields) are created with `model_construct`,
+    set classes validated from JSON arrays (e.g. FavouritesSet) by calling the class;
+    anything else is returned as is.
+    """
+    if isinstance(tp, type) and issubclass(tp, BaseModel):
+        return _model_constructor(tp)
+    if isinstance(tp, type) and issubclass(tp, AbstractSet):
+        return tp
+    origin = typing.get_origin(tp)
+    args = [arg for arg in typing.get_args(tp) if arg is not type(None)]
+    construct = _identity
+    if origin is list and args:
+        construct_item = _constructor(args[0])
+        if construct_item is not _identity:
+            construct = partial(_construct_list, construct_item)
+    elif origin in {typing.Union, types.UnionType} and len(args) == 1:
+        construct_value = _constructor(args[0])
+        if construct_value is not _identity:
+            construct = partial(_construct_optional, construct_value)
+    return construct
+
+
+def _model_constructor(model: type[BaseModel]) -> Callable[[Any], Any]:
+    """
+    Builds the `model_construct` call of a model, keys are matched by alias or name.
+
+    Defaults of absent fields are filled in here: `model_construct` would otherwise inspect
+    every `default_factory` signature on every call, which costs more than validation.
+    """
+    fields: dict[str, tuple[str, Callable[[Any], Any]]] = {}
+    for name, field in model.model_fields.items():
+        entry = (name, _constructor(field.annotation))
+        fields[name] = entry
+        if field.alias:
+            fields[field.alias] = entry
+    defaults = _field_defaults(model)
+
+    def construct(data: Any) -> Any:  # noqa: ANN401
+        if not isinstance(data, dict):
+            return data
+        values = {}
+        for key, value in data.items():
+            if key in fields:
+                name, construct_value = fields[key]
+                values[name] = construct_value(value)
+        fields_set = set(values)
+        for name, default in defaults:
+            if name not in fields_set:
+                values[name] = default()
+        return model.model_construct(fields_set, **values)
+
+    return construct
+
+
+def _field_defaults(model: type[BaseModel]) -> list[tuple[str, Callable[[], Any]]]:
+    """Default value makers of the optional fields of a model."""
+    defaults: list[tuple[str, Callable[[], Any]]] = []
+    for name, field in model.model_fields.items():
+        if field.default_factory is not None:
+            defaults.append((name, cast("Callable[[], Any]", field.default_factory)))
+        elif not field.is_required():
+            defaults.append((name, partial(copy.copy, field.default)))
+    return defaults
+
+
+def _construct_list(construct_item: Callable[[Any], Any], data: Any) -> Any:  # noqa: ANN401
+    """Constructs every item of a JSON array."""
+    return [construct_item(item) for item in data] if isinstance(data, list) else data
+
+
+def _construct_optional(construct_value: Callable[[Any], Any], data: Any) -> Any:  # noqa: ANN401
+    """Constructs a value of an optional field, None stays None."""
+    return None if data is None else construct_value(data)
+
+
+def _identity(data: Any) -> Any:  # noqa: ANN401
+    """Returns the value unchanged."""
+    return data
+
+
+def _lazy_validator(tp: Any) -> Validator | None:  # noqa: ANN401
+    """Validator producing LazyModel views of a model or a list of models (None otherwise)."""
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if origin is list and args and isinstance(args[0], type) and issubclass(args[0], BaseModel):
+        adapter = type_adapter(list[lazy_model(args[0])])
+        return Validator(adapter.validate_json, adapter.validate_python)
+    if isinstance(tp, type) and issubclass(tp, BaseModel):
+        adapter = type_adapter(lazy_model(tp))
+        return Validator(adapter.validate_json, adapter.validate_python)
+    return None
+
+
+class ValidatorRegistry:
+    """
+    Precompiled validators keyed by response type and ValidationLevel.
+
+    A validator is compiled on the first use of a type at a level and reused afterwards,
+    so per-response cost is a single pass over the body bytes.
+    """
+
+    def __init__(self, level: ValidationLevel = ValidationLevel.FULL) -> None:
+        """
+        Initializes an empty registry.
+
+        Args:
+            level: Level used when a call does not specify one.
+        """
+        self.level = level
+        self._validators: dict[tuple[Any, ValidationLevel], Validator] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def use_level(self, level: ValidationLevel) -> Generator[ValidationLevel]:
+        """Temporarily changes the default level (e.g. for one load scenario)."""
+        previous = self.level
+        self.level = level
+        try:
+            yield level
+        finally:
+            self.level = previous
+
+    def validator(self, tp: Any, level: ValidationLevel | None = None) -> Validator:  # noqa: ANN401
+        """
+        Returns the validator of a type at a level, compiling it on first use.
+
+        Args:
+            tp: Model class or any type accepted by TypeAdapter (e.g. `list[str]`).
+            level: Validation level (the registry default if None).
+        """
+        key = (tp, level or self.level)
+        validator = self._validators.get(key)
+        if validator is None:
+            with self._lock:
+                validator = self._validators.get(key) or self._compile(*key)
+                self._validators[key] = validator
+        return validator
+
+    def validate(self, response: Any, tp: Any, level: ValidationLevel | None = None) -> Any:  # noqa: ANN401
+        """
+        Validates the response body against a type in a single pass.
+
+        The raw body bytes go straight to pydantic-core (`validate_json`), so no intermediate
+        dicts are built and lists are validated without a per-item Python loop. The result is
+        memoized on the CachedResponse per type and level: a response served again from the
+        HTTP cache is not validated twice. Mocked responses (without raw bytes) are validated
+        from `json()`.
+
+        Args:
+            response: CachedResponse, or a mocked response exposing `json()`.
+            tp: Model class or any type accepted by TypeAdapter.
+            level: Validation level (the registry default if None).
+
+        Returns:
+            The validated value.
+
+        Raises:
+            pydantic.ValidationError: If the body is not valid JSON or does not match the type
+                (never raised at the trusted level, except for invalid JSON).
+            json.JSONDecodeError: If the body is not valid JSON (trusted level only).
+        """
+        level = level or self.level
+        validator = self.validator(tp, level)
+        if isinstance(response, CachedResponse):
+            return response.memoized((tp, level), lambda: validator.validate_json(response.body()))
+        return validator.validate_python(response.json())
+
+    @staticmethod
+    def _compile(tp: Any, level: ValidationLevel) -> Validator:  # noqa: ANN401
+        """Builds the validator of a type at a level."""
+        if level is ValidationLevel.TRUSTED:
+            construct = _constructor(tp)
+            return Validator(lambda body: construct(codec.loads(body)), construct)
+        if level is ValidationLevel.LAZY:
+            lazy = _lazy_validator(tp)
+            if lazy is not None:
+                return lazy
+        adapter = type_adapter(tp)
+        strict = True if level is ValidationLevel.STRICT else None
+        return Validator(
+            partial(adapter.validate_json, strict=strict),
+            partial(adapter.validate_python, strict=strict),
+        )
+
+
+validators = ValidatorRegistry(ValidationLevel(VALIDATION_LEVEL))
+"""Registry used by the API clients; its level comes from API_VALIDATION_LEVEL."""
+
+
+def validate_body(response: Any, tp: Any, level: ValidationLevel | None = None) -> Any:  # noqa: ANN401
+    """Validates the response body with the shared registry (see ValidatorRegistry.validate)."""
+    return validators.validate(response, tp, level)
@@ -2,7 +2,6 @@ import logging
 
 import allure
 import pytest
-from playwright.sync_api import APIResponse
 
 from api.auth.client import AuthClient
 from api.auth.models import AuthPayload, AuthSuccessResponse
@@ -12,6 +11,7 @@ from config.config import (
     TEST_USER_LOGIN,
     TEST_USER_PASSWORD,
 )
+from core.cached_response import CachedResponse
 
 logger = logging.getLogger(__name__)
 
@@ -71,8 +71,8 @@ class TestAuthenticationAPI:
         logger.info("Тест: %s", description)
         payload = AuthPayload(login=login, password=password)
         response = auth_client.login(payload=payload, expected_status=expected_status)
-        assert isinstance(response, APIResponse), (
-            f"Ожидался тип APIResponse при статусе {expected_status}"
+        assert isinstance(response, CachedResponse), (
+            f"Ожидался тип CachedResponse при статусе {expected_status}"
         )
 
     @allure.story("Неуспешный вход - Некорректное тело запроса")
@@ -132,8 +132,8 @@ class TestAuthenticationAPI:
             f"{description}"
         )
         logger.info("Тест: %s", description)
-        endpoint = APIEndpoints.AUTH
-        response = auth_client.http.post(endpoint=str(endpoint), json=payload_dict)
+        endpoint = APIEndpoints.AUTH.value
+        response = auth_client.http.post(endpoint=endpoint, json=payload_dict)
         assert response.status == expected_status, (
             f"Ожидался статус {expected_status}, но получен {response.status}. "
             f"Тело: {response.text()}"
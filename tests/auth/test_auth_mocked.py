@@ -1,6 +1,5 @@
 import json
 import logging
-from unittest.mock import Mock
 
 import allure
 import pytest
@@ -8,6 +7,7 @@ import pytest
 from api.auth.client import AuthClient
 from api.auth.models import AuthPayload, AuthSuccessResponse
 from config.config import INVALID_USER_PASSWORD, TEST_USER_LOGIN, TEST_USER_PASSWORD
+from core.fake_response import FakeAPIResponse
 from tests.mocks.conftest import mock_auth_client, mock_factory, mock_http_client  # noqa: F401
 from tests.mocks.mock_data import (
     MOCK_AUTH_FAILURE_400_CREDENTIALS,
@@ -103,7 +103,7 @@ class TestAuthenticationMockedFactory:
             assert not isinstance(response, AuthSuccessResponse), (
                 "При ошибке не должен возвращаться AuthSuccessResponse"
             )
-            assert isinstance(response, Mock), "Ожидался объект Mock при статусе 400"
+            assert isinstance(response, FakeAPIResponse), "Ожидался FakeAPIResponse при статусе 400"
             assert response.status == 400, "Ожидался статус 400"
             try:
                 error_body = response.json()
@@ -132,7 +132,7 @@ class TestAuthenticationMockedFactory:
             assert not isinstance(response, AuthSuccessResponse), (
                 "При ошибке не должен возвращаться AuthSuccessResponse"
             )
-            assert isinstance(response, Mock), "Ожидался объект Mock при статусе 500"
+            assert isinstance(response, FakeAPIResponse), "Ожидался FakeAPIResponse при статусе 500"
             assert response.status == 500, "Ожидался статус 500"
             try:
                 error_body = response.json()
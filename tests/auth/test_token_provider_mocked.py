@@ -0,0 +1,139 @@
+import base64
+import json
+import logging
+import multiprocessing
+from pathlib import Path
+
+import allure
+import pytest
+
+from api.auth.token_provider import TokenProvider, TokenStore, jwt_expiry
+
+logger = logging.getLogger(__name__)
+
+KEY = "http://mock|user@test.com"
+
+
+def _jwt(exp: float) -> str:
+    """Создает неподписанный JWT c заданным exp."""
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).rstrip(b"=")
+    return f"eyJhbGciOiJub25lIn0.{payload.decode()}.signature"
+
+
+class FakeClock:
+    """Управляемые тестом часы (Unix-время)."""
+
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        """Устанавливает начальное время."""
+        self.now = now
+
+    def __call__(self) -> float:
+        """Возвращает текущее время."""
+        return self.now
+
+
+class CountingLogin:
+    """Логин-функция, выдающая JWT c exp через `ttl` секунд и считающая вызовы."""
+
+    def __init__(self, clock: FakeClock, ttl: float = 3600) -> None:
+        """Запоминает часы и время жизни токена."""
+        self.clock = clock
+        self.ttl = ttl
+        self.calls = 0
+
+    def __call__(self) -> str:
+        """Выполняет логин."""
+        self.calls += 1
+        return _jwt(self.clock() + self.ttl)
+
+
+def _login_in_worker(path: str) -> None:
+    """Получает токен в отдельном процессе, как это делает xdist-воркер."""
+    login_calls = Path(path).with_suffix(".calls")
+
+    def login() -> str:
+        with login_calls.open("a") as file:
+            file.write("x")
+        return _jwt(4_000_000_000)
+
+    TokenProvider(login=login, key=KEY, store=TokenStore(Path(path))).get_token()
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Предоставляет управляемые часы."""
+    return FakeClock()
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> TokenStore:
+    """Предоставляет файловое хранилище токенов во временном каталоге."""
+    return TokenStore(tmp_path / "auth_tokens.json")
+
+
+@allure.epic("Авторизация (Моки)")
+@allure.feature("Кэш токенов между воркерами")
+@pytest.mark.auth
+@pytest.mark.mocked
+class TestTokenProviderMocked:
+    """Мок-тесты провайдера токенов c общим файловым кэшем."""
+
+    @allure.title("Тест чтения exp из JWT")
+    @pytest.mark.positive
+    def test_jwt_expiry(self) -> None:
+        """Проверка декодирования exp и обработки токенов без exp."""
+        assert jwt_expiry(_jwt(1234)) == 1234.0
+        assert jwt_expiry("not-a-jwt") is None
+        assert jwt_expiry("a.!!!.c") is None
+
+    @allure.title("Тест одного логина на все провайдеры запуска")
+    @pytest.mark.positive
+    def test_token_shared_through_store(self, store: TokenStore, clock: FakeClock) -> None:
+        """Проверка, что второй провайдер (другой воркер) берет токен из хранилища."""
+        login = CountingLogin(clock)
+        first = TokenProvider(login=login, key=KEY, store=store, clock=clock)
+        second = TokenProvider(login=login, key=KEY, store=store, clock=clock)
+
+        assert first.get_token() == second.get_token()
+        assert login.calls == 1
+
+    @allure.title("Тест упреждающего обновления токена")
+    @pytest.mark.positive
+    def test_token_refreshed_before_expiry(self, store: TokenStore, clock: FakeClock) -> None:
+        """Проверка, что токен обновляется за refresh_margin секунд до exp."""
+        login = CountingLogin(clock, ttl=600)
+        provider = TokenProvider(login=login, key=KEY, store=store, refresh_margin=60, clock=clock)
+        token = provider.get_token()
+
+        clock.now += 539
+        assert provider.get_token() == token
+        clock.now += 1
+        assert provider.get_token() != token
+        assert login.calls == 2
+
+    @allure.title("Тест инвалидации токена")
+    @pytest.mark.negative
+    def test_invalidate_forces_login(self, store: TokenStore, clock: FakeClock) -> None:
+        """Проверка, что после invalidate() выполняется новый логин."""
+        login = CountingLogin(clock)
+        provider = TokenProvider(login=login, key=KEY, store=store, clock=clock)
+        provider.get_token()
+        provider.invalidate()
+        provider.get_token()
+
+        assert login.calls == 2
+
+    @allure.title("Тест одного логина на несколько процессов")
+    @pytest.mark.positive
+    def test_single_login_across_processes(self, tmp_path: Path) -> None:
+        """Проверка, что файловая блокировка пропускает к логину только один процесс."""
+        path = tmp_path / "auth_tokens.json"
+        context = multiprocessing.get_context("spawn")
+        workers = [context.Process(target=_login_in_worker, args=(str(path),)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=30)
+
+        assert all(worker.exitcode == 0 for worker in workers)
+        assert path.with_suffix(".calls").read_text() == "x"
@@ -0,0 +1,75 @@
+"""
+Бенчмарк JSON-кодеков на реальных формах тел запросов и ответов API.
+
+Запуск: `python -m tests.benchmarks.bench_json_codec [число элементов списка]`.
+Печатает время одного вызова loads / dumps / dumps_pretty для каждого доступного кодека
+и выигрыш относительно stdlib.
+"""
+
+import sys
+import timeit
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from core.json_codec import available_codecs, select_codec
+from tests.mocks.mock_data import MOCK_FAVOURITES_LIST, MOCK_HELP_REQUEST_DATA, MOCK_USER_DATA
+
+
+def payloads(list_size: int) -> dict[str, Any]:
+    """Тела, которые клиент кодирует и разбирает: логин, профиль, избранное, списки запросов."""
+    return {
+        "POST /api/auth (тело запроса)": {"login": "user@example.com", "password": "password123"},
+        "GET /api/user": MOCK_USER_DATA,
+        "GET /api/user/favourites": MOCK_FAVOURITES_LIST * 25,
+        "GET /api/request/{id}": MOCK_HELP_REQUEST_DATA,
+        f"GET /api/request ({list_size} шт.)": [
+            {**MOCK_HELP_REQUEST_DATA, "id": f"request-{index}"} for index in range(list_size)
+        ],
+    }
+
+
+def per_call(operation: Callable[[], object]) -> float:
+    """Среднее время одного вызова в микросекундах."""
+    timer = timeit.Timer(operation)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=2, number=number)) / number * 1e6
+
+
+def run(list_size: int = 200) -> list[tuple[str, str, str, float]]:
+    """
+    Замеряет все операции всех доступных кодеков.
+
+    Returns:
+        Строки (тело, операция, кодек, мкс на вызов).
+    """
+    codecs = [select_codec(name) for name in available_codecs()]
+    rows: list[tuple[str, str, str, float]] = []
+    for name, value in payloads(list_size).items():
+        encoded = select_codec("stdlib").dumps(value)
+        for codec in codecs:
+            operations = {
+                "loads": partial(codec.loads, encoded),
+                "dumps": partial(codec.dumps, value),
+                "dumps_pretty": partial(codec.dumps_pretty, value),
+            }
+            rows.extend((name, op, codec.name, per_call(call)) for op, call in operations.items())
+    return rows
+
+
+def main() -> None:
+    """Печатает таблицу результатов."""
+    list_size = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rows = run(list_size)
+    baseline = {(name, op): us for name, op, codec, us in rows if codec == "stdlib"}
+    sys.stdout.write(
+        f"{'тело':<34} {'операция':<13} {'кодек':<9} {'мкс/вызов':>10} {'xstdlib':>8}\n"
+    )
+    for name, op, codec, us in rows:
+        sys.stdout.write(
+            f"{name:<34} {op:<13} {codec:<9} {us:>10.2f} {baseline[name, op] / us:>7.1f}x\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
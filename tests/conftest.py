@@ -1,10 +1,12 @@
 import logging
-from collections.abc import Generator
+import os
+from collections.abc import Callable, Generator
+from pathlib import Path
+from typing import Any
 
 import pytest
 from playwright.sync_api import (
     APIRequestContext,
-    APIResponse,
     Playwright,
     sync_playwright,
 )
@@ -14,9 +16,44 @@ from playwright.sync_api import (
 
 from api.auth.client import AuthClient
 from api.auth.models import AuthPayload, AuthSuccessResponse
+from api.auth.token_provider import TokenProvider, TokenStore
 from api.user.client import UserClient
-from config.config import BASE_URL, TEST_USER_LOGIN, TEST_USER_PASSWORD
+from config.config import (
+    BASE_URL,
+    BREAKER_CONSECUTIVE_FAILURES,
+    BREAKER_FAILURE_RATE,
+    BREAKER_RESET_TIMEOUT,
+    CASSETTE_RECORD,
+    CASSETTE_REPLAY,
+    CONTRACT_CHECK,
+    HTTP_CACHE_MAX_ENTRIES,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+    RETRY_MAX_ATTEMPTS,
+    STANDIN_SERVER,
+    TEST_USER_LOGIN,
+    TEST_USER_PASSWORD,
+    TOKEN_REFRESH_MARGIN,
+)
+from core.cached_response import CachedResponse
+from core.cassette import (
+    Cassette,
+    CassetteRecorder,
+    CassetteReplay,
+    cassette_paths,
+    worker_cassette_path,
+)
+from core.circuit_breaker import BreakerConfig, CircuitBreakerRegistry
+from core.context_pool import ContextPool
+from core.contract import ContractReport, ContractValidator
+from core.http_cache import HTTPCache
 from core.http_client import HTTPClient
+from core.interceptors import Interceptor, default_interceptors
+from core.mock_http_client import MockHTTPClient
+from core.retry import RetryPolicy, RetryStats
+from core.standin_server import build_server
+from utils.allure_utils import AllureUtils
+from utils.attachment_policy import AttachmentMode, AttachmentPolicy
 
 logging.basicConfig(
     level=logging.INFO,
@@ -25,6 +62,89 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+retry_stats_key = pytest.StashKey[RetryStats]()
+contract_report_key = pytest.StashKey[ContractReport]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Создает общие счетчики повторов и нарушений контракта на время запуска."""
+    config.stash[retry_stats_key] = RetryStats()
+    config.stash[contract_report_key] = ContractReport()
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """
+    C API_STANDIN_SERVER=true пропускает тесты c маркером `real_api("<причина>")`.
+
+    Сервер-заглушка отвечает по docs/swagger.json, a такие тесты проверяют поведение или
+    данные настоящего API, которых в спецификации нет.
+    """
+    if not STANDIN_SERVER:
+        return
+    for item in items:
+        marker = item.get_closest_marker("real_api")
+        if marker is not None:
+            reason = marker.args[0] if marker.args else "поведение настоящего API"
+            item.add_marker(pytest.mark.skip(reason=f"Сервер-заглушка: {reason}"))
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Передает счетчики повторов и нарушений контракта из xdist-воркера в основной процесс."""
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["retry_stats"] = session.config.stash[retry_stats_key].snapshot()
+        workeroutput["contract_violations"] = session.config.stash[contract_report_key].snapshot()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node: Any) -> None:  # noqa: ANN401
+    """Собирает счетчики завершившегося xdist-воркера."""
+    workeroutput = getattr(node, "workeroutput", {})
+    node.config.stash[retry_stats_key].merge(workeroutput.get("retry_stats", {}))
+    node.config.stash[contract_report_key].merge(workeroutput.get("contract_violations", {}))
+
+
+def pytest_terminal_summary(terminalreporter: Any, config: pytest.Config) -> None:  # noqa: ANN401
+    """Выводит в итог запуска повторы HTTP-запросов и нарушения контракта по эндпоинтам."""
+    stats = config.stash[retry_stats_key]
+    if stats.total:
+        terminalreporter.write_sep("-", f"Повторы HTTP-запросов: {stats.total}")
+        for request, count in stats.snapshot().items():
+            terminalreporter.write_line(f"{request}: {count}")
+    report = config.stash[contract_report_key]
+    if report.total:
+        terminalreporter.write_sep("-", f"Нарушения контракта docs/swagger.json: {report.total}")
+        for violation, count in report.snapshot().items():
+            terminalreporter.write_line(f"{violation} (x{count})")
+
+
+@pytest.fixture(autouse=True)
+def attachment_policy(request: pytest.FixtureRequest) -> Generator[AttachmentPolicy]:
+    """
+    Устанавливает политику Allure-вложений на время теста.
+
+    Приоритет: маркер `attach_policy("<политика>")`, затем маркер `mocked` (без вложений),
+    затем политика запуска из ALLURE_ATTACH_POLICY.
+    """
+    marker = request.node.get_closest_marker("attach_policy")
+    if marker is not None:
+        policy = AttachmentPolicy.parse(marker.args[0])
+    elif request.node.get_closest_marker("mocked") is not None:
+        policy = AttachmentPolicy(mode=AttachmentMode.NEVER)
+    else:
+        policy = AllureUtils.policy
+    with AllureUtils.use_policy(policy):
+        yield policy
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport() -> Generator[None]:
+    """Добавляет отложенные (on-failure) вложения в отчет упавшего теста."""
+    outcome = yield
+    report: pytest.TestReport = outcome.get_result()  # type: ignore[attr-defined]
+    if report.when == "call" or report.failed:
+        AllureUtils.flush_deferred(attach=report.failed)
+
 
 @pytest.fixture(scope="session", name="playwright_instance")
 def playwright_instance_fixture() -> Generator[Playwright]:
@@ -35,23 +155,194 @@ def playwright_instance_fixture() -> Generator[Playwright]:
     logger.info("Остановка Playwright...")
 
 
+@pytest.fixture(scope="session", name="base_url")
+def base_url_fixture() -> Generator[str]:
+    """
+    Предоставляет base URL API.
+
+    C API_STANDIN_SERVER=true поднимает в воркере локальный сервер-заглушку по
+    docs/swagger.json (core/standin_server.py) и возвращает адрес этого сервера вместо BASE_URL.
+    """
+    if not STANDIN_SERVER:
+        yield BASE_URL
+        return
+    with build_server().run_in_thread() as url:
+        logger.info("Сервер-заглушка по docs/swagger.json запущен: %s", url)
+        yield url
+
+
 @pytest.fixture(scope="session", name="api_request_context")
 def api_request_context_fixture(
-    playwright_instance: Playwright,
+    playwright_instance: Playwright, base_url: str
 ) -> Generator[APIRequestContext]:
     """Создает и предоставляет APIRequestContext на всю сессию."""
-    logger.info("Создание APIRequestContext для BASE_URL: %s...", BASE_URL)
-    context = playwright_instance.request.new_context(base_url=BASE_URL, ignore_https_errors=True)
+    logger.info("Создание APIRequestContext для BASE_URL: %s...", base_url)
+    context = playwright_instance.request.new_context(base_url=base_url, ignore_https_errors=True)
     yield context
     logger.info("Уничтожение APIRequestContext...")
     context.dispose()
 
 
+@pytest.fixture(scope="session", name="retry_stats")
+def retry_stats_fixture(pytestconfig: pytest.Config) -> RetryStats:
+    """Предоставляет общие счетчики повторов (попадают в итог запуска)."""
+    return pytestconfig.stash[retry_stats_key]
+
+
+@pytest.fixture(scope="session", name="retry_policy")
+def retry_policy_fixture() -> RetryPolicy:
+    """Предоставляет политику повторов HTTP-запросов из конфигурации."""
+    return RetryPolicy(
+        max_attempts=RETRY_MAX_ATTEMPTS,
+        backoff_base=RETRY_BACKOFF_BASE,
+        backoff_max=RETRY_BACKOFF_MAX,
+    )
+
+
+@pytest.fixture(scope="session", name="circuit_breakers")
+def circuit_breakers_fixture() -> CircuitBreakerRegistry:
+    """
+    Предоставляет общие для сессии circuit breaker'ы по эндпоинтам.
+
+    Если API недоступно, запросы к эндпоинтам быстро падают c CircuitOpenError
+    вместо ожидания таймаута в каждом тесте.
+    """
+    return CircuitBreakerRegistry(
+        BreakerConfig(
+            consecutive_failures=BREAKER_CONSECUTIVE_FAILURES,
+            failure_rate=BREAKER_FAILURE_RATE,
+            reset_timeout=BREAKER_RESET_TIMEOUT,
+        )
+    )
+
+
+@pytest.fixture(scope="session", name="http_caches")
+def http_caches_fixture() -> dict[str, HTTPCache]:
+    """
+    Предоставляет кэши GET-ответов на всю сессию, по одному на токен.
+
+    Ответы, полученные c одним токеном, никогда не отдаются клиенту c другим токеном.
+    """
+    return {}
+
+
+@pytest.fixture(scope="session", name="contract_validator")
+def contract_validator_fixture(pytestconfig: pytest.Config) -> ContractValidator | None:
+    """
+    Предоставляет проверку ответов по docs/swagger.json (если включена API_CONTRACT_CHECK).
+
+    Нарушения не роняют тесты: они попадают в итог запуска.
+    """
+    if not CONTRACT_CHECK:
+        return None
+    return ContractValidator(pytestconfig.stash[contract_report_key])
+
+
+def _current_test() -> str:
+    """Id текущего теста без фазы (setup/call/teardown): область запросов в кассете."""
+    return os.getenv("PYTEST_CURRENT_TEST", "").rpartition(" ")[0]
+
+
+@pytest.fixture(scope="session", name="cassette_recorder")
+def cassette_recorder_fixture() -> Generator[CassetteRecorder | None]:
+    """
+    Записывает ответы API в кассету, если задан API_CASSETTE_RECORD.
+
+    Кассета сохраняется в конце сессии; под xdist каждый воркер пишет свой файл
+    `<имя>.gw<N><расширение>`.
+    """
+    if CASSETTE_RECORD is None:
+        yield None
+        return
+    recorder = CassetteRecorder(scope=_current_test)
+    yield recorder
+    path = worker_cassette_path(Path(CASSETTE_RECORD), os.getenv("PYTEST_XDIST_WORKER"))
+    recorder.save(path)
+    logger.info("Кассета записана: %s (ответов: %s)", path, len(recorder))
+
+
+@pytest.fixture(scope="session", name="cassette_replay")
+def cassette_replay_fixture() -> Generator[CassetteReplay | None]:
+    """
+    Предоставляет воспроизведение кассеты, если задан API_CASSETTE_REPLAY.
+
+    Клиенты тестов тогда работают через MockHTTPClient и не обращаются к API.
+    """
+    if CASSETTE_REPLAY is None:
+        yield None
+        return
+    paths = cassette_paths(Path(CASSETTE_REPLAY))
+    if not paths:
+        msg = f"Кассета {CASSETTE_REPLAY} не найдена"
+        raise FileNotFoundError(msg)
+    replay = CassetteReplay([Cassette(path) for path in paths], scope=_current_test)
+    yield replay
+    replay.close()
+
+
+def _interceptors(
+    caches: dict[str, HTTPCache],
+    token: str,
+    contract: ContractValidator | None,
+    recorder: CassetteRecorder | None,
+) -> list[Interceptor]:
+    """
+    Собирает перехватчики клиента: запись кассеты, контракт, кэш GET-ответов, стандартные.
+
+    Запись и проверка контракта стоят первыми, поэтому видят ответ после кэша (304 уже
+    заменен сохраненным ответом).
+    """
+    interceptors = default_interceptors()
+    if HTTP_CACHE_MAX_ENTRIES > 0:
+        cache = caches.setdefault(token, HTTPCache(max_entries=HTTP_CACHE_MAX_ENTRIES))
+        interceptors.insert(0, cache)
+    if contract is not None:
+        interceptors.insert(0, contract)
+    if recorder is not None:
+        interceptors.insert(0, recorder)
+    return interceptors
+
+
+@pytest.fixture(scope="session", name="make_http_client")
+def make_http_client_fixture(
+    retry_policy: RetryPolicy,
+    retry_stats: RetryStats,
+    circuit_breakers: CircuitBreakerRegistry,
+    http_caches: dict[str, HTTPCache],
+    contract_validator: ContractValidator | None,
+    cassette_recorder: CassetteRecorder | None,
+    cassette_replay: CassetteReplay | None,
+) -> Callable[[APIRequestContext, str], HTTPClient]:
+    """
+    Предоставляет фабрику HTTP клиентов c общими для сессии настройками.
+
+    Фабрика принимает контекст и токен (для кэша GET-ответов). При воспроизведении
+    кассеты она создает MockHTTPClient поверх кассеты вместо HTTPClient.
+    """
+
+    def make(api_context: APIRequestContext, token: str) -> HTTPClient:
+        interceptors = _interceptors(http_caches, token, contract_validator, cassette_recorder)
+        if cassette_replay is not None:
+            return MockHTTPClient(backend=cassette_replay, interceptors=interceptors)
+        return HTTPClient(
+            api_context=api_context,
+            retry_policy=retry_policy,
+            retry_stats=retry_stats,
+            circuit_breakers=circuit_breakers,
+            interceptors=interceptors,
+        )
+
+    return make
+
+
 @pytest.fixture(scope="session", name="http_client")
-def http_client_fixture(api_request_context: APIRequestContext) -> HTTPClient:
+def http_client_fixture(
+    api_request_context: APIRequestContext,
+    make_http_client: Callable[[APIRequestContext, str], HTTPClient],
+) -> HTTPClient:
     """Предоставляет экземпляр базового HTTP клиента на всю сессию."""
     logger.info("Создание HTTPClient...")
-    return HTTPClient(api_context=api_request_context)
+    return make_http_client(api_request_context, "")
 
 
 @pytest.fixture(scope="session", name="auth_client")
@@ -68,43 +359,67 @@ def user_client_fixture(http_client: HTTPClient) -> UserClient:
     return UserClient(http_client)
 
 
-@pytest.fixture(scope="session", name="auth_token")
-def auth_token_fixture(auth_client: AuthClient) -> str | None:
-    """
-    Выполняет вход тестового пользователя один раз за сессию и возвращает токен.
+@pytest.fixture(scope="session", name="token_store")
+def token_store_fixture(tmp_path_factory: pytest.TempPathFactory) -> TokenStore:
+    """Предоставляет хранилище токенов, общее для всех xdist-воркеров запуска."""
+    root = tmp_path_factory.getbasetemp()
+    if os.getenv("PYTEST_XDIST_WORKER"):
+        root = root.parent
+    return TokenStore(root / "auth_tokens.json")
+
 
-    Если вход не удался, прерывает выполнение тестов.
+@pytest.fixture(scope="session", name="token_provider")
+def token_provider_fixture(
+    auth_client: AuthClient, token_store: TokenStore, base_url: str
+) -> TokenProvider:
     """
-    logger.info(
-        "Попытка логина для получения сессионного токена (пользователь: %s)...",
-        TEST_USER_LOGIN,
-    )
-    if not TEST_USER_LOGIN or not TEST_USER_PASSWORD:
-        pytest.fail("Учетные данные тестового пользователя не настроены.", pytrace=False)
+    Предоставляет провайдер токена тестового пользователя.
 
-    payload = AuthPayload(login=TEST_USER_LOGIN, password=TEST_USER_PASSWORD)
-    try:
+    Логин выполняется один раз за запуск, не в каждом воркере. Токен обновляется заранее,
+    до истечения срока из JWT `exp`.
+    """
 
-        @pytest.mark.xfail(
-            reason="API нестабильно возвращает 500 вместо 200", raises=AssertionError, strict=False
+    @pytest.mark.xfail(
+        reason="API нестабильно возвращает 500 вместо 200", raises=AssertionError, strict=False
+    )
+    def attempt_login() -> str:
+        payload = AuthPayload(login=TEST_USER_LOGIN, password=TEST_USER_PASSWORD)
+        response: AuthSuccessResponse | CachedResponse = auth_client.login(
+            payload, expected_status=200
         )
-        def attempt_login() -> AuthSuccessResponse | APIResponse:
-            return auth_client.login(payload, expected_status=200)
-
-        response: AuthSuccessResponse | APIResponse = attempt_login()
-
         if isinstance(response, AuthSuccessResponse) and response.token:
             logger.info("Сессионный логин успешен.")
             return response.token
         raw_response_text = (
-            response.text() if isinstance(response, APIResponse) else "Ответ не является текстом"
+            response.text() if isinstance(response, CachedResponse) else "Ответ не является текстом"
         )
-        pytest.fail(
-            f"Ошибка сессионного логина: Неожиданный тип ответа {type(response)} или пустой токен. "
-            f"Тело ответа: {raw_response_text}",
-            pytrace=False,
+        msg = (
+            f"Неожиданный тип ответа {type(response)} или пустой токен. "
+            f"Тело ответа: {raw_response_text}"
         )
+        raise AssertionError(msg)
+
+    return TokenProvider(
+        login=attempt_login,
+        key=f"{base_url}|{TEST_USER_LOGIN}",
+        store=token_store,
+        refresh_margin=TOKEN_REFRESH_MARGIN,
+    )
+
+
+@pytest.fixture(name="auth_token")
+def auth_token_fixture(token_provider: TokenProvider) -> str | None:
+    """
+    Возвращает действующий токен тестового пользователя.
 
+    Токен берется из общего кэша запуска; логин выполняется, только если токена нет
+    или он скоро истечет. Если вход не удался, прерывает выполнение теста.
+    """
+    if not TEST_USER_LOGIN or not TEST_USER_PASSWORD:
+        pytest.fail("Учетные данные тестового пользователя не настроены.", pytrace=False)
+
+    try:
+        return token_provider.get_token()
     except (PlaywrightError, AssertionError) as e:
         pytest.fail(
             f"КРИТИЧЕСКАЯ ОШИБКА: He удалось выполнить сессионный логин для пользователя "
@@ -117,27 +432,39 @@ def auth_token_fixture(auth_client: AuthClient) -> str | None:
         return None
 
 
+@pytest.fixture(scope="session", name="context_pool")
+def context_pool_fixture(playwright_instance: Playwright) -> Generator[ContextPool]:
+    """Предоставляет пул прогретых APIRequestContext на всю сессию."""
+    pool = ContextPool(playwright_instance.request, ignore_https_errors=True)
+    yield pool
+    logger.info("Закрытие пула APIRequestContext...")
+    pool.close()
+
+
 @pytest.fixture
 def authenticated_api_req_context(
-    playwright_instance: Playwright, auth_token: str
+    context_pool: ContextPool, auth_token: str, base_url: str
 ) -> Generator[APIRequestContext]:
-    """Создает APIRequestContext  добавленным заголовком Authorization: Bearer."""
+    """
+    Выдает из пула APIRequestContext c заголовком Authorization: Bearer.
+
+    После теста контекст возвращается в пул вместе c открытыми соединениями.
+    """
     logger.info(
-        "\n[Fixture] Создание авторизованного APIRequestContext (токен: %s...)...", auth_token[:5]
+        "\n[Fixture] Аренда авторизованного APIRequestContext (токен: %s...)...", auth_token[:5]
     )
-    headers = {"Authorization": f"Bearer {auth_token}"}
-    context = playwright_instance.request.new_context(
-        base_url=BASE_URL, extra_http_headers=headers, ignore_https_errors=True
-    )
-    yield context
-    logger.info("[Fixture] Уничтожение авторизованного APIRequestContext...")
-    context.dispose()
+    with context_pool.lease(base_url, token=auth_token) as context:
+        yield context
 
 
 @pytest.fixture
-def authenticated_http_client(authenticated_api_req_context: APIRequestContext) -> HTTPClient:
-    """Создает HTTPClient, использующий авторизованный контекст."""
-    return HTTPClient(api_context=authenticated_api_req_context)
+def authenticated_http_client(
+    authenticated_api_req_context: APIRequestContext,
+    make_http_client: Callable[[APIRequestContext, str], HTTPClient],
+    auth_token: str,
+) -> HTTPClient:
+    """Создает HTTPClient, использующий авторизованный контекст и кэш GET-ответов токена."""
+    return make_http_client(authenticated_api_req_context, auth_token)
 
 
 @pytest.fixture
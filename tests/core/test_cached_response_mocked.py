@@ -0,0 +1,63 @@
+import json
+from unittest.mock import Mock
+
+import allure
+import pytest
+from playwright.sync_api import APIResponse
+
+from core.cached_response import CachedResponse
+from tests.mocks.mock_data import MOCK_REQUESTS_LIST
+
+
+def _playwright_response(body: bytes, status: int = 200) -> Mock:
+    """Создает Mock синхронного APIResponse c заданным телом."""
+    response = Mock(spec=APIResponse)
+    response.status = status
+    response.status_text = "OK"
+    response.url = "http://mock/api/request"
+    response.headers = {"content-type": "application/json"}
+    response.body.return_value = body
+    return response
+
+
+@allure.epic("HTTP клиент (Моки)")
+@allure.feature("Однократное чтение тела ответа (CachedResponse)")
+@pytest.mark.mocked
+class TestCachedResponse:
+    """Тесты CachedResponse: тело читается из драйвера один раз, text/json мемоизируются."""
+
+    @allure.title("Тест однократного чтения тела и мемоизации JSON")
+    @pytest.mark.positive
+    def test_body_is_read_once(self) -> None:
+        """Проверка, что повторные text()/json() не обращаются к драйверу."""
+        raw = _playwright_response(json.dumps(MOCK_REQUESTS_LIST).encode())
+        cached = CachedResponse.from_response(raw)
+
+        for _ in range(3):
+            assert cached.json() == MOCK_REQUESTS_LIST
+            assert cached.text().startswith("[")
+        assert cached.json() is cached.json()
+        raw.body.assert_called_once()
+        raw.json.assert_not_called()
+        raw.text.assert_not_called()
+        raw.dispose.assert_called_once()
+
+    @allure.title("Тест совместимости атрибутов c APIResponse")
+    @pytest.mark.positive
+    @pytest.mark.parametrize(("status", "ok"), [(200, True), (299, True), (404, False)])
+    def test_response_attributes(self, status: int, ok: bool) -> None:
+        """Проверка status/ok/url/headers, которые используют клиенты."""
+        cached = CachedResponse.from_response(_playwright_response(b"{}", status=status))
+        assert cached.status == status
+        assert cached.ok is ok
+        assert cached.url == "http://mock/api/request"
+        assert cached.headers["content-type"] == "application/json"
+
+    @allure.title("Тест ошибки разбора не-JSON тела")
+    @pytest.mark.negative
+    def test_invalid_json_raises(self) -> None:
+        """Проверка, что json() для текстового тела дает JSONDecodeError, как APIResponse."""
+        cached = CachedResponse.from_response(_playwright_response("Вклад внесен".encode()))
+        assert cached.text() == "Вклад внесен"
+        with pytest.raises(json.JSONDecodeError):
+            cached.json()
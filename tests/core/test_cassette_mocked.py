@@ -0,0 +1,113 @@
+import logging
+from pathlib import Path
+
+import allure
+import pytest
+
+from api.endpoints import APIEndpoints
+from core.cassette import (
+    Cassette,
+    CassetteMissError,
+    CassetteRecorder,
+    CassetteReplay,
+    cassette_paths,
+    worker_cassette_path,
+)
+from core.mock_http_client import MockHTTPClient
+from tests.mocks.conftest import fake_backend, fake_http_client  # noqa: F401
+from tests.mocks.mock_data import MOCK_HELP_REQUEST_DATA
+
+logger = logging.getLogger(__name__)
+
+REQUEST_ID = MOCK_HELP_REQUEST_DATA["id"]
+FAVOURITES = APIEndpoints.USER_FAVOURITES.value
+
+
+def journey(client: MockHTTPClient) -> list[tuple[int, bytes]]:
+    """Сценарий c состоянием: избранное до и после добавления, детали запроса."""
+    client.default_headers["Authorization"] = (
+        "Bearer "
+        + client.post(
+            APIEndpoints.AUTH.value,
+            json={"login": "factory@example.com", "password": "factory-password-123"},
+        ).json()["token"]
+    )
+    responses = [
+        client.get(FAVOURITES),
+        client.post(FAVOURITES, json={"requestId": REQUEST_ID}),
+        client.get(FAVOURITES),
+        client.get(APIEndpoints.REQUEST_DETAIL.format(id=REQUEST_ID)),
+    ]
+    return [(response.status, response.body()) for response in responses]
+
+
+@allure.epic("HTTP клиент (Моки)")
+@allure.feature("Запись и воспроизведение кассет")
+@pytest.mark.mocked
+class TestCassetteMocked:
+    """Мок-тесты записи ответов в кассету и их воспроизведения."""
+
+    @allure.title("Тест записи и воспроизведения сценария c состоянием")
+    @pytest.mark.positive
+    def test_record_and_replay(
+        self,
+        fake_http_client: MockHTTPClient,  # noqa: F811
+        tmp_path: Path,
+    ) -> None:
+        """Проверка: воспроизведение отдает те же ответы в том же порядке, без бэкенда."""
+        recorder = CassetteRecorder()
+        fake_http_client.interceptors.add(recorder, index=0)
+        recorded = journey(fake_http_client)
+        path = tmp_path / "session.cassette"
+        recorder.save(path)
+
+        cassette = Cassette(path)
+        replay = CassetteReplay([cassette])
+        replayed = journey(MockHTTPClient(backend=replay, interceptors=[]))
+        replay.close()
+
+        assert replayed == recorded
+        assert len(recorder) == len(cassette) == 5
+        assert recorded[0] != recorded[2]
+
+    @allure.title("Тест области записи и ошибки отсутствующей записи")
+    @pytest.mark.negative
+    def test_scope_fallback_and_miss(
+        self,
+        fake_http_client: MockHTTPClient,  # noqa: F811
+        tmp_path: Path,
+    ) -> None:
+        """Проверка: ответ ищется сначала в области теста, затем без нее; нет записи - ошибка."""
+        scope = ["test_a"]
+        recorder = CassetteRecorder(scope=lambda: scope[0])
+        fake_http_client.interceptors.add(recorder, index=0)
+        fake_http_client.get(FAVOURITES)
+        scope[0] = "test_b"
+        fake_http_client.post(APIEndpoints.REQUEST_CONTRIBUTION.format(id=REQUEST_ID))
+        fake_http_client.post(APIEndpoints.REQUEST_CONTRIBUTION.format(id="missing"))
+        path = tmp_path / "scoped.cassette"
+        recorder.save(path)
+
+        replay = CassetteReplay([Cassette(path)], scope=lambda: scope[0])
+        client = MockHTTPClient(backend=replay, interceptors=[])
+        scope[0] = "test_c"
+
+        assert client.get(FAVOURITES).status == 401
+        assert client.post(APIEndpoints.REQUEST_CONTRIBUTION.format(id="missing")).status == 404
+        with pytest.raises(CassetteMissError, match="/api/request"):
+            client.get(APIEndpoints.REQUESTS.value)
+        replay.close()
+
+    @allure.title("Тест файлов кассет воркеров и некорректного файла")
+    @pytest.mark.negative
+    def test_worker_files_and_bad_file(self, tmp_path: Path) -> None:
+        """Проверка: воркеры пишут свои файлы, воспроизведение их находит; чужой файл - ошибка."""
+        path = tmp_path / "run.cassette"
+        for worker in ("gw0", "gw1"):
+            CassetteRecorder().save(worker_cassette_path(path, worker))
+        (tmp_path / "broken.cassette").write_bytes(b"not a cassette")
+
+        assert worker_cassette_path(path, None) == path
+        assert [p.name for p in cassette_paths(path)] == ["run.gw0.cassette", "run.gw1.cassette"]
+        with pytest.raises(ValueError, match="not a cassette"):
+            Cassette(tmp_path / "broken.cassette")
@@ -0,0 +1,154 @@
+import logging
+from unittest.mock import Mock
+
+import allure
+import pytest
+from playwright.sync_api import APIRequestContext, APIResponse
+
+from api.endpoints import APIEndpoints
+from core.circuit_breaker import (
+    BreakerConfig,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    CircuitState,
+)
+from core.http_client import HTTPClient
+
+logger = logging.getLogger(__name__)
+
+
+class FakeClock:
+    """Управляемые тестом часы для circuit breaker."""
+
+    def __init__(self) -> None:
+        """Начинает отсчет c нуля."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Возвращает текущее время в секундах."""
+        return self.now
+
+
+def _raw_response(status: int) -> Mock:
+    """Создает Mock APIResponse Playwright c заданным статусом."""
+    response = Mock(spec=APIResponse)
+    response.status = status
+    response.status_text = "OK" if status == 200 else "Error"
+    response.url = "http://mock/api/request"
+    response.headers = {"content-type": "application/json"}
+    response.body.return_value = b"{}"
+    return response
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Предоставляет управляемые часы."""
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> CircuitBreaker:
+    """Предоставляет circuit breaker: 3 ошибки подряд, пауза 30 секунд."""
+    config = BreakerConfig(consecutive_failures=3, min_calls=10, reset_timeout=30)
+    return CircuitBreaker("REQUEST_DETAIL", config, clock)
+
+
+@allure.epic("HTTP клиент (Моки)")
+@allure.feature("Circuit breaker по эндпоинтам")
+@pytest.mark.mocked
+class TestCircuitBreakerMocked:
+    """Мок-тесты circuit breaker и интеграции c HTTPClient."""
+
+    @allure.title("Тест размыкания после ошибок подряд")
+    @pytest.mark.negative
+    def test_opens_after_consecutive_failures(self, breaker: CircuitBreaker) -> None:
+        """Проверка, что после порога ошибок подряд вызовы отклоняются сразу."""
+        for _ in range(3):
+            breaker.before_call()
+            breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError, match="REQUEST_DETAIL"):
+            breaker.before_call()
+
+    @allure.title("Тест размыкания по доле ошибок")
+    @pytest.mark.negative
+    def test_opens_on_failure_rate(self, clock: FakeClock) -> None:
+        """Проверка, что чередование ошибок и успехов размыкает цепь по доле ошибок."""
+        config = BreakerConfig(consecutive_failures=5, failure_rate=0.5, window=10, min_calls=10)
+        breaker = CircuitBreaker("REQUESTS", config, clock)
+        for _ in range(5):
+            breaker.record_success()
+            breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+
+    @allure.title("Тест восстановления через полуоткрытое состояние")
+    @pytest.mark.positive
+    def test_half_open_trial_success_closes(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        """Проверка, что после паузы пропускается один пробный запрос и успех замыкает цепь."""
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 30.0
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_success()
+
+        assert breaker.state is CircuitState.CLOSED
+        breaker.before_call()
+
+    @allure.title("Тест повторного размыкания при неудачном пробном запросе")
+    @pytest.mark.negative
+    def test_half_open_trial_failure_reopens(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        """Проверка, что ошибка пробного запроса снова размыкает цепь на полную паузу."""
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 30.0
+        breaker.before_call()
+        breaker.record_failure()
+
+        clock.now = 59.0
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    @allure.title("Тест общей цепи для шаблона эндпоинта")
+    @pytest.mark.positive
+    def test_registry_keys_by_endpoint_template(self) -> None:
+        """Проверка, что разные id запроса попадают в одну цепь REQUEST_DETAIL."""
+        registry = CircuitBreakerRegistry()
+        first = registry.for_endpoint(APIEndpoints.REQUEST_DETAIL.format(id="1"))
+        second = registry.for_endpoint(APIEndpoints.REQUEST_DETAIL.format(id="2"))
+        contribution = registry.for_endpoint(APIEndpoints.REQUEST_CONTRIBUTION.format(id="1"))
+
+        assert first is second
+        assert first.key == "REQUEST_DETAIL"
+        assert contribution.key == "REQUEST_CONTRIBUTION"
+        assert APIEndpoints.resolve("/api/unknown") is None
+
+    @allure.title("Тест быстрого отказа HTTPClient при разомкнутой цепи")
+    @pytest.mark.negative
+    def test_http_client_fails_fast_when_open(self, clock: FakeClock) -> None:
+        """Проверка, что при разомкнутой цепи запрос не отправляется, a 4xx не считается ошибкой."""
+        api_context = Mock(spec=APIRequestContext)
+        registry = CircuitBreakerRegistry(BreakerConfig(consecutive_failures=2), clock)
+        client = HTTPClient(api_context=api_context, circuit_breakers=registry)
+
+        api_context.fetch.side_effect = [_raw_response(404), _raw_response(404)]
+        client.get(APIEndpoints.REQUEST_DETAIL.format(id="1"))
+        client.get(APIEndpoints.REQUEST_DETAIL.format(id="2"))
+        api_context.fetch.side_effect = [_raw_response(500), _raw_response(503)]
+        client.get(APIEndpoints.REQUEST_DETAIL.format(id="3"))
+        client.get(APIEndpoints.REQUEST_DETAIL.format(id="4"))
+
+        with pytest.raises(CircuitOpenError):
+            client.get(APIEndpoints.REQUEST_DETAIL.format(id="5"))
+        assert api_context.fetch.call_count == 4
+        assert registry.states() == {"REQUEST_DETAIL": CircuitState.OPEN}
@@ -0,0 +1,104 @@
+import logging
+from unittest.mock import Mock
+
+import allure
+import pytest
+from playwright.sync_api import APIRequest, APIRequestContext, APIResponse
+
+from core.context_pool import ContextPool
+from core.http_client import HTTPClient
+
+logger = logging.getLogger(__name__)
+
+BASE_URL = "http://mock"
+
+
+@pytest.fixture
+def playwright_request() -> Mock:
+    """Предоставляет мок APIRequest, создающий новый мок-контекст при каждом вызове."""
+    request = Mock(spec=APIRequest)
+    request.new_context.side_effect = lambda **_: Mock(spec=APIRequestContext)
+    return request
+
+
+@pytest.fixture
+def pool(playwright_request: Mock) -> ContextPool:
+    """Предоставляет пул c одним простаивающим контекстом на ключ."""
+    return ContextPool(playwright_request, max_idle_per_key=1, ignore_https_errors=True)
+
+
+@allure.epic("HTTP клиент (Моки)")
+@allure.feature("Пул APIRequestContext")
+@pytest.mark.mocked
+class TestContextPoolMocked:
+    """Мок-тесты пула контекстов и подстановки заголовков в HTTPClient."""
+
+    @allure.title("Тест повторного использования контекста")
+    @pytest.mark.positive
+    def test_context_reused_for_same_key(self, pool: ContextPool, playwright_request: Mock) -> None:
+        """Проверка, что после возврата в пул контекст выдается снова, без new_context."""
+        with pool.lease(BASE_URL, "token-1") as first:
+            pass
+        with pool.lease(BASE_URL, "token-1") as second:
+            pass
+
+        assert first is second
+        assert playwright_request.new_context.call_count == 1
+        playwright_request.new_context.assert_called_once_with(
+            base_url=BASE_URL,
+            extra_http_headers={"Authorization": "Bearer token-1"},
+            ignore_https_errors=True,
+        )
+        assert (pool.created, pool.reused) == (1, 1)
+
+    @allure.title("Тест разных ключей пула")
+    @pytest.mark.positive
+    def test_different_token_gets_own_context(self, pool: ContextPool) -> None:
+        """Проверка, что контексты разных пользователей не смешиваются."""
+        with pool.lease(BASE_URL, "token-1") as first:
+            pass
+        with pool.lease(BASE_URL, "token-2") as second:
+            pass
+
+        assert first is not second
+
+    @allure.title("Тест освобождения лишних и оставшихся контекстов")
+    @pytest.mark.positive
+    def test_extra_contexts_disposed(self, pool: ContextPool, playwright_request: Mock) -> None:
+        """Проверка, что лишние контексты уничтожаются при возврате, остальные - при close()."""
+        first, second = Mock(spec=APIRequestContext), Mock(spec=APIRequestContext)
+        playwright_request.new_context.side_effect = [first, second]
+        pool.release(pool.acquire(BASE_URL))
+        leased = [pool.acquire(BASE_URL), pool.acquire(BASE_URL)]
+        for context in leased:
+            pool.release(context)
+
+        second.dispose.assert_called_once()
+        first.dispose.assert_not_called()
+        pool.close()
+        first.dispose.assert_called_once()
+
+    @allure.title("Тест подстановки заголовков по умолчанию")
+    @pytest.mark.positive
+    def test_default_headers_injected_per_request(self) -> None:
+        """Проверка, что заголовки клиента добавляются к запросу, a заголовки запроса важнее."""
+        api_context = Mock(spec=APIRequestContext)
+        response = Mock(spec=APIResponse)
+        response.status = 200
+        response.status_text = "OK"
+        response.url = f"{BASE_URL}/api/user"
+        response.headers = {}
+        response.body.return_value = b"{}"
+        api_context.fetch.return_value = response
+        client = HTTPClient(
+            api_context=api_context, default_headers={"Authorization": "Bearer shared"}
+        )
+
+        client.get("/api/user", headers={"X-Trace": "1"})
+        client.get("/api/user", headers={"Authorization": "Bearer own"})
+
+        sent_headers = [call.kwargs["headers"] for call in api_context.fetch.call_args_list]
+        assert sent_headers == [
+            {"Authorization": "Bearer shared", "X-Trace": "1"},
+            {"Authorization": "Bearer own"},
+        ]
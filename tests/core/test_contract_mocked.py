@@ -0,0 +1,141 @@
+import json
+import logging
+from unittest.mock import Mock
+
+import allure
+import pytest
+from playwright.sync_api import APIRequestContext, APIResponse
+
+from core.cached_response import CachedResponse
+from core.contract import ContractReport, ContractValidator
+from core.http_cache import HTTPCache
+from core.http_client import HTTPClient
+from core.request_spec import RequestSpec
+from tests.mocks.mock_data import MOCK_FAVOURITES_ADD_SUCCESS_TEXT, MOCK_REQUESTS_LIST
+
+logger = logging.getLogger(__name__)
+
+
+def _response(status: int, body: object) -> CachedResponse:
+    """Создает CachedResponse; строки передаются как текст, остальное - как JSON."""
+    raw = body.encode() if isinstance(body, str) else json.dumps(body).encode()
+    return CachedResponse(status=status, url="http://mock", headers={}, body=raw)
+
+
+@pytest.fixture
+def report() -> ContractReport:
+    """Предоставляет пустой отчет нарушений контракта."""
+    return ContractReport()
+
+
+@pytest.fixture
+def validator(report: ContractReport) -> ContractValidator:
+    """Предоставляет проверку ответов по docs/swagger.json."""
+    return ContractValidator(report)
+
+
+@allure.epic("HTTP клиент (Моки)")
+@allure.feature("Проверка ответов по контракту docs/swagger.json")
+@pytest.mark.mocked
+class TestContractValidatorMocked:
+    """Мок-тесты проверки ответов по спецификации."""
+
+    @allure.title("Тест ответов, соответствующих спецификации")
+    @pytest.mark.positive
+    @pytest.mark.parametrize(
+        ("spec", "response"),
+        [
+            (RequestSpec("get", "/api/request"), _response(200, MOCK_REQUESTS_LIST)),
+            (RequestSpec("GET", "/api/request/42?x=1"), _response(200, MOCK_REQUESTS_LIST[0])),
+            (
+                RequestSpec("POST", "/api/user/favourites"),
+                _response(200, MOCK_FAVOURITES_ADD_SUCCESS_TEXT),
+            ),
+            (RequestSpec("GET", "/api/user"), _response(401, "")),
+        ],
+    )
+    def test_conforming_responses(
+        self,
+        validator: ContractValidator,
+        report: ContractReport,
+        spec: RequestSpec,
+        response: CachedResponse,
+    ) -> None:
+        """Проверка: JSON и text/plain тела и документированные статусы без тела проходят."""
+        assert validator.on_response(spec, response) is response
+        assert report.total == 0
+
+    @allure.title("Тест нарушений контракта")
+    @pytest.mark.negative
+    @pytest.mark.parametrize(
+        ("spec", "response", "problem"),
+        [
+            (
+                RequestSpec("GET", "/api/request/1"),
+                _response(200, {"requestGoal": "много"}),
+                "GET /api/request/{id} 200: requestGoal:",
+            ),
+            (
+                RequestSpec("GET", "/api/request"),
+                _response(418, ""),
+                "GET /api/request 418: status is not documented",
+            ),
+            (
+                RequestSpec("GET", "/api/unknown"),
+                _response(200, {}),
+                "GET /api/unknown 200: endpoint is not described in the spec",
+            ),
+        ],
+    )
+    def test_violations_recorded(
+        self,
+        validator: ContractValidator,
+        report: ContractReport,
+        spec: RequestSpec,
+        response: CachedResponse,
+        problem: str,
+    ) -> None:
+        """Проверка, что нарушение записывается в отчет, a ответ возвращается без ошибки."""
+        assert validator.on_response(spec, response) is response
+        [(violation, count)] = report.snapshot().items()
+        assert violation.startswith(problem)
+        assert count == 1
+
+    @allure.title("Тест однократной проверки ответа из кэша")
+    @pytest.mark.positive
+    def test_cached_response_checked_once(
+        self, validator: ContractValidator, report: ContractReport
+    ) -> None:
+        """Проверка: повторно отданный кэшем ответ не валидируется и не учитывается заново."""
+        api_context = Mock(spec=APIRequestContext)
+        raw = Mock(spec=APIResponse)
+        raw.status = 200
+        raw.status_text = "OK"
+        raw.url = "http://mock/api/request/1"
+        raw.headers = {"cache-control": "max-age=60"}
+        raw.body.return_value = b'{"id": "1", "requestGoal": "many"}'
+        api_context.fetch.return_value = raw
+        client = HTTPClient(
+            api_context=api_context, interceptors=[validator, HTTPCache(max_entries=4)]
+        )
+        check = Mock(wraps=validator.check)
+        validator.check = check
+
+        first = client.get("/api/request/1")
+        second = client.get("/api/request/1")
+
+        assert first is second
+        assert check.call_count == 1
+        [(violation, count)] = report.snapshot().items()
+        assert violation.startswith("GET /api/request/{id} 200: requestGoal:")
+        assert count == 1
+
+    @allure.title("Тест объединения отчетов xdist-воркеров")
+    @pytest.mark.positive
+    def test_report_merge(self, report: ContractReport) -> None:
+        """Проверка, что счетчики воркеров складываются в общий отчет."""
+        report.record("GET /api/user 200", "birthdate: invalid")
+        report.merge({"GET /api/user 200: birthdate: invalid": 2, "GET /x 200: y": 1})
+
+        assert report.total == 4
+        assert next(iter(report.snapshot().items())) == ("GET /api/user 200: birthdate: invalid", 3)
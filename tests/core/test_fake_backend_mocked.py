@@ -0,0 +1,146 @@
+import logging
+
+import allure
+import pytest
+
+from api.auth.client import AuthClient
+from api.auth.models import AuthPayload, AuthSuccessResponse
+from api.endpoints import APIEndpoints
+from api.request.client import RequestClient
+from api.request.models import HelpRequestData
+from api.user.client import UserClient
+from api.user.models import AddToFavouritesPayload, FavouritesSet, UserDataResponse
+from core.fake_backend import FakeCharityBackend
+from core.mock_http_client import MockHTTPClient
+from tests.mocks.conftest import fake_backend, fake_http_client  # noqa: F401
+from tests.mocks.mock_data import (
+    MOCK_FAVOURITES_LIST,
+    MOCK_HELP_REQUEST_DATA,
+    MOCK_SERVER_ERROR_500,
+    MOCK_USER_DATA,
+    MOCK_USER_LOGIN,
+    MOCK_USER_PASSWORD,
+)
+from utils.mock_factory import MockFactory
+
+logger = logging.getLogger(__name__)
+
+REQUEST_ID = MOCK_HELP_REQUEST_DATA["id"]
+
+
+def login(client: MockHTTPClient) -> str:
+    """Логинится через AuthClient и подставляет токен в заголовки клиента."""
+    auth = AuthClient(http_client=client).login(
+        AuthPayload(login=MOCK_USER_LOGIN, password=MOCK_USER_PASSWORD)
+    )
+    assert isinstance(auth, AuthSuccessResponse)
+    client.default_headers["Authorization"] = f"Bearer {auth.token}"
+    return auth.token
+
+
+@allure.epic("HTTP клиент (Моки)")
+@allure.feature("Фейковый бэкенд c состоянием")
+@pytest.mark.mocked
+class TestFakeBackendMocked:
+    """Мок-тесты пользовательских сценариев на FakeCharityBackend."""
+
+    @allure.title("Тест сценария избранного: добавление видно в последующих запросах")
+    @pytest.mark.positive
+    def test_favourites_journey(
+        self,
+        fake_http_client: MockHTTPClient,  # noqa: F811
+        fake_backend: FakeCharityBackend,  # noqa: F811
+    ) -> None:
+        """Проверка: добавленный запрос появляется в избранном и профиле, удаленный - исчезает."""
+        login(fake_http_client)
+        users = UserClient(http_client=fake_http_client)
+
+        users.add_to_favourites(AddToFavouritesPayload(requestId=REQUEST_ID))
+        favourites = users.get_favourites(as_set=True)
+        profile = users.get_user_info()
+
+        assert isinstance(favourites, FavouritesSet)
+        assert list(favourites) == [*MOCK_USER_DATA["favouriteRequests"], REQUEST_ID]
+        assert isinstance(profile, UserDataResponse)
+        assert REQUEST_ID in profile.favourite_requests
+
+        users.remove_from_favourites(REQUEST_ID)
+        users.remove_from_favourites(REQUEST_ID, expected_status=400)
+        assert fake_backend.favourites_of(MOCK_USER_LOGIN) == MOCK_USER_DATA["favouriteRequests"]
+
+    @allure.title("Тест вклада: счетчик участников растет")
+    @pytest.mark.positive
+    def test_contribution_increments_contributors(
+        self,
+        fake_http_client: MockHTTPClient,  # noqa: F811
+        fake_backend: FakeCharityBackend,  # noqa: F811
+    ) -> None:
+        """Проверка: вклад увеличивает contributors_count в деталях и в списке запросов."""
+        requests = RequestClient(http_client=fake_http_client)
+        before = requests.get_request_details(REQUEST_ID)
+        assert isinstance(before, HelpRequestData)
+
+        requests.contribute_to_request(REQUEST_ID)
+        requests.contribute_to_request(REQUEST_ID)
+        after = requests.get_request_details(REQUEST_ID)
+        listed = requests.get_all_requests()
+
+        assert isinstance(after, HelpRequestData)
+        assert isinstance(listed, list)
+        assert before.contributors_count == MOCK_HELP_REQUEST_DATA["contributorsCount"]
+        assert after.contributors_count == MOCK_HELP_REQUEST_DATA["contributorsCount"] + 2
+        assert {item.id: item.contributors_count for item in listed}[REQUEST_ID] == (
+            after.contributors_count
+        )
+        assert len(listed) == 1 + len(MOCK_FAVOURITES_LIST)
+        assert fake_backend.help_request(REQUEST_ID) == after.model_dump(
+            mode="json", by_alias=True, exclude_unset=True
+        )
+
+    @allure.title("Тест вклада в запрос без счетчика участников")
+    @pytest.mark.positive
+    def test_contribution_to_null_count(
+        self,
+        fake_http_client: MockHTTPClient,  # noqa: F811
+        fake_backend: FakeCharityBackend,  # noqa: F811
+    ) -> None:
+        """Проверка: вклад в запрос c contributorsCount = null дает счетчик 1."""
+        fake_backend.add_request({**MOCK_HELP_REQUEST_DATA, "contributorsCount": None})
+        requests = RequestClient(http_client=fake_http_client)
+
+        requests.contribute_to_request(REQUEST_ID)
+        details = requests.get_request_details(REQUEST_ID)
+
+        assert isinstance(details, HelpRequestData)
+        assert details.contributors_count == 1
+
+    @allure.title("Тест ошибок фейкового бэкенда")
+    @pytest.mark.negative
+    def test_errors(self, fake_http_client: MockHTTPClient) -> None:  # noqa: F811
+        """Проверка: 400 на неверный пароль, 401 без токена, 404 на неизвестный запрос."""
+        auth = AuthClient(http_client=fake_http_client)
+        users = UserClient(http_client=fake_http_client)
+        requests = RequestClient(http_client=fake_http_client)
+
+        wrong = AuthPayload(login=MOCK_USER_LOGIN, password=MOCK_USER_PASSWORD[::-1])
+        auth.login(wrong, expected_status=400)
+        users.get_user_info(expected_status=401)
+        users.get_favourites(expected_status=401)
+        requests.get_request_details("missing", expected_status=404)
+        requests.contribute_to_request("missing", expected_status=404)
+        fake_http_client.default_headers["Authorization"] = "Bearer forged"
+        users.get_favourites(expected_status=401)
+        login(fake_http_client)
+        assert fake_http_client.post(APIEndpoints.USER_FAVOURITES.value, json={}).status == 400
+
+    @allure.title("Тест приоритета мока над фейковым бэкендом")
+    @pytest.mark.negative
+    def test_mock_overrides_backend(self, fake_http_client: MockHTTPClient) -> None:  # noqa: F811
+        """Проверка: настроенный мок подменяет ответ бэкенда только для своего эндпоинта."""
+        MockFactory(fake_http_client).setup_mock(
+            "GET", APIEndpoints.REQUESTS, 500, json_data=MOCK_SERVER_ERROR_500
+        )
+        requests = RequestClient(http_client=fake_http_client)
+
+        requests.get_all_requests(expected_status=500)
+        assert isinstance(requests.get_request_details(REQUEST_ID), HelpRequestData)
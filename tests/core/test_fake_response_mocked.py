@@ -0,0 +1,104 @@
+import json
+import logging
+import random
+
+import allure
+import pytest
+
+from api.endpoints import APIEndpoints
+from api.request.models import HelpRequestData
+from core.fake_response import FakeAPIResponse
+from core.fault_injection import FaultInjector, FaultProfile
+from core.mock_http_client import MockHTTPClient
+from core.request_spec import RequestSpec
+from core.retry import RetryPolicy
+from core.validation import validate_body
+from tests.mocks.mock_data import (
+    MOCK_CONTRIBUTION_SUCCESS_TEXT,
+    MOCK_HELP_REQUEST_DATA,
+    MOCK_SERVER_ERROR_500,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@allure.epic("HTTP клиент (Моки)")
+@allure.feature("FakeAPIResponse")
+@pytest.mark.mocked
+class TestFakeAPIResponseMocked:
+    """Мок-тесты легковесного мок-ответа FakeAPIResponse."""
+
+    @allure.title("Тест JSON-ответа c заранее сериализованным телом")
+    @pytest.mark.positive
+    def test_json_response(self) -> None:
+        """Проверка: тело сериализовано заранее, json() отдает исходный объект без разбора."""
+        response = FakeAPIResponse(200, json_data=MOCK_HELP_REQUEST_DATA, url="/api/request/1")
+
+        assert response.ok
+        assert response.json() is MOCK_HELP_REQUEST_DATA
+        assert json.loads(response.body()) == MOCK_HELP_REQUEST_DATA
+        assert response.text() == response.body().decode()
+        assert response.headers == {"content-type": "application/json"}
+        assert response.url == "/api/request/1"
+
+    @allure.title("Тест текстового ответа и переопределения ok")
+    @pytest.mark.negative
+    def test_text_response_and_ok_override(self) -> None:
+        """Проверка: text/plain не разбирается как JSON, ok можно задать независимо от статуса."""
+        text = FakeAPIResponse(200, text_data=MOCK_CONTRIBUTION_SUCCESS_TEXT)
+        empty = FakeAPIResponse(204)
+        forced = FakeAPIResponse(500, json_data=MOCK_SERVER_ERROR_500, ok=True)
+
+        assert text.text() == MOCK_CONTRIBUTION_SUCCESS_TEXT
+        assert text.headers["content-type"].startswith("text/plain")
+        with pytest.raises(json.JSONDecodeError):
+            text.json()
+        with pytest.raises(json.JSONDecodeError):
+            empty.json()
+        assert forced.ok
+        assert not FakeAPIResponse(500).ok
+
+    @allure.title("Тест валидации мок-ответа как реального")
+    @pytest.mark.positive
+    def test_validated_like_cached_response(self) -> None:
+        """Проверка: модель валидируется из байтов тела один раз и запоминается."""
+        response = FakeAPIResponse(200, json_data=MOCK_HELP_REQUEST_DATA)
+
+        first = validate_body(response, HelpRequestData)
+
+        assert isinstance(first, HelpRequestData)
+        assert validate_body(response, HelpRequestData) is first
+
+    @allure.title("Тест отдельного ответа на каждый вызов мока")
+    @pytest.mark.positive
+    def test_each_call_gets_own_response(self) -> None:
+        """Проверка: попытки и запомненные модели одного вызова не видны другим вызовам."""
+        mock = FakeAPIResponse(200, json_data=MOCK_HELP_REQUEST_DATA)
+        client = MockHTTPClient(interceptors=[])
+        client.set_mock_response("GET", APIEndpoints.REQUEST_DETAIL.value, mock)
+        spec = RequestSpec("GET", f"/api/request/{MOCK_HELP_REQUEST_DATA['id']}", idempotent=True)
+
+        first, second = client.send(spec), client.send(spec)
+
+        assert first is not second
+        assert first.body() is second.body() is mock.body()
+        assert validate_body(first, HelpRequestData) is not validate_body(second, HelpRequestData)
+
+        client.faults = FaultInjector(
+            {("GET", APIEndpoints.REQUEST_DETAIL.value): FaultProfile(fail_first=1)}
+        )
+        client.retry_policy = RetryPolicy(max_attempts=2, backoff_base=0, rng=random.Random(0))
+        results = client.execute_many([spec] * 4, max_concurrency=4)
+
+        attempts = [result.response.attempts for result in results if result.response]
+        assert sorted(attempts) == [1, 1, 1, 2]
+        assert mock.attempts == 1
+
+    @allure.title("Тест отсутствия транспорта в MockHTTPClient")
+    @pytest.mark.negative
+    def test_mock_client_has_no_transport(self) -> None:
+        """Проверка: обращение к контексту Playwright в MockHTTPClient - явная ошибка."""
+        client = MockHTTPClient()
+
+        with pytest.raises(RuntimeError, match="fetch"):
+            client.api_request_context.fetch("/api/user")
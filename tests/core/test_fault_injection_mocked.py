@@ -0,0 +1,133 @@
+import logging
+import random
+import statistics
+import time
+from dataclasses import replace
+
+import allure
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from api.endpoints import APIEndpoints
+from core.fake_backend import FakeCharityBackend
+from core.fake_response import FakeAPIResponse
+from core.fault_injection import (
+    PLANNED_SERVER_ERROR,
+    FaultInjector,
+    FaultProfile,
+    FixedLatency,
+    LogNormalLatency,
+    UniformLatency,
+)
+from core.mock_http_client import MockHTTPClient
+from core.request_spec import RequestSpec
+from core.retry import RetryPolicy
+from tests.mocks.conftest import fake_backend  # noqa: F401
+from tests.mocks.mock_data import MOCK_HELP_REQUEST_DATA, MOCK_USER_LOGIN, MOCK_USER_PASSWORD
+
+logger = logging.getLogger(__name__)
+
+AUTH = ("POST", APIEndpoints.AUTH.value)
+DETAIL = ("GET", APIEndpoints.REQUEST_DETAIL.value)
+CREDENTIALS = {"login": MOCK_USER_LOGIN, "password": MOCK_USER_PASSWORD}
+
+
+def run(injector: FaultInjector, spec: RequestSpec, calls: int) -> list[int]:
+    """Выполняет запрос несколько раз через инжектор, возвращает статусы."""
+    ok = FakeAPIResponse(200, json_data={})
+    return [injector.inject(spec, lambda: ok).status for _ in range(calls)]
+
+
+@allure.epic("HTTP клиент (Моки)")
+@allure.feature("Внесение задержек и ошибок (FaultInjector)")
+@pytest.mark.mocked
+class TestFaultInjectionMocked:
+    """Мок-тесты профилей задержек и ошибок MockHTTPClient."""
+
+    @allure.title("Тест распределений задержек и воспроизводимости по seed")
+    @pytest.mark.positive
+    def test_latency_distributions_are_seeded(self) -> None:
+        """Проверка: задержки в границах распределений, один seed - та же последовательность."""
+        spec = RequestSpec("GET", "/api/request/42")
+
+        def delays(seed: int, profile: FaultProfile) -> list[float]:
+            slept: list[float] = []
+            injector = FaultInjector({DETAIL: profile}, seed=seed, sleep=slept.append)
+            run(injector, spec, 2000)
+            return slept
+
+        uniform = delays(1, FaultProfile(latency=UniformLatency(0.01, 0.02)))
+        heavy = delays(1, FaultProfile(latency=LogNormalLatency(0.05, sigma=1.0, cap=2.0)))
+
+        assert uniform == delays(1, FaultProfile(latency=UniformLatency(0.01, 0.02)))
+        assert uniform != delays(2, FaultProfile(latency=UniformLatency(0.01, 0.02)))
+        assert all(0.01 <= delay <= 0.02 for delay in uniform)
+        assert delays(0, FaultProfile(latency=FixedLatency(0.03))) == [0.03] * 2000
+        assert 0.04 < statistics.median(heavy) < 0.06
+        assert statistics.quantiles(heavy, n=100)[98] > 5 * statistics.median(heavy)
+        assert max(heavy) <= 2.0
+
+    @allure.title("Тест 30% ошибок 500 на POST /api/auth и восстановления повторами")
+    @pytest.mark.positive
+    def test_error_rate_recovered_by_retries(
+        self,
+        fake_backend: FakeCharityBackend,  # noqa: F811
+    ) -> None:
+        """Проверка: доля ошибок как в профиле, другие маршруты не затронуты, повторы спасают."""
+        injector = FaultInjector({AUTH: FaultProfile(error_rate=0.3)}, seed=7)
+        client = MockHTTPClient(backend=fake_backend, interceptors=[], faults=injector)
+        auth = RequestSpec("POST", APIEndpoints.AUTH.value, json=CREDENTIALS)
+        detail = RequestSpec("GET", f"/api/request/{MOCK_HELP_REQUEST_DATA['id']}")
+
+        responses = [client.send(auth) for _ in range(1000)]
+        statuses = [response.status for response in responses]
+        assert 250 < statuses.count(500) < 350
+        assert set(statuses) == {200, 500}
+        assert injector.injected[f"error POST {APIEndpoints.AUTH.value}"] == statuses.count(500)
+        assert {client.send(detail).status for _ in range(100)} == {200}
+
+        assert next(r for r in responses if r.status == 500).text() == PLANNED_SERVER_ERROR
+
+        client.retry_policy = RetryPolicy(max_attempts=5, backoff_base=0, rng=random.Random(0))
+        login = replace(auth, idempotent=True)
+        retried = [client.send(login) for _ in range(200)]
+        assert all(response.status == 200 for response in retried)
+        assert max(response.attempts for response in retried) > 1
+        first = FaultInjector({AUTH: FaultProfile(fail_first=2)})
+        assert run(first, auth, 4) == [500, 500, 200, 200]
+
+    @allure.title("Тест медленного тела и таймаута")
+    @pytest.mark.negative
+    def test_slow_body_and_timeout(self) -> None:
+        """Проверка: задержка растет c размером тела, сверх таймаута - TimeoutError Playwright."""
+        slept: list[float] = []
+        profile = FaultProfile(latency=FixedLatency(0.1), bytes_per_second=1000)
+        injector = FaultInjector({DETAIL: profile}, timeout=1.0, sleep=slept.append)
+        spec = RequestSpec("GET", "/api/request/42")
+
+        injector.inject(spec, lambda: FakeAPIResponse(200, text_data="x" * 400))
+        with pytest.raises(PlaywrightTimeoutError, match="Timeout 1000ms exceeded"):
+            injector.inject(spec, lambda: FakeAPIResponse(200, text_data="x" * 2000))
+
+        assert slept == [pytest.approx(0.5), 1.0]
+        assert injector.injected == {f"timeout GET {APIEndpoints.REQUEST_DETAIL.value}": 1}
+        with pytest.raises(ValueError, match="error_rate"):
+            FaultProfile(error_rate=1.5)
+
+    @allure.title("Тест параллельного пакета c задержками и лимитом конкурентности")
+    @pytest.mark.positive
+    def test_batch_latency_overlaps(
+        self,
+        fake_backend: FakeCharityBackend,  # noqa: F811
+    ) -> None:
+        """Проверка: задержки пакета накладываются в пределах max_concurrency."""
+        injector = FaultInjector(default=FaultProfile(latency=FixedLatency(0.05)))
+        client = MockHTTPClient(backend=fake_backend, interceptors=[], faults=injector)
+        specs = [RequestSpec("GET", APIEndpoints.REQUESTS.value) for _ in range(20)]
+
+        started = time.perf_counter()
+        results = client.execute_many(specs, max_concurrency=10)
+        elapsed = time.perf_counter() - started
+
+        assert [result.response.status for result in results if result.response] == [200] * 20
+        assert 0.1 <= elapsed < 0.6
@@ -0,0 +1,185 @@
+import logging
+from unittest.mock import Mock
+
+import allure
+import pytest
+from playwright.sync_api import APIRequestContext, APIResponse
+from pydantic import BaseModel
+
+from api.base_api import BaseAPI
+from core.http_cache import HTTPCache
+from core.http_client import HTTPClient
+
+logger = logging.getLogger(__name__)
+
+ENDPOINT = "/api/request/1"
+
+
+class Item(BaseModel):
+    """Модель ответа для проверки повторного использования валидации."""
+
+    id: str
+
+
+def _raw_response(status: int = 200, headers: dict[str, str] | None = None) -> Mock:
+    """Создает Mock APIResponse Playwright c заданным статусом и заголовками."""
+    response = Mock(spec=APIResponse)
+    response.status = status
+    response.status_text = "OK"
+    response.url = f"http://mock{ENDPOINT}"
+    response.headers = headers or {}
+    response.body.return_value = b'{"id": "1"}' if status == 200 else b""
+    return response
+
+
+class FakeClock:
+    """Управляемые тестом монотонные часы."""
+
+    def __init__(self) -> None:
+        """Устанавливает начальное время."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Возвращает текущее время."""
+        return self.now
+
+
+@pytest.fixture
+def api_context() -> Mock:
+    """Предоставляет мок APIRequestContext."""
+    return Mock(spec=APIRequestContext)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Предоставляет управляемые часы."""
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> HTTPCache:
+    """Предоставляет пустой кэш GET-ответов."""
+    return HTTPCache(max_entries=2, clock=clock)
+
+
+@allure.epic("HTTP клиент (Моки)")
+@allure.feature("Кэш условных GET-запросов")
+@pytest.mark.mocked
+class TestHTTPCacheMocked:
+    """Мок-тесты кэша GET-ответов c ETag / Last-Modified / max-age."""
+
+    @allure.title("Тест повторной проверки по ETag и ответа 304")
+    @pytest.mark.positive
+    def test_not_modified_served_from_cache(self, api_context: Mock, cache: HTTPCache) -> None:
+        """Проверка: второй GET идет c If-None-Match, на 304 отдается сохраненный ответ."""
+        api_context.fetch.side_effect = [
+            _raw_response(headers={"etag": '"v1"', "last-modified": "Mon, 01 Jan 2024"}),
+            _raw_response(304),
+        ]
+        client = HTTPClient(api_context=api_context, interceptors=[cache])
+
+        first = client.get(ENDPOINT)
+        second = client.get(ENDPOINT)
+
+        assert second is first
+        assert second.json() == {"id": "1"}
+        assert api_context.fetch.call_args.kwargs["headers"] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024",
+        }
+        assert (cache.misses, cache.revalidations, cache.hits) == (1, 1, 0)
+
+    @allure.title("Тест повторного использования провалидированной модели")
+    @pytest.mark.positive
+    def test_validated_model_reused(self, api_context: Mock, cache: HTTPCache) -> None:
+        """Проверка, что после 304 модель не валидируется заново."""
+        api_context.fetch.side_effect = [
+            _raw_response(headers={"etag": '"v1"'}),
+            _raw_response(304),
+        ]
+        api = BaseAPI(HTTPClient(api_context=api_context, interceptors=[cache]))
+
+        first = api._handle_response(api.http.get(ENDPOINT), 200, Item)  # noqa: SLF001
+        second = api._handle_response(api.http.get(ENDPOINT), 200, Item)  # noqa: SLF001
+
+        assert second is first
+
+    @allure.title("Тест свежего ответа по max-age без запроса")
+    @pytest.mark.positive
+    def test_fresh_entry_skips_request(
+        self, api_context: Mock, cache: HTTPCache, clock: FakeClock
+    ) -> None:
+        """Проверка: пока не истек max-age (за вычетом Age), запрос не отправляется."""
+        api_context.fetch.side_effect = [
+            _raw_response(headers={"cache-control": "max-age=60", "age": "10"}),
+            _raw_response(),
+        ]
+        client = HTTPClient(api_context=api_context, interceptors=[cache])
+
+        client.get(ENDPOINT)
+        clock.now = 49
+        client.get(ENDPOINT)
+        assert api_context.fetch.call_count == 1
+
+        clock.now = 50
+        client.get(ENDPOINT)
+        assert api_context.fetch.call_count == 2
+        assert cache.hits == 1
+
+    @allure.title("Тест запрета кэширования no-store")
+    @pytest.mark.negative
+    def test_no_store_not_cached(self, api_context: Mock, cache: HTTPCache) -> None:
+        """Проверка, что ответ c no-store не сохраняется и не проверяется повторно."""
+        api_context.fetch.side_effect = [
+            _raw_response(headers={"etag": '"v1"', "cache-control": "no-store"}),
+            _raw_response(),
+        ]
+        client = HTTPClient(api_context=api_context, interceptors=[cache])
+
+        client.get(ENDPOINT)
+        client.get(ENDPOINT)
+
+        assert api_context.fetch.call_args.kwargs["headers"] is None
+        assert cache.misses == 2
+
+    @allure.title("Тест инвалидации при изменяющем запросе")
+    @pytest.mark.positive
+    def test_write_invalidates_related_paths(self, api_context: Mock, cache: HTTPCache) -> None:
+        """Проверка: POST сбрасывает записи своего пути, родительских и дочерних путей."""
+        cacheable = {"cache-control": "max-age=60"}
+        api_context.fetch.side_effect = [
+            _raw_response(headers=cacheable),
+            _raw_response(headers=cacheable),
+            _raw_response(),
+            _raw_response(),
+            _raw_response(),
+        ]
+        client = HTTPClient(api_context=api_context, interceptors=[cache])
+        client.get("/api/request")
+        client.get(ENDPOINT)
+
+        client.post(f"{ENDPOINT}/contribution")
+        client.get("/api/request")
+        client.get(ENDPOINT)
+
+        assert api_context.fetch.call_count == 5
+        assert cache.hits == 0
+
+    @allure.title("Тест вытеснения давно не использованных записей")
+    @pytest.mark.positive
+    def test_lru_eviction(self, api_context: Mock, cache: HTTPCache) -> None:
+        """Проверка, что при переполнении вытесняется самая давно использованная запись."""
+        api_context.fetch.side_effect = lambda *_, **__: _raw_response(
+            headers={"cache-control": "max-age=60"}
+        )
+        client = HTTPClient(api_context=api_context, interceptors=[cache])
+
+        client.get("/a")
+        client.get("/b")
+        client.get("/a")
+        client.get("/c")
+        client.get("/a")
+        client.get("/b")
+
+        assert api_context.fetch.call_count == 4
+        assert cache.hits == 2
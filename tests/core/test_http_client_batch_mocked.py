@@ -0,0 +1,134 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import allure
+import pytest
+from playwright.sync_api import APIRequestContext, APIResponse, sync_playwright
+
+from api.endpoints import APIEndpoints
+from core.http_client import HTTPClient
+from core.mock_http_client import MockHTTPClient
+from core.request_spec import BatchResult, RequestSpec
+from core.standin_server import build_server
+from tests.mocks.conftest import mock_factory, mock_http_client  # noqa: F401
+from tests.mocks.mock_data import MOCK_HELP_REQUEST_DATA
+from utils.mock_factory import MockFactory
+
+logger = logging.getLogger(__name__)
+
+
+def run_batch_over_playwright(
+    base_url: str, specs: list[RequestSpec]
+) -> tuple[bool, list[BatchResult]]:
+    """
+    Выполняет пакет через настоящий APIRequestContext.
+
+    Запускается в отдельном потоке: sync API Playwright оставляет в своем потоке
+    работающий цикл событий, который мешает asyncio.run() в следующих тестах.
+    """
+    with sync_playwright() as playwright:
+        context = playwright.request.new_context(base_url=base_url)
+        try:
+            client = HTTPClient(api_context=context, interceptors=[])
+            return client.supports_concurrent_batches, client.execute_many(specs, max_concurrency=4)
+        finally:
+            context.dispose()
+
+
+@allure.epic("HTTP клиент (Моки)")
+@allure.feature("Пакетное выполнение запросов (execute_many)")
+@pytest.mark.mocked
+class TestHTTPClientBatchMocked:
+    """Мок-тесты пакетного выполнения запросов HTTPClient.execute_many."""
+
+    @allure.title("Тест сохранения порядка ответов в пакете")
+    @pytest.mark.positive
+    def test_execute_many_preserves_order(
+        self,
+        mock_http_client: MockHTTPClient,  # noqa: F811
+        mock_factory: MockFactory,  # noqa: F811
+    ) -> None:
+        """Проверка, что результаты возвращаются в порядке спецификаций."""
+        request_ids = [f"req-{i}" for i in range(5)]
+        for request_id in request_ids:
+            mock_factory.request.get_details_success(request_id=request_id)
+        mock_factory.user.get_favourites_success_list()
+        specs = [
+            RequestSpec("GET", APIEndpoints.REQUEST_DETAIL.format(id=request_id))
+            for request_id in request_ids
+        ]
+        specs.append(RequestSpec("GET", APIEndpoints.USER_FAVOURITES.format()))
+
+        results = mock_http_client.execute_many(specs, max_concurrency=2)
+
+        assert [result.spec for result in results] == specs
+        assert not any(result.failed for result in results)
+        assert results[-1].response is not None
+        assert results[-1].response.status == 200
+
+    @allure.title("Тест перехвата ошибки отдельного запроса в пакете")
+    @pytest.mark.negative
+    def test_execute_many_captures_errors(
+        self,
+        mock_http_client: MockHTTPClient,  # noqa: F811
+        mock_factory: MockFactory,  # noqa: F811
+    ) -> None:
+        """Проверка, что ошибка одного запроса не прерывает пакет."""
+        existing_id = str(MOCK_HELP_REQUEST_DATA["id"])
+        mock_factory.request.get_details_success(request_id=existing_id)
+        specs = [
+            RequestSpec("GET", APIEndpoints.REQUEST_DETAIL.format(id="not-mocked")),
+            RequestSpec("GET", APIEndpoints.REQUEST_DETAIL.format(id=existing_id)),
+        ]
+
+        results = mock_http_client.execute_many(specs)
+
+        assert results[0].failed
+        assert isinstance(results[0].error, RuntimeError)
+        assert results[0].response is None
+        assert not results[1].failed
+        assert results[1].response is not None
+        assert results[1].response.json()["id"] == existing_id
+
+    @allure.title("Тест некорректного ограничения параллельности")
+    @pytest.mark.negative
+    def test_execute_many_rejects_invalid_concurrency(
+        self,
+        mock_http_client: MockHTTPClient,  # noqa: F811
+    ) -> None:
+        """Проверка, что max_concurrency < 1 отклоняется."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            mock_http_client.execute_many([], max_concurrency=0)
+
+    @allure.title("Тест пакета через мост sync API Playwright")
+    @pytest.mark.positive
+    def test_execute_many_over_playwright_bridge(self) -> None:
+        """Проверка: c установленной версией Playwright пакет идет через асинхронный мост."""
+        specs = [RequestSpec("GET", f"/api/request/request-id-{i}") for i in range(1, 9)]
+
+        with build_server(requests=8).run_in_thread() as base_url, ThreadPoolExecutor(1) as pool:
+            bridged, results = pool.submit(run_batch_over_playwright, base_url, specs).result()
+
+        assert bridged
+        assert [result.response.status for result in results if result.response] == [200] * 8
+
+    @allure.title("Тест последовательного пакета без моста Playwright")
+    @pytest.mark.positive
+    def test_execute_many_falls_back_without_bridge(self) -> None:
+        """Проверка: без внутренних атрибутов Playwright пакет выполняется через fetch."""
+        raw = Mock(spec=APIResponse)
+        raw.status, raw.status_text, raw.url = 200, "OK", "http://mock/api/request"
+        raw.headers = {"content-type": "application/json"}
+        raw.body.return_value = b"[]"
+        api_context = Mock(spec=APIRequestContext)
+        api_context.fetch.side_effect = [raw, RuntimeError("socket hang up"), raw]
+        client = HTTPClient(api_context=api_context, interceptors=[])
+        specs = [RequestSpec("GET", APIEndpoints.REQUESTS.format()) for _ in range(3)]
+
+        results = client.execute_many(specs, max_concurrency=3)
+
+        assert not client.supports_concurrent_batches
+        assert api_context.fetch.call_count == 3
+        assert [result.failed for result in results] == [False, True, False]
+        assert isinstance(results[1].error, RuntimeError)
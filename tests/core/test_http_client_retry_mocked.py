@@ -0,0 +1,141 @@
+import logging
+import random
+from unittest.mock import Mock
+
+import allure
+import pytest
+from playwright.sync_api import APIRequestContext, APIResponse
+from playwright.sync_api import Error as PlaywrightError
+
+from api.endpoints import APIEndpoints
+from core.http_client import HTTPClient
+from core.retry import RetryPolicy, RetryStats
+
+logger = logging.getLogger(__name__)
+
+ENDPOINT = APIEndpoints.REQUESTS.format()
+
+
+def _raw_response(status: int) -> Mock:
+    """Создает Mock APIResponse Playwright c заданным статусом."""
+    response = Mock(spec=APIResponse)
+    response.status = status
+    response.status_text = "OK" if status == 200 else "Error"
+    response.url = f"http://mock{ENDPOINT}"
+    response.headers = {"content-type": "application/json"}
+    response.body.return_value = b"[]"
+    return response
+
+
+@pytest.fixture
+def api_context() -> Mock:
+    """Предоставляет мок APIRequestContext, ответы задаются через fetch.side_effect."""
+    return Mock(spec=APIRequestContext)
+
+
+@pytest.fixture
+def retry_stats() -> RetryStats:
+    """Предоставляет отдельные счетчики повторов для теста."""
+    return RetryStats()
+
+
+@pytest.fixture
+def retrying_client(api_context: Mock, retry_stats: RetryStats) -> HTTPClient:
+    """Предоставляет HTTPClient c тремя попытками и нулевой задержкой между ними."""
+    policy = RetryPolicy(max_attempts=3, backoff_base=0, rng=random.Random(0))
+    return HTTPClient(api_context=api_context, retry_policy=policy, retry_stats=retry_stats)
+
+
+@allure.epic("HTTP клиент (Моки)")
+@allure.feature("Повторы запросов (RetryPolicy)")
+@pytest.mark.mocked
+class TestHTTPClientRetryMocked:
+    """Мок-тесты повторов запросов в HTTPClient."""
+
+    @allure.title("Тест повтора GET после 500")
+    @pytest.mark.positive
+    def test_get_retried_after_server_error(
+        self, retrying_client: HTTPClient, api_context: Mock, retry_stats: RetryStats
+    ) -> None:
+        """Проверка, что GET повторяется после 500 и возвращает успешный ответ."""
+        api_context.fetch.side_effect = [_raw_response(500), _raw_response(200)]
+
+        response = retrying_client.get(ENDPOINT)
+
+        assert response.status == 200
+        assert response.attempts == 2
+        assert api_context.fetch.call_count == 2
+        assert retry_stats.snapshot() == {f"GET {ENDPOINT}": 1}
+
+    @allure.title("Тест отказа после исчерпания попыток")
+    @pytest.mark.negative
+    def test_last_response_returned_when_attempts_exhausted(
+        self, retrying_client: HTTPClient, api_context: Mock, retry_stats: RetryStats
+    ) -> None:
+        """Проверка, что после max_attempts возвращается последний ответ c ошибкой."""
+        api_context.fetch.side_effect = [_raw_response(503) for _ in range(3)]
+
+        response = retrying_client.get(ENDPOINT)
+
+        assert response.status == 503
+        assert response.attempts == 3
+        assert retry_stats.total == 2
+
+    @allure.title("Тест отсутствия повтора для POST")
+    @pytest.mark.negative
+    def test_post_not_retried_by_default(
+        self, retrying_client: HTTPClient, api_context: Mock, retry_stats: RetryStats
+    ) -> None:
+        """Проверка, что неидемпотентный POST отправляется только один раз."""
+        api_context.fetch.side_effect = [_raw_response(500), _raw_response(200)]
+
+        response = retrying_client.post(ENDPOINT, json={"amount": 1})
+
+        assert response.status == 500
+        assert response.attempts == 1
+        assert api_context.fetch.call_count == 1
+        assert retry_stats.total == 0
+
+    @allure.title("Тест повтора POST c явным idempotent=True")
+    @pytest.mark.positive
+    def test_post_retried_when_marked_idempotent(
+        self, retrying_client: HTTPClient, api_context: Mock
+    ) -> None:
+        """Проверка, что флаг idempotent=True разрешает повтор POST (как при логине)."""
+        api_context.fetch.side_effect = [_raw_response(500), _raw_response(200)]
+
+        response = retrying_client.post(ENDPOINT, json={"login": "x"}, idempotent=True)
+
+        assert response.status == 200
+        assert response.attempts == 2
+
+    @allure.title("Тест повтора после ошибки транспорта")
+    @pytest.mark.positive
+    def test_transport_error_retried(self, retrying_client: HTTPClient, api_context: Mock) -> None:
+        """Проверка, что ошибка Playwright повторяется, последняя пробрасывается."""
+        api_context.fetch.side_effect = [PlaywrightError("socket hang up"), _raw_response(200)]
+        assert retrying_client.get(ENDPOINT).attempts == 2
+
+        api_context.fetch.side_effect = PlaywrightError("socket hang up")
+        with pytest.raises(PlaywrightError):
+            retrying_client.get(ENDPOINT)
+
+    @allure.title("Тест отсутствия повторов без политики")
+    @pytest.mark.positive
+    def test_no_retries_by_default(self, api_context: Mock) -> None:
+        """Проверка, что HTTPClient без политики повторов делает одну попытку."""
+        api_context.fetch.side_effect = [_raw_response(500), _raw_response(200)]
+
+        response = HTTPClient(api_context=api_context).get(ENDPOINT)
+
+        assert response.status == 500
+        assert api_context.fetch.call_count == 1
+
+    @allure.title("Тест границ задержки c полным джиттером")
+    @pytest.mark.positive
+    def test_backoff_is_capped_full_jitter(self) -> None:
+        """Проверка, что задержка лежит в [0, min(backoff_max, base * 2 ** (n - 1))]."""
+        policy = RetryPolicy(backoff_base=0.5, backoff_max=2.0, rng=random.Random(42))
+        for attempt, ceiling in [(1, 0.5), (2, 1.0), (3, 2.0), (10, 2.0)]:
+            delays = [policy.backoff(attempt) for _ in range(50)]
+            assert all(0 <= delay <= ceiling for delay in delays)
@@ -0,0 +1,150 @@
+import logging
+from unittest.mock import Mock
+
+import allure
+import pytest
+from playwright.sync_api import APIRequestContext, APIResponse
+from playwright.sync_api import Error as PlaywrightError
+
+from core.cached_response import CachedResponse
+from core.http_client import HTTPClient
+from core.interceptors import Interceptor, LoggingInterceptor
+from core.request_spec import RequestSpec
+
+logger = logging.getLogger(__name__)
+
+ENDPOINT = "/api/request"
+
+
+def _raw_response(status: int = 200) -> Mock:
+    """Создает Mock APIResponse Playwright c заданным статусом."""
+    response = Mock(spec=APIResponse)
+    response.status = status
+    response.status_text = "OK"
+    response.url = f"http://mock{ENDPOINT}"
+    response.headers = {}
+    response.body.return_value = b"[]"
+    return response
+
+
+class RecordingInterceptor(Interceptor):
+    """Перехватчик, записывающий порядок вызовов хуков."""
+
+    def __init__(self, name: str, calls: list[str]) -> None:
+        """Запоминает имя и общий журнал вызовов."""
+        self.name = name
+        self.calls = calls
+
+    def on_request(self, spec: RequestSpec) -> RequestSpec:
+        """Записывает вызов и добавляет заголовок c именем перехватчика."""
+        self.calls.append(f"{self.name}.request")
+        return RequestSpec(
+            spec.method, spec.endpoint, headers={**(spec.headers or {}), self.name: "1"}
+        )
+
+    def on_response(self, spec: RequestSpec, response: CachedResponse) -> CachedResponse:
+        """Записывает вызов."""
+        self.calls.append(f"{self.name}.response")
+        return response
+
+
+class ShortCircuitInterceptor(Interceptor):
+    """Перехватчик, отвечающий сам, без отправки запроса."""
+
+    def on_request(self, spec: RequestSpec) -> CachedResponse:
+        """Возвращает готовый ответ."""
+        return CachedResponse(status=200, url=ENDPOINT, headers={}, body=b'{"cached": true}')
+
+
+class RecoveringInterceptor(Interceptor):
+    """Перехватчик, заменяющий ошибку транспорта ответом 503."""
+
+    def on_error(self, spec: RequestSpec, error: Exception) -> CachedResponse:
+        """Возвращает ответ 503 вместо ошибки."""
+        return CachedResponse(status=503, url=spec.endpoint, headers={}, body=str(error).encode())
+
+
+@pytest.fixture
+def api_context() -> Mock:
+    """Предоставляет мок APIRequestContext, всегда отвечающий 200."""
+    context = Mock(spec=APIRequestContext)
+    context.fetch.return_value = _raw_response()
+    return context
+
+
+@allure.epic("HTTP клиент (Моки)")
+@allure.feature("Цепочка перехватчиков")
+@pytest.mark.mocked
+class TestInterceptorsMocked:
+    """Мок-тесты цепочки перехватчиков HTTPClient."""
+
+    @allure.title("Тест порядка вызова хуков")
+    @pytest.mark.positive
+    def test_hooks_wrap_transport_in_order(self, api_context: Mock) -> None:
+        """Проверка: хуки запроса идут по порядку, хуки ответа - в обратном порядке."""
+        calls: list[str] = []
+        client = HTTPClient(
+            api_context=api_context,
+            interceptors=[
+                RecordingInterceptor("outer", calls),
+                RecordingInterceptor("inner", calls),
+            ],
+        )
+
+        client.get(ENDPOINT)
+
+        assert calls == ["outer.request", "inner.request", "inner.response", "outer.response"]
+        assert api_context.fetch.call_args.kwargs["headers"] == {"outer": "1", "inner": "1"}
+
+    @allure.title("Тест ответа перехватчика без отправки запроса")
+    @pytest.mark.positive
+    def test_short_circuit_skips_transport(self, api_context: Mock) -> None:
+        """Проверка, что ответ из on_request возвращается без обращения к транспорту."""
+        client = HTTPClient(api_context=api_context, interceptors=[ShortCircuitInterceptor()])
+
+        response = client.get(ENDPOINT)
+
+        assert response.json() == {"cached": True}
+        api_context.fetch.assert_not_called()
+
+    @allure.title("Тест восстановления после ошибки транспорта")
+    @pytest.mark.negative
+    def test_error_hook_recovers(self, api_context: Mock) -> None:
+        """Проверка, что on_error может заменить ошибку ответом, иначе ошибка пробрасывается."""
+        api_context.fetch.side_effect = PlaywrightError("socket hang up")
+
+        recovered = HTTPClient(api_context=api_context, interceptors=[RecoveringInterceptor()])
+        assert recovered.get(ENDPOINT).status == 503
+
+        plain = HTTPClient(api_context=api_context, interceptors=[LoggingInterceptor()])
+        with pytest.raises(PlaywrightError):
+            plain.get(ENDPOINT)
+
+    @allure.title("Тест перехватчиков в пакетном выполнении")
+    @pytest.mark.positive
+    def test_batch_goes_through_interceptors(self, api_context: Mock) -> None:
+        """Проверка, что execute_many проходит через цепочку так же, как одиночные запросы."""
+        client = HTTPClient(api_context=api_context, interceptors=[ShortCircuitInterceptor()])
+
+        results = client.execute_many([RequestSpec("GET", ENDPOINT), RequestSpec("GET", ENDPOINT)])
+
+        assert [result.response.json() for result in results if result.response] == [
+            {"cached": True},
+            {"cached": True},
+        ]
+
+    @allure.title("Тест голого транспорта без перехватчиков")
+    @pytest.mark.positive
+    def test_empty_chain_runs_bare_transport(
+        self, api_context: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Проверка, что без перехватчиков не вызываются ни логирование, ни Allure."""
+        attach_response = Mock()
+        monkeypatch.setattr("utils.allure_utils.AllureUtils.attach_response", attach_response)
+        client = HTTPClient(api_context=api_context, interceptors=[])
+
+        response = client.get(ENDPOINT)
+
+        assert response.status == 200
+        attach_response.assert_not_called()
+        assert not client.interceptors
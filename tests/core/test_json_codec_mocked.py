@@ -0,0 +1,88 @@
+import json
+import logging
+from unittest.mock import Mock
+
+import allure
+import pytest
+from playwright.sync_api import APIRequestContext
+
+from core.http_client import HTTPClient
+from core.json_codec import JSONCodec, available_codecs, codec, select_codec
+from core.request_spec import RequestSpec
+from tests.mocks.mock_data import MOCK_REQUESTS_LIST, MOCK_USER_DATA
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture(params=available_codecs())
+def json_codec(request: pytest.FixtureRequest) -> JSONCodec:
+    """Предоставляет каждый доступный в окружении кодек."""
+    return select_codec(request.param)
+
+
+@allure.epic("HTTP клиент (Моки)")
+@allure.feature("JSON-кодек")
+@pytest.mark.mocked
+class TestJSONCodecMocked:
+    """Мок-тесты подключаемого JSON-кодека."""
+
+    @allure.title("Тест совместимости кодеков co stdlib на реальных телах")
+    @pytest.mark.positive
+    @pytest.mark.parametrize("value", [MOCK_REQUESTS_LIST, MOCK_USER_DATA, ["a", "избранное"]])
+    def test_roundtrip_matches_stdlib(self, json_codec: JSONCodec, value: object) -> None:
+        """Проверка: кодек читает и пишет то же, что stdlib, кириллица не экранируется."""
+        encoded = json_codec.dumps(value)
+
+        assert json.loads(encoded) == value
+        assert json_codec.loads(json.dumps(value)) == value
+        assert json_codec.loads(encoded.decode()) == value
+        assert json.loads(json_codec.dumps_pretty(value)) == value
+        assert "\\u" not in encoded.decode()
+
+    @allure.title("Тест единых исключений кодеков")
+    @pytest.mark.negative
+    def test_errors_follow_stdlib(self, json_codec: JSONCodec) -> None:
+        """Проверка: ошибки разбора - json.JSONDecodeError, ошибки кодирования - TypeError."""
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads(b'{"id": ')
+        with pytest.raises(TypeError):
+            json_codec.dumps({"value": object()})
+
+    @allure.title("Тест выбора кодека")
+    @pytest.mark.positive
+    def test_select_codec(self) -> None:
+        """Проверка: auto выбирает самый быстрый доступный, неизвестный кодек - ошибка."""
+        assert select_codec("auto").name == available_codecs()[0]
+        assert available_codecs()[-1] == "stdlib"
+        with pytest.raises(ValueError, match="simplejson"):
+            select_codec("simplejson")
+
+    @allure.title("Тест кодирования JSON-тела запроса кодеком")
+    @pytest.mark.positive
+    def test_request_body_encoded_by_codec(self) -> None:
+        """Проверка: json кодируется в байты c content-type, data передается как есть."""
+        api_context = Mock(spec=APIRequestContext)
+        api_context.fetch.return_value.body.return_value = b""
+        api_context.fetch.return_value.headers = {}
+        client = HTTPClient(api_context=api_context, interceptors=[])
+        payload = {"login": "user@example.com", "password": "пароль"}
+
+        client.post("/api/auth", json=payload)
+        kwargs = api_context.fetch.call_args.kwargs
+
+        assert kwargs["data"] == codec.dumps(payload)
+        assert kwargs["headers"] == {"content-type": "application/json"}
+        spec = RequestSpec("POST", "/x", headers={"Content-Type": "text/plain"}, data="raw")
+        assert spec.body == "raw"
+        assert spec.headers_with({"x-trace": "1"}) == {"x-trace": "1", "Content-Type": "text/plain"}
+
+    @allure.title("Тест пустого тела формы при заданном json")
+    @pytest.mark.negative
+    def test_empty_data_takes_precedence(self) -> None:
+        """Проверка: пустой data (b"", {}) отправляется как есть, json не подставляется."""
+        for data in (b"", {}):
+            spec = RequestSpec("POST", "/x", data=data, json={"ignored": True})
+
+            assert spec.body == data
+            assert spec.headers_with() is None
+        assert RequestSpec("POST", "/x").body is None
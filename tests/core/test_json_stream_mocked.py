@@ -0,0 +1,52 @@
+import json
+import logging
+
+import allure
+import pytest
+
+from core.json_stream import iter_json_array
+from tests.mocks.mock_data import MOCK_REQUESTS_LIST
+
+logger = logging.getLogger(__name__)
+
+
+@allure.epic("HTTP клиент (Моки)")
+@allure.feature("Потоковый разбор JSON-массива")
+@pytest.mark.mocked
+class TestJsonStreamMocked:
+    """Мок-тесты инкрементального разбора JSON-массивов."""
+
+    @allure.title("Тест разбора на любых границах чанков")
+    @pytest.mark.positive
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64 * 1024])
+    def test_matches_json_loads(self, chunk_size: int) -> None:
+        """Проверка: результат совпадает c json.loads при любом размере чанка."""
+        data = [*MOCK_REQUESTS_LIST, 12345, -1.5e3, "Помощь 😀", None, True, [], {}]
+        body = json.dumps(data, ensure_ascii=False, indent=2).encode()
+
+        assert list(iter_json_array(body, chunk_size)) == data
+
+    @allure.title("Тест пустого массива")
+    @pytest.mark.positive
+    def test_empty_array(self) -> None:
+        """Проверка, что пустой массив не дает элементов."""
+        assert list(iter_json_array(b" [ ] ")) == []
+
+    @allure.title("Тест ошибок разбора")
+    @pytest.mark.negative
+    @pytest.mark.parametrize("body", [b"", b"{}", b"[1,]", b"[1 2]", b"[1]x", b"[1", b'["abc'])
+    def test_malformed_body_raises(self, body: bytes) -> None:
+        """Проверка, что некорректное тело приводит к JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array(body, chunk_size=2))
+
+    @allure.title("Тест ленивого разбора")
+    @pytest.mark.positive
+    def test_items_yielded_lazily(self) -> None:
+        """Проверка, что элементы до ошибки выдаются до того, как разобран весь массив."""
+        items = iter_json_array(b'[{"a": 1}, {"b": 2}, oops]', chunk_size=4)
+
+        assert next(items) == {"a": 1}
+        assert next(items) == {"b": 2}
+        with pytest.raises(json.JSONDecodeError):
+            next(items)
@@ -0,0 +1,128 @@
+import json
+import logging
+
+import allure
+import pytest
+from pydantic import BaseModel, ValidationError, field_validator, model_validator
+
+from api.request.models import HelpRequestData, RequestContacts, RequestsListResponse
+from api.user.models import FavouritesListResponse
+from core.cached_response import CachedResponse
+from core.lazy_model import LazyModel, lazy_model
+from core.validation import ValidationLevel, ValidatorRegistry
+
+logger = logging.getLogger(__name__)
+
+REQUEST = {
+    "id": "request-1",
+    "title": "Помощь",
+    "organization": {"title": "Фонд", "is_verified": True},
+    "contacts": {"email": "fund@example.com", "website": "https://example.com"},
+    "actions_schedule": [{"step_label": "Шаг 1", "is_done": False}],
+    "ending_date": "2030-12-31",
+    "request_goal": 10000,
+    "request_goal_current_value": 2500,
+}
+
+
+class Goal(BaseModel):
+    """Модель c валидаторами поля и модели для проверки ленивого уровня."""
+
+    amount: int
+    steps: list[RequestContacts] = []
+
+    @field_validator("amount")
+    @classmethod
+    def positive(cls, value: int) -> int:
+        """Сумма должна быть положительной."""
+        if value <= 0:
+            msg = "amount must be positive"
+            raise ValueError(msg)
+        return value
+
+    @model_validator(mode="after")
+    def has_steps(self) -> "Goal":
+        """Цель без шагов не допускается."""
+        if not self.steps:
+            msg = "steps must not be empty"
+            raise ValueError(msg)
+        return self
+
+
+def _response(body: object) -> CachedResponse:
+    """Создает CachedResponse c телом в виде JSON."""
+    return CachedResponse(status=200, url="http://mock", headers={}, body=json.dumps(body).encode())
+
+
+@pytest.fixture
+def registry() -> ValidatorRegistry:
+    """Предоставляет реестр валидаторов c ленивым уровнем по умолчанию."""
+    return ValidatorRegistry(ValidationLevel.LAZY)
+
+
+@allure.epic("HTTP клиент (Моки)")
+@allure.feature("Ленивая валидация моделей")
+@pytest.mark.mocked
+class TestLazyModelMocked:
+    """Мок-тесты ленивых представлений моделей."""
+
+    @allure.title("Тест валидации скалярных полей сразу")
+    @pytest.mark.positive
+    def test_scalars_validated_up_front(self, registry: ValidatorRegistry) -> None:
+        """Проверка: скаляры валидируются при разборе, ошибка в них видна сразу."""
+        request = registry.validate(_response(REQUEST), HelpRequestData)
+
+        assert isinstance(request, LazyModel)
+        assert isinstance(request, HelpRequestData)
+        assert request.request_goal == 10000
+        assert str(request.ending_date) == "2030-12-31"
+        with pytest.raises(ValidationError):
+            registry.validate(_response({**REQUEST, "request_goal": "много"}), HelpRequestData)
+
+    @allure.title("Тест валидации вложенных моделей при обращении")
+    @pytest.mark.negative
+    def test_nested_validated_on_access(self, registry: ValidatorRegistry) -> None:
+        """Проверка: невалидный email не мешает разбору, ошибка - только при обращении."""
+        body = {**REQUEST, "contacts": {"email": "not-an-email"}}
+        request = registry.validate(_response(body), HelpRequestData)
+
+        assert request.id == "request-1"
+        with pytest.raises(ValidationError):
+            _ = request.contacts
+
+    @allure.title("Тест кэширования вложенных моделей")
+    @pytest.mark.positive
+    def test_nested_cached(self, registry: ValidatorRegistry) -> None:
+        """Проверка, что вложенная модель валидируется один раз."""
+        request = registry.validate(_response(REQUEST), HelpRequestData)
+
+        assert isinstance(request.contacts, RequestContacts)
+        assert request.contacts is request.contacts
+
+    @allure.title("Тест полной валидации по запросу")
+    @pytest.mark.positive
+    def test_full_matches_eager_validation(self, registry: ValidatorRegistry) -> None:
+        """Проверка, что full() дает ту же модель, что и обычная валидация."""
+        requests = registry.validate(_response([REQUEST, REQUEST]), RequestsListResponse)
+
+        assert all(isinstance(request, lazy_model(HelpRequestData)) for request in requests)
+        assert requests[0].full() == HelpRequestData.model_validate(REQUEST)
+
+    @allure.title("Тест полной валидации типов без моделей")
+    @pytest.mark.positive
+    def test_non_model_types_validated_fully(self, registry: ValidatorRegistry) -> None:
+        """Проверка, что для типов без моделей ленивый уровень равен полной валидации."""
+        assert registry.validate(_response(["a", "b"]), FavouritesListResponse) == ["a", "b"]
+
+    @allure.title("Тест валидаторов модели на ленивом уровне")
+    @pytest.mark.negative
+    def test_validators_carried_over(self, registry: ValidatorRegistry) -> None:
+        """Проверка: валидаторы поля и модели работают так же, как при полной валидации."""
+        goal = registry.validate(_response({"amount": 1, "steps": [{}]}), Goal)
+
+        assert isinstance(goal, Goal)
+        assert isinstance(goal.steps[0], RequestContacts)
+        with pytest.raises(ValidationError, match="amount must be positive"):
+            registry.validate(_response({"amount": 0, "steps": [{}]}), Goal)
+        with pytest.raises(ValidationError, match="steps must not be empty"):
+            registry.validate(_response({"amount": 1, "steps": []}), Goal)
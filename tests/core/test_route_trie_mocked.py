@@ -0,0 +1,98 @@
+import logging
+
+import allure
+import pytest
+
+from api.endpoints import APIEndpoints
+from api.request.client import RequestClient
+from api.request.models import HelpRequestData
+from core.route_trie import RouteTrie
+from tests.mocks.conftest import mock_factory, mock_http_client, mock_request_client  # noqa: F401
+from tests.mocks.mock_data import MOCK_HELP_REQUEST_DATA, MOCK_NOT_FOUND_404
+from utils.mock_factory import MockFactory
+
+logger = logging.getLogger(__name__)
+
+
+@allure.epic("HTTP клиент (Моки)")
+@allure.feature("Сопоставление моков по шаблону пути")
+@pytest.mark.mocked
+class TestRouteTrieMocked:
+    """Мок-тесты RouteTrie и поиска моков по шаблонам эндпоинтов."""
+
+    @allure.title("Тест точного пути и шаблона c параметрами")
+    @pytest.mark.positive
+    def test_exact_and_template_match(self) -> None:
+        """Проверка: точный путь без параметров, шаблон связывает параметры, query игнорируется."""
+        routes = RouteTrie()
+        routes.add("get", "/api/request", "list")
+        routes.add("GET", "/api/request/{id}", "detail")
+        routes.add("POST", "/api/request/{id}/contribution", "contribution")
+
+        listing = routes.match("GET", "/api/request?page=2")
+        detail = routes.match("GET", "/api/request/42")
+        contribution = routes.match("post", "/api/request/42/contribution")
+
+        assert listing is not None
+        assert (listing.value, listing.params) == ("list", {})
+        assert detail is not None
+        assert (detail.value, detail.template, detail.params) == (
+            "detail",
+            "/api/request/{id}",
+            {"id": "42"},
+        )
+        assert contribution is not None
+        assert contribution.params == {"id": "42"}
+        assert len(routes) == 3
+
+    @allure.title("Тест приоритета статических сегментов и разделения по методам")
+    @pytest.mark.positive
+    def test_static_segment_wins_and_methods_are_separate(self) -> None:
+        """Проверка: статический сегмент важнее параметра, при неудаче поиск откатывается."""
+        routes = RouteTrie()
+        routes.add("GET", "/api/{section}/favourites", "param")
+        routes.add("GET", "/api/user/{id}", "static")
+
+        static = routes.match("GET", "/api/user/42")
+        backtracked = routes.match("GET", "/api/user/favourites")
+
+        assert static is not None
+        assert static.value == "static"
+        assert backtracked is not None
+        assert (backtracked.value, backtracked.params) == ("static", {"id": "favourites"})
+        assert routes.match("DELETE", "/api/user/42") is None
+
+    @allure.title("Тест отсутствующих маршрутов и конфликта имен параметров")
+    @pytest.mark.negative
+    def test_no_match_and_conflicting_param(self) -> None:
+        """Проверка: пустой сегмент и лишние сегменты не совпадают, конфликт имен - ошибка."""
+        routes = RouteTrie()
+        routes.add("GET", "/api/request/{id}", "detail")
+
+        assert routes.match("GET", "/api/request/") is None
+        assert routes.match("GET", "/api/request/42/extra") is None
+        with pytest.raises(ValueError, match="request_id"):
+            routes.add("GET", "/api/request/{request_id}/contribution", "contribution")
+        routes.clear()
+        assert len(routes) == 0
+        assert routes.match("GET", "/api/request/42") is None
+
+    @allure.title("Тест одного мока на шаблон эндпоинта для любых id")
+    @pytest.mark.positive
+    def test_template_mock_serves_any_id(
+        self,
+        mock_request_client: RequestClient,  # noqa: F811
+        mock_factory: MockFactory,  # noqa: F811
+    ) -> None:
+        """Проверка: мок на REQUEST_DETAIL отвечает на все id, мок на конкретный путь важнее."""
+        mock_factory.setup_mock("GET", APIEndpoints.REQUEST_DETAIL, 200, MOCK_HELP_REQUEST_DATA)
+        mock_factory.setup_mock(
+            "GET", APIEndpoints.REQUEST_DETAIL.format(id="missing"), 404, MOCK_NOT_FOUND_404
+        )
+
+        found = [mock_request_client.get_request_details(str(index)) for index in range(5)]
+        missing = mock_request_client.get_request_details("missing", expected_status=404)
+
+        assert all(isinstance(item, HelpRequestData) for item in found)
+        assert not isinstance(missing, HelpRequestData)
+        assert missing.status == 404
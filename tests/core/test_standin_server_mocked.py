@@ -0,0 +1,122 @@
+import http.client
+import logging
+from collections.abc import Generator
+from typing import Any
+
+import allure
+import pytest
+
+from config.config import SWAGGER_SPEC_PATH
+from core.cached_response import CachedResponse
+from core.contract import ContractReport, ContractValidator
+from core.json_codec import codec
+from core.request_spec import RequestSpec
+from core.standin_server import StandInServer, seed_backend
+from tests.mocks.mock_data import MOCK_USER_LOGIN, MOCK_USER_PASSWORD
+
+logger = logging.getLogger(__name__)
+
+REQUESTS = 5
+DESCRIPTION_LENGTH = 2000
+
+
+@pytest.fixture(scope="module")
+def swagger_spec() -> dict[str, Any]:
+    """Предоставляет разобранный docs/swagger.json."""
+    return codec.loads(SWAGGER_SPEC_PATH.read_bytes())
+
+
+@pytest.fixture
+def standin_server(swagger_spec: dict[str, Any]) -> Generator[StandInServer]:
+    """Запускает сервер-заглушку в отдельном потоке на свободном порту."""
+    backend = seed_backend(
+        swagger_spec,
+        requests=REQUESTS,
+        description_length=DESCRIPTION_LENGTH,
+        login=MOCK_USER_LOGIN,
+        password=MOCK_USER_PASSWORD,
+    )
+    server = StandInServer(backend, swagger_spec)
+    with server.run_in_thread():
+        yield server
+
+
+def call(
+    connection: http.client.HTTPConnection,
+    method: str,
+    path: str,
+    body: object = None,
+    token: str | None = None,
+) -> CachedResponse:
+    """Отправляет запрос по открытому соединению и читает ответ в CachedResponse."""
+    headers = {"content-type": "application/json"} if body is not None else {}
+    if token:
+        headers["authorization"] = f"Bearer {token}"
+    data = codec.dumps(body) if body is not None else None
+    connection.request(method, path, body=data, headers=headers)
+    raw = connection.getresponse()
+    return CachedResponse(
+        status=raw.status, url=path, headers=dict(raw.getheaders()), body=raw.read()
+    )
+
+
+@allure.epic("HTTP клиент (Моки)")
+@allure.feature("Локальный сервер-заглушка по docs/swagger.json")
+@pytest.mark.mocked
+class TestStandInServerMocked:
+    """Тесты сервера-заглушки через настоящий HTTP на локальном порту."""
+
+    @allure.title("Тест соответствия ответов контракту по одному keep-alive соединению")
+    @pytest.mark.positive
+    def test_every_operation_conforms_over_keep_alive(self, standin_server: StandInServer) -> None:
+        """Проверка: все операции спецификации отвечают по контракту, соединение одно."""
+        connection = http.client.HTTPConnection(standin_server.host, standin_server.port)
+        auth = call(
+            connection,
+            "POST",
+            "/api/auth",
+            {"login": MOCK_USER_LOGIN, "password": MOCK_USER_PASSWORD},
+        )
+        socket = connection.sock
+        token = auth.json()["token"]
+        calls = [
+            ("GET", "/api/request", None),
+            ("GET", "/api/request/request-id-1", None),
+            ("POST", "/api/request/request-id-1/contribution", None),
+            ("GET", "/api/user", None),
+            ("POST", "/api/user/favourites", {"requestId": "request-id-2"}),
+            ("GET", "/api/user/favourites", None),
+            ("DELETE", "/api/user/favourites/request-id-2", None),
+        ]
+        validator = ContractValidator(ContractReport())
+        responses = [call(connection, method, path, body, token) for method, path, body in calls]
+
+        assert validator.check(RequestSpec("POST", "/api/auth"), auth) is None
+        for (method, path, _), response in zip(calls, responses, strict=True):
+            assert response.status == 200, (method, path, response.text())
+            assert validator.check(RequestSpec(method, path), response) is None
+        assert connection.sock is socket
+        listing = responses[0].json()
+        assert len(listing) == REQUESTS
+        assert len(listing[0]["description"]) == DESCRIPTION_LENGTH
+        assert responses[5].json() == ["request-id-2"]
+        connection.close()
+
+    @allure.title("Тест ошибок и закрытия соединения")
+    @pytest.mark.negative
+    def test_errors_and_connection_close(self, standin_server: StandInServer) -> None:
+        """Проверка: 401 без токена, 404 на неизвестный путь, Connection: close закрывает сокет."""
+        connection = http.client.HTTPConnection(standin_server.host, standin_server.port)
+
+        unauthorized = call(connection, "GET", "/api/user")
+        unknown = call(connection, "GET", "/api/unknown")
+        connection.request("GET", "/api/request/request-id-1", headers={"connection": "close"})
+        closing = connection.getresponse()
+        closing.read()
+
+        assert unauthorized.status == 401
+        assert unknown.status == 404
+        assert closing.status == 200
+        assert closing.getheader("connection") == "close"
+        assert closing.will_close
+        connection.close()
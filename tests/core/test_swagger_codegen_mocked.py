@@ -0,0 +1,168 @@
+import json
+import logging
+import sys
+import typing
+from pathlib import Path
+from typing import Any
+
+import allure
+import pytest
+from pydantic import BaseModel
+
+from api.auth.models import AuthPayload, AuthSuccessResponse
+from api.endpoints import APIEndpoints
+from api.request.models import HelpRequestData
+from api.user.models import AddToFavouritesPayload, UserDataResponse
+from config.config import SWAGGER_SPEC_PATH
+from core import swagger_codegen
+from core.swagger_codegen import load_generated, spec_key
+from tests.mocks.mock_data import MOCK_AUTH_SUCCESS, MOCK_REQUESTS_LIST, MOCK_USER_DATA
+
+logger = logging.getLogger(__name__)
+
+HAND_WRITTEN_MODELS = {
+    "HelpRequestData": HelpRequestData,
+    "UserData": UserDataResponse,
+    "AuthRequest": AuthPayload,
+    "AuthResponse": AuthSuccessResponse,
+    "AddToFavouritesRequest": AddToFavouritesPayload,
+}
+"""Сгенерированная модель -> написанная вручную модель того же тела."""
+
+
+def nested_model(annotation: Any) -> type[BaseModel] | None:  # noqa: ANN401
+    """Модель внутри аннотации поля (`Step`, `list[Step] | None`) или None."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return next(filter(None, map(nested_model, typing.get_args(annotation))), None)
+
+
+def wire_names(model: type[BaseModel]) -> dict[str, str]:
+    """Имя в JSON (алиас или имя поля) -> имя атрибута."""
+    return {field.alias or name: name for name, field in model.model_fields.items()}
+
+
+def model_drift(hand: type[BaseModel], generated: type[BaseModel], where: str) -> list[str]:
+    """Расхождения имен полей и алиасов двух моделей, включая вложенные."""
+    hand_names, generated_names = wire_names(hand), wire_names(generated)
+    drift = [
+        f"{where}.{wire}: {hand_names.get(wire)!r} вместо {generated_names.get(wire)!r}"
+        for wire in hand_names.keys() | generated_names.keys()
+        if hand_names.get(wire) != generated_names.get(wire)
+    ]
+    for wire, name in generated_names.items():
+        expected = nested_model(generated.model_fields[name].annotation)
+        actual = hand.model_fields.get(hand_names.get(wire, ""))
+        if expected is not None and actual is not None:
+            drift += model_drift(nested_model(actual.annotation) or BaseModel, expected, wire)
+    return drift
+
+
+def unknown_keys(payload: Any, model: type[BaseModel], where: str) -> list[str]:  # noqa: ANN401
+    """Ключи мок-тела, которых нет в схеме (по именам в JSON), включая вложенные."""
+    if isinstance(payload, list):
+        return [key for item in payload for key in unknown_keys(item, model, f"{where}[]")]
+    if not isinstance(payload, dict):
+        return []
+    names = wire_names(model)
+    unknown = [f"{where}.{key}" for key in payload if key not in names]
+    for key, value in payload.items():
+        nested = nested_model(model.model_fields[names[key]].annotation) if key in names else None
+        if nested is not None:
+            unknown += unknown_keys(value, nested, f"{where}.{key}")
+    return unknown
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Предоставляет пустой каталог кэша и убирает уже импортированный модуль спецификации."""
+    key = spec_key(SWAGGER_SPEC_PATH.read_bytes())
+    monkeypatch.delitem(sys.modules, f"swagger_{key}", raising=False)
+    return tmp_path / "codegen"
+
+
+@allure.epic("HTTP клиент (Моки)")
+@allure.feature("Генерация кода из docs/swagger.json")
+@pytest.mark.mocked
+class TestSwaggerCodegenMocked:
+    """Мок-тесты генерации эндпоинтов, моделей и валидаторов из спецификации."""
+
+    @allure.title("Тест кэширования сгенерированного модуля по хэшу спецификации")
+    @pytest.mark.positive
+    def test_module_cached_by_spec_key(
+        self, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Проверка: модуль генерируется один раз, затем импортируется из кэша."""
+        module = load_generated(SWAGGER_SPEC_PATH, cache_dir)
+        key = spec_key(SWAGGER_SPEC_PATH.read_bytes())
+
+        assert key == module.SPEC_KEY
+        assert (cache_dir / f"swagger_{key}.py").exists()
+        assert load_generated(SWAGGER_SPEC_PATH, cache_dir) is module
+
+        monkeypatch.delitem(sys.modules, f"swagger_{key}")
+        monkeypatch.setattr(swagger_codegen, "generate_source", pytest.fail)
+        assert key == load_generated(SWAGGER_SPEC_PATH, cache_dir).SPEC_KEY
+
+    @allure.title("Тест нового модуля при изменении спецификации")
+    @pytest.mark.positive
+    def test_changed_spec_regenerated(self, tmp_path: Path, cache_dir: Path) -> None:
+        """Проверка, что измененная спецификация дает новый ключ и новый модуль."""
+        spec = json.loads(SWAGGER_SPEC_PATH.read_text(encoding="utf-8"))
+        del spec["paths"]["/api/auth"]
+        spec_path = tmp_path / "swagger.json"
+        spec_path.write_text(json.dumps(spec), encoding="utf-8")
+
+        module = load_generated(spec_path, cache_dir)
+
+        assert spec_key(SWAGGER_SPEC_PATH.read_bytes()) != module.SPEC_KEY
+        assert "Auth" not in module.ENDPOINTS
+        assert len(list(cache_dir.glob("swagger_*.py"))) == 1
+
+    @allure.title("Тест соответствия эндпоинтов спецификации")
+    @pytest.mark.positive
+    def test_endpoints_match_spec(self, cache_dir: Path) -> None:
+        """Проверка, что APIEndpoints покрывает ровно пути из спецификации."""
+        module = load_generated(SWAGGER_SPEC_PATH, cache_dir)
+
+        assert {path for _, path in module.ENDPOINTS.values()} == {
+            endpoint.value for endpoint in APIEndpoints
+        }
+        assert module.ENDPOINTS["LoadRequests"] == ("GET", APIEndpoints.REQUESTS.value)
+
+    @allure.title("Тест алиасов сгенерированных моделей")
+    @pytest.mark.positive
+    def test_generated_models_read_wire_names(self, cache_dir: Path) -> None:
+        """Проверка: поля в camelCase из мок-данных попадают в snake_case атрибуты."""
+        module = load_generated(SWAGGER_SPEC_PATH, cache_dir)
+
+        requests = module.VALIDATORS["LoadRequests", 200].validate_python(MOCK_REQUESTS_LIST)
+        # Спецификация описывает birthdate как date, сервер (и мок) отдает date-time.
+        user_data = {**MOCK_USER_DATA, "birthdate": "1950-07-23"}
+        user = module.VALIDATORS["LoadUserInfo", 200].validate_python(user_data)
+
+        assert isinstance(requests[0], module.HelpRequestData)
+        assert requests[0].request_goal == MOCK_REQUESTS_LIST[0]["requestGoal"]
+        assert requests[0].organization.is_verified is True
+        assert user.last_name == MOCK_USER_DATA["lastName"]
+        assert module.REQUEST_BODIES["AddToFavourites"](requestId="1").request_id == "1"
+
+    @allure.title("Тест соответствия написанных вручную моделей и мок-данных спецификации")
+    @pytest.mark.positive
+    def test_hand_written_models_match_spec(self, cache_dir: Path) -> None:
+        """Проверка: имена полей и алиасы моделей api/ и ключи мок-данных - как в спецификации."""
+        module = load_generated(SWAGGER_SPEC_PATH, cache_dir)
+
+        drift = [
+            difference
+            for name, hand in HAND_WRITTEN_MODELS.items()
+            for difference in model_drift(hand, getattr(module, name), name)
+        ]
+        unknown = [
+            *unknown_keys(MOCK_REQUESTS_LIST, module.HelpRequestData, "MOCK_REQUESTS_LIST"),
+            *unknown_keys(MOCK_USER_DATA, module.UserData, "MOCK_USER_DATA"),
+            *unknown_keys(MOCK_AUTH_SUCCESS, module.AuthResponse, "MOCK_AUTH_SUCCESS"),
+        ]
+
+        assert drift == []
+        assert unknown == []
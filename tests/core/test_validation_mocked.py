@@ -0,0 +1,138 @@
+import json
+import logging
+from unittest.mock import Mock
+
+import allure
+import pytest
+from pydantic import ValidationError
+
+from api.base_api import BaseAPI
+from api.request.models import HelpRequestData, Organization, RequestsListResponse
+from api.user.models import FavouritesListResponse, UserDataResponse
+from core.cached_response import CachedResponse
+from core.validation import ValidationLevel, ValidatorRegistry, type_adapter, validate_body
+from tests.mocks.mock_data import MOCK_FAVOURITES_LIST, MOCK_REQUESTS_LIST, MOCK_USER_DATA
+
+logger = logging.getLogger(__name__)
+
+
+def _response(body: object) -> CachedResponse:
+    """Создает CachedResponse c телом в виде JSON."""
+    return CachedResponse(status=200, url="http://mock", headers={}, body=json.dumps(body).encode())
+
+
+@allure.epic("HTTP клиент (Моки)")
+@allure.feature("Валидация тела ответа")
+@pytest.mark.mocked
+class TestValidationMocked:
+    """Мок-тесты валидации тела ответа через кэшированный TypeAdapter."""
+
+    @allure.title("Тест кэширования TypeAdapter")
+    @pytest.mark.positive
+    def test_type_adapter_cached(self) -> None:
+        """Проверка, что адаптер для типа создается один раз."""
+        assert type_adapter(RequestsListResponse) is type_adapter(list[HelpRequestData])
+
+    @allure.title("Тест валидации списков из байтов тела")
+    @pytest.mark.positive
+    def test_lists_validated_from_bytes(self) -> None:
+        """Проверка валидации списка запросов и списка избранного за один проход."""
+        requests = validate_body(_response(MOCK_REQUESTS_LIST), RequestsListResponse)
+        favourites = validate_body(_response(MOCK_FAVOURITES_LIST), FavouritesListResponse)
+
+        assert [request.id for request in requests] == [item["id"] for item in MOCK_REQUESTS_LIST]
+        assert all(isinstance(request, HelpRequestData) for request in requests)
+        assert favourites == MOCK_FAVOURITES_LIST
+
+    @allure.title("Тест однократной валидации ответа")
+    @pytest.mark.positive
+    def test_result_memoized_per_response(self) -> None:
+        """Проверка, что повторная валидация того же ответа возвращает тот же объект."""
+        response = _response(MOCK_REQUESTS_LIST)
+
+        assert validate_body(response, RequestsListResponse) is validate_body(
+            response, RequestsListResponse
+        )
+
+    @allure.title("Тест ошибок валидации")
+    @pytest.mark.negative
+    @pytest.mark.parametrize(
+        ("body", "tp"),
+        [
+            (b"not json", RequestsListResponse),
+            (b'[{"title": "no id"}]', RequestsListResponse),
+            (b'["ok", 1]', FavouritesListResponse),
+        ],
+    )
+    def test_invalid_body_raises(self, body: bytes, tp: object) -> None:
+        """Проверка, что невалидный JSON и несоответствие типу дают ValidationError."""
+        response = CachedResponse(status=200, url="http://mock", headers={}, body=body)
+
+        with pytest.raises(ValidationError):
+            validate_body(response, tp)
+
+    @allure.title("Тест валидации мок-ответа без байтов тела")
+    @pytest.mark.positive
+    def test_mocked_response_validated_from_json(self) -> None:
+        """Проверка, что мок-ответ (не CachedResponse) валидируется из json()."""
+        response = Mock()
+        response.json.return_value = MOCK_FAVOURITES_LIST
+
+        assert validate_body(response, FavouritesListResponse) == MOCK_FAVOURITES_LIST
+
+    @allure.title("Тест однократной компиляции валидатора")
+    @pytest.mark.positive
+    def test_validator_compiled_once_per_level(self) -> None:
+        """Проверка, что валидатор компилируется один раз на тип и уровень."""
+        registry = ValidatorRegistry()
+
+        assert registry.validator(HelpRequestData) is registry.validator(HelpRequestData)
+        assert registry.validator(HelpRequestData) is not registry.validator(
+            HelpRequestData, ValidationLevel.STRICT
+        )
+
+    @allure.title("Тест строгого уровня валидации")
+    @pytest.mark.negative
+    def test_strict_level_rejects_coercion(self) -> None:
+        """Проверка: строка вместо числа проходит full, но не strict."""
+        registry = ValidatorRegistry()
+        body = {**MOCK_REQUESTS_LIST[0], "contributorsCount": "10"}
+
+        assert registry.validate(_response(body), HelpRequestData).contributors_count == 10
+        with (
+            registry.use_level(ValidationLevel.STRICT),
+            pytest.raises(ValidationError),
+        ):
+            registry.validate(_response(body), HelpRequestData)
+
+    @allure.title("Тест доверенного уровня без валидации")
+    @pytest.mark.positive
+    def test_trusted_level_constructs_models(self) -> None:
+        """Проверка: trusted строит вложенные модели по алиасам, не проверяя значения."""
+        registry = ValidatorRegistry(ValidationLevel.TRUSTED)
+        body = {**MOCK_REQUESTS_LIST[0], "contributorsCount": "not a number"}
+
+        request = registry.validate(_response(body), HelpRequestData)
+        user = registry.validate(_response(MOCK_USER_DATA), UserDataResponse)
+
+        assert request.contributors_count == "not a number"
+        assert isinstance(request.organization, Organization)
+        assert request.model_fields_set == {
+            name
+            for name, field in HelpRequestData.model_fields.items()
+            if (field.alias or name) in body
+        }
+        assert user.last_name == MOCK_USER_DATA["lastName"]
+        assert user.contacts.email == MOCK_USER_DATA["contacts"]["email"]
+
+    @allure.title("Тест вложения тела ответа без повторной сериализации")
+    @pytest.mark.positive
+    def test_handle_response_attaches_raw_body(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Проверка, что во вложение идет исходное тело ответа (без model_dump_json)."""
+        attach = Mock()
+        monkeypatch.setattr("utils.allure_utils.AllureUtils.attach", attach)
+        response = _response(MOCK_REQUESTS_LIST[0])
+
+        BaseAPI(Mock())._handle_response(response, 200, HelpRequestData)  # noqa: SLF001
+
+        assert attach.call_args.kwargs["body"]() == response.text()
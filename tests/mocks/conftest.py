@@ -7,7 +7,9 @@ import pytest
 from api.auth.client import AuthClient
 from api.request.client import RequestClient
 from api.user.client import UserClient
+from core.fake_backend import FakeCharityBackend
 from core.mock_http_client import MockHTTPClient
+from tests.mocks import mock_data
 from utils.mock_factory import MockFactory, MockHTTPClientProtocol
 
 logger = logging.getLogger(__name__)
@@ -21,6 +23,26 @@ def mock_http_client() -> Generator[MockHTTPClient, Any]:
     client.clear_mocks()
 
 
+@pytest.fixture
+def fake_backend() -> FakeCharityBackend:
+    """Предоставляет FakeCharityBackend c пользователем и запросами из mock_data."""
+    backend = FakeCharityBackend()
+    backend.add_user(
+        mock_data.MOCK_USER_LOGIN, mock_data.MOCK_USER_PASSWORD, mock_data.MOCK_USER_DATA
+    )
+    for request_id in [mock_data.MOCK_HELP_REQUEST_DATA["id"], *mock_data.MOCK_FAVOURITES_LIST]:
+        backend.add_request({**mock_data.MOCK_HELP_REQUEST_DATA, "id": request_id})
+    return backend
+
+
+@pytest.fixture
+def fake_http_client(fake_backend: FakeCharityBackend) -> Generator[MockHTTPClient, Any]:
+    """Предоставляет MockHTTPClient, который обслуживает запросы через FakeCharityBackend."""
+    client = MockHTTPClient(backend=fake_backend)
+    yield client
+    client.clear_mocks()
+
+
 @pytest.fixture
 def mock_factory(mock_http_client: MockHTTPClientProtocol) -> MockFactory:
     """Предоставляет экземпляр MockFactory."""
@@ -17,6 +17,8 @@ MOCK_SERVER_ERROR_500 = {
 }
 
 # User
+MOCK_USER_LOGIN = "factory@example.com"
+MOCK_USER_PASSWORD = "factory-password-123"
 MOCK_UNAUTHORIZED_401 = {
     "error": "Unauthorized",
     "message": "Требуется аутентификация (мок Factory)",
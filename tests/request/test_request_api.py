@@ -4,7 +4,6 @@ import uuid
 
 import allure
 import pytest
-from playwright.sync_api import APIResponse
 
 from api.request.client import RequestClient
 from api.request.models import (
@@ -15,6 +14,7 @@ from api.request.models import (
     RequestContacts,
 )
 from api.user.models import Location
+from core.cached_response import CachedResponse
 
 EXISTING_REQUEST_ID = "request-id-1"
 NON_EXISTENT_REQUEST_ID = f"non-existent-{uuid.uuid4()}"
@@ -112,7 +112,7 @@ class TestRequestAPI:
             assert isinstance(response.contacts, RequestContacts)
             assert response.contacts.email == "contact@example.com"
             assert response.contacts.phone == "+123456789"
-            assert response.contacts.website == "https://example.com"
+            assert str(response.contacts.website) == "https://example.com/"
 
         with allure.step("Проверка типов запроса и требований"):  # type: ignore
             assert response.requester_type == "person"
@@ -152,7 +152,7 @@ class TestRequestAPI:
         response = request_client.get_request_details(
             request_id=NON_EXISTENT_REQUEST_ID, expected_status=404
         )  # type: ignore
-        assert isinstance(response, APIResponse), "Ожидался объект HTTP-ответа"
+        assert isinstance(response, CachedResponse), "Ожидался объект HTTP-ответа"
 
     @allure.feature("Детали запроса (GET /api/request/{id})")
     @allure.story("Получение деталей")
@@ -162,6 +162,7 @@ class TestRequestAPI:
     )
     @allure.severity(allure.severity_level.NORMAL)
     @pytest.mark.negative
+    @pytest.mark.real_api("400 на ID неверного формата; в Swagger 400 - только на отсутствующий ID")
     def test_get_request_details_bad_request(self, request_client: RequestClient) -> None:
         """
         Проверка получения деталей запроса c некорректным ID (если сервер должен возвращать 400).
@@ -173,7 +174,7 @@ class TestRequestAPI:
             "Тест: Получение деталей запроса c невалидным ID (GET /api/request/%s)", invalid_id
         )
         response = request_client.get_request_details(request_id=invalid_id, expected_status=400)  # type: ignore
-        assert isinstance(response, APIResponse), "Ожидался объект HTTP-ответа"
+        assert isinstance(response, CachedResponse), "Ожидался объект HTTP-ответа"
 
     @allure.feature("Вклад в запрос (POST /api/request/{id}/contribution)")
     @allure.story("Внесение вклада")
@@ -196,7 +197,7 @@ class TestRequestAPI:
         )  # type: ignore
 
         with allure.step("Проверка статус кода и текста ответа"):  # type: ignore
-            assert isinstance(response, APIResponse), "Ожидался объект HTTP-ответа"
+            assert isinstance(response, CachedResponse), "Ожидался объект HTTP-ответа"
             expected_text = "Вклад успешно внесен."
             assert expected_text in response.text(), (
                 f"Ожидался текст '{expected_text}', получен '{response.text()}'"
@@ -224,4 +225,4 @@ class TestRequestAPI:
         response = request_client.contribute_to_request(
             request_id=NON_EXISTENT_REQUEST_ID, expected_status=404
         )  # type: ignore
-        assert isinstance(response, APIResponse), "Ожидался объект HTTP-ответа"
+        assert isinstance(response, CachedResponse), "Ожидался объект HTTP-ответа"
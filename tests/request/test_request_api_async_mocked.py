@@ -0,0 +1,104 @@
+import asyncio
+import json
+import logging
+from collections.abc import Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+import allure
+import pytest
+from playwright.async_api import APIRequestContext
+
+from api.request.async_client import AsyncRequestClient
+from api.request.models import HelpRequestData
+from core.async_http_client import AsyncHTTPClient
+from tests.mocks.mock_data import MOCK_HELP_REQUEST_DATA, MOCK_REQUESTS_LIST
+
+logger = logging.getLogger(__name__)
+
+
+def run_in_own_loop(coroutine: Coroutine[Any, Any, Any]) -> Any:  # noqa: ANN401
+    """
+    Выполняет корутину в отдельном потоке co своим циклом событий.
+
+    Session-фикстура sync_playwright оставляет в основном потоке воркера работающий цикл
+    событий, и asyncio.run() в нем падает, если такой тест уже выполнялся раньше.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+def _async_response(status: int, json_data: dict | list) -> Mock:
+    """Создает Mock асинхронного APIResponse (body() и dispose() - корутины)."""
+    response = Mock()
+    response.status = status
+    response.status_text = "OK" if status == 200 else "Error"
+    response.url = "http://mock/api/request"
+    response.headers = {"content-type": "application/json"}
+    response.body = AsyncMock(return_value=json.dumps(json_data).encode())
+    response.dispose = AsyncMock()
+    return response
+
+
+@pytest.fixture
+def async_api_context() -> AsyncMock:
+    """Предоставляет мок асинхронного APIRequestContext."""
+    return AsyncMock(spec=APIRequestContext)
+
+
+@pytest.fixture
+def async_request_client(async_api_context: AsyncMock) -> AsyncRequestClient:
+    """Предоставляет AsyncRequestClient поверх мок-контекста."""
+    return AsyncRequestClient(AsyncHTTPClient(api_context=async_api_context))
+
+
+@allure.epic("Запросы помощи (Моки)")
+@allure.feature("Асинхронный клиент (AsyncRequestClient)")
+@pytest.mark.request
+@pytest.mark.mocked
+class TestAsyncRequestClientMocked:
+    """Мок-тесты асинхронного клиента /api/request/*."""
+
+    @allure.title("Тест получения списка запросов асинхронным клиентом")
+    @pytest.mark.positive
+    def test_get_all_requests_async_mocked(
+        self, async_request_client: AsyncRequestClient, async_api_context: AsyncMock
+    ) -> None:
+        """Проверка, что асинхронный клиент валидирует список так же, как синхронный."""
+        async_api_context.get.return_value = _async_response(200, MOCK_REQUESTS_LIST)
+        response = run_in_own_loop(async_request_client.get_all_requests(expected_status=200))
+        assert isinstance(response, list)
+        assert len(response) == len(MOCK_REQUESTS_LIST)
+        assert isinstance(response[0], HelpRequestData)
+
+    @allure.title("Тест параллельного получения деталей запросов через asyncio.gather")
+    @pytest.mark.positive
+    def test_get_request_details_gather_mocked(
+        self, async_request_client: AsyncRequestClient, async_api_context: AsyncMock
+    ) -> None:
+        """Проверка, что несколько вызовов выполняются одновременно в одном цикле событий."""
+        async_api_context.get.return_value = _async_response(200, MOCK_HELP_REQUEST_DATA)
+        request_ids = [f"req-{i}" for i in range(20)]
+
+        async def fetch_all() -> list:
+            return await asyncio.gather(
+                *(async_request_client.get_request_details(rid) for rid in request_ids)
+            )
+
+        results = run_in_own_loop(fetch_all())
+        assert len(results) == len(request_ids)
+        assert all(isinstance(item, HelpRequestData) for item in results)
+        assert async_api_context.get.await_count == len(request_ids)
+
+    @allure.title("Тест несовпадения статуса в асинхронном клиенте")
+    @pytest.mark.negative
+    def test_get_request_details_status_mismatch_async_mocked(
+        self, async_request_client: AsyncRequestClient, async_api_context: AsyncMock
+    ) -> None:
+        """Проверка, что несовпадение статуса дает AssertionError, как в BaseAPI."""
+        async_api_context.get.return_value = _async_response(404, {"message": "Not Found"})
+        with pytest.raises(AssertionError, match="404"):
+            run_in_own_loop(
+                async_request_client.get_request_details("missing", expected_status=200)
+            )
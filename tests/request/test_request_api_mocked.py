@@ -5,9 +5,12 @@ from unittest.mock import Mock
 
 import allure
 import pytest
+from playwright.sync_api import APIRequestContext, APIResponse
 
 from api.request.client import RequestClient
 from api.request.models import HelpRequestData
+from core.fake_response import FakeAPIResponse
+from core.http_client import HTTPClient
 from tests.mocks.conftest import mock_factory, mock_http_client, mock_request_client  # noqa: F401
 from tests.mocks.mock_data import (
     MOCK_CONTRIBUTION_SUCCESS_TEXT,
@@ -74,7 +77,7 @@ class TestRequestAPIMockedFactory:
         response = mock_request_client.get_all_requests(expected_status=500)  # type: ignore
         with allure.step("Проверка типа и тела ответа"):  # type: ignore
             assert not isinstance(response, list)
-            assert isinstance(response, Mock)
+            assert isinstance(response, FakeAPIResponse)
             assert response.status == 500
             try:
                 error_body = response.json()
@@ -83,6 +86,47 @@ class TestRequestAPIMockedFactory:
                 pytest.fail("Тело ответа 500 не является валидным JSON")
         logger.info("Мок-ответ 500 для GET /api/request обработан.")
 
+    @allure.feature("Список запросов (GET /api/request)")
+    @allure.story("Потоковый разбор списка (Мок)")
+    @allure.title("Тест потокового получения списка запросов (c MockFactory)")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.positive
+    def test_iter_requests_success_mocked(
+        self,
+        mock_request_client: RequestClient,  # noqa: F811
+        mock_factory: MockFactory,  # noqa: F811
+    ) -> None:
+        """Проверка, что iter_requests выдает те же модели, что и get_all_requests."""
+        mock_factory.request.get_all_success()
+
+        requests = list(mock_request_client.iter_requests())
+
+        assert [request.id for request in requests] == [item["id"] for item in MOCK_REQUESTS_LIST]
+        assert all(isinstance(request, HelpRequestData) for request in requests)
+
+    @allure.feature("Список запросов (GET /api/request)")
+    @allure.story("Потоковый разбор списка (Мок)")
+    @allure.title("Тест ошибки валидации элемента при потоковом разборе")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.negative
+    def test_iter_requests_invalid_item(self) -> None:
+        """Проверка: валидные элементы выдаются, на невалидном - AssertionError."""
+        raw_response = Mock(spec=APIResponse)
+        raw_response.status = 200
+        raw_response.status_text = "OK"
+        raw_response.url = "http://mock/api/request"
+        raw_response.headers = {}
+        raw_response.body.return_value = json.dumps(
+            [MOCK_REQUESTS_LIST[0], {"title": "без id"}]
+        ).encode()
+        api_context = Mock(spec=APIRequestContext)
+        api_context.fetch.return_value = raw_response
+        requests = RequestClient(HTTPClient(api_context=api_context)).iter_requests()
+
+        assert next(requests).id == MOCK_REQUESTS_LIST[0]["id"]
+        with pytest.raises(AssertionError, match="iter_requests"):
+            next(requests)
+
     @allure.feature("Детали запроса (GET /api/request/{id})")
     @allure.story("Получение деталей (Мок)")
     @allure.title("Тест успешного получения деталей существующего запроса (c MockFactory)")
@@ -129,7 +173,7 @@ class TestRequestAPIMockedFactory:
         )  # type: ignore
         with allure.step("Проверка типа и тела ответа"):  # type: ignore
             assert not isinstance(response, HelpRequestData)
-            assert isinstance(response, Mock)
+            assert isinstance(response, FakeAPIResponse)
             assert response.status == 404
             try:
                 error_body = response.json()
@@ -154,7 +198,7 @@ class TestRequestAPIMockedFactory:
             request_id=MOCK_EXISTING_REQUEST_ID, expected_status=200
         )  # type: ignore
         with allure.step("Проверка типа и текста ответа"):  # type: ignore
-            assert isinstance(response, Mock)
+            assert isinstance(response, FakeAPIResponse)
             assert response.status == 200
             assert MOCK_CONTRIBUTION_SUCCESS_TEXT in response.text()
         logger.info("Мок-ответ o успешном вкладе получен.")
@@ -176,7 +220,7 @@ class TestRequestAPIMockedFactory:
             request_id=MOCK_NON_EXISTENT_REQUEST_ID, expected_status=404
         )  # type: ignore
         with allure.step("Проверка типа и тела ответа"):  # type: ignore
-            assert isinstance(response, Mock)
+            assert isinstance(response, FakeAPIResponse)
             assert response.status == 404
             try:
                 error_body = response.json()
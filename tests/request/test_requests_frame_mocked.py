@@ -0,0 +1,145 @@
+import datetime as dt
+import json
+import logging
+import math
+
+import allure
+import numpy as np
+import pytest
+
+from api.request.client import RequestClient
+from api.request.frame import RequestsFrame
+from api.request.models import HelpRequestData
+from tests.mocks.conftest import mock_factory, mock_http_client, mock_request_client  # noqa: F401
+from tests.mocks.mock_data import MOCK_HELP_REQUEST_DATA, MOCK_REQUESTS_LIST
+from utils.mock_factory import MockFactory
+
+logger = logging.getLogger(__name__)
+
+TODAY = dt.date(2030, 1, 1)
+
+
+def _request(request_id: str, **fields: object) -> dict[str, object]:
+    """Создает элемент списка запросов c заданными полями."""
+    return {**MOCK_HELP_REQUEST_DATA, "id": request_id, **fields}
+
+
+ITEMS = [
+    _request(
+        "r1",
+        helpType="finance",
+        requestGoal=1000,
+        requestGoalCurrentValue=250,
+        endingDate="2030-01-03",
+        location={"city": "Москва"},
+    ),
+    _request(
+        "r2",
+        helpType="finance",
+        requestGoal=3000,
+        requestGoalCurrentValue=3000,
+        endingDate="2030-02-01",
+        location={"city": "Казань"},
+    ),
+    _request(
+        "r3",
+        helpType="material",
+        requestGoal=None,
+        requestGoalCurrentValue=10,
+        endingDate=None,
+        location=None,
+    ),
+    _request(
+        "r4", helpType=None, requestGoal=500, requestGoalCurrentValue=0, endingDate="2030-01-08"
+    ),
+]
+
+
+@pytest.fixture
+def frame() -> RequestsFrame:
+    """Предоставляет таблицу, построенную из тела ответа."""
+    return RequestsFrame.from_body(json.dumps(ITEMS, ensure_ascii=False).encode())
+
+
+@allure.epic("Запросы помощи (Моки)")
+@allure.feature("Колоночная таблица запросов (RequestsFrame)")
+@pytest.mark.request
+@pytest.mark.mocked
+class TestRequestsFrameMocked:
+    """Мок-тесты RequestsFrame."""
+
+    @allure.title("Тест колонок, построенных из тела ответа")
+    @pytest.mark.positive
+    def test_columns_from_body(self, frame: RequestsFrame) -> None:
+        """Проверка числовых колонок (NaN для null), дат (NaT) и словарного кодирования."""
+        assert list(frame.ids) == ["r1", "r2", "r3", "r4"]
+        assert frame.request_goal.dtype == np.float64
+        assert math.isnan(frame.request_goal[2])
+        assert np.isnat(frame.ending_date[2])
+        assert frame.help_type.categories == ("finance", "material")
+        assert list(frame.help_type.codes) == [0, 0, 1, -1]
+        assert [frame.city[row] for row in range(len(frame))] == ["Москва", "Казань", None, None]
+
+    @allure.title("Тест векторных фильтров")
+    @pytest.mark.positive
+    def test_filter(self, frame: RequestsFrame) -> None:
+        """Проверка фильтра по категории и по окну дат окончания."""
+        ending_soon = frame.filter(frame.help_type.eq("finance") & frame.ending_within(7, TODAY))
+
+        assert list(ending_soon.ids) == ["r1"]
+        assert list(frame.filter(frame.help_type.eq(None)).ids) == ["r4"]
+        assert len(frame.filter(frame.help_type.eq("unknown"))) == 0
+
+    @allure.title("Тест агрегаций по группам")
+    @pytest.mark.positive
+    def test_group_by(self, frame: RequestsFrame) -> None:
+        """Проверка sum / mean / count по категориям, null-ключи - в группе None."""
+        assert frame.group_by("help_type", "request_goal") == {
+            None: 500.0,
+            "finance": 4000.0,
+            "material": 0.0,
+        }
+        means = frame.group_by("help_type", "request_goal", how="mean")
+        assert means["finance"] == 2000.0
+        assert math.isnan(means["material"])
+        assert frame.group_by("city", how="count") == {None: 2.0, "Москва": 1.0, "Казань": 1.0}
+        with pytest.raises(ValueError, match="requires a column"):
+            frame.group_by("help_type", how="mean")
+
+    @allure.title("Тест доли собранных средств")
+    @pytest.mark.positive
+    def test_funding_progress(self, frame: RequestsFrame) -> None:
+        """Проверка доли собранных средств (NaN без цели)."""
+        progress = frame.funding_progress()
+
+        assert progress[0] == 0.25
+        assert progress[1] == 1.0
+        assert math.isnan(progress[2])
+
+    @allure.title("Тест доступа к строке как к HelpRequestData")
+    @pytest.mark.positive
+    def test_row_access(self, frame: RequestsFrame) -> None:
+        """Проверка, что строка (и после фильтра) валидируется в HelpRequestData."""
+        row = frame.filter(frame.help_type.eq("material")).row(0)
+
+        assert isinstance(row, HelpRequestData)
+        assert row.id == "r3"
+        assert row.help_type == frame.help_type[2]
+        assert row.request_goal_current_value == frame.request_goal_current_value[2]
+        assert frame.row(0).ending_date == frame.ending_date[0].astype(object)
+        assert [request.id for request in frame.rows()] == ["r1", "r2", "r3", "r4"]
+
+    @allure.title("Тест получения таблицы через клиент (c MockFactory)")
+    @pytest.mark.positive
+    def test_client_frame_mocked(
+        self,
+        mock_request_client: RequestClient,  # noqa: F811
+        mock_factory: MockFactory,  # noqa: F811
+    ) -> None:
+        """Проверка, что get_requests_frame строит таблицу по ответу GET /api/request."""
+        mock_factory.request.get_all_success()
+
+        frame = mock_request_client.get_requests_frame()
+
+        assert list(frame.ids) == [item["id"] for item in MOCK_REQUESTS_LIST]
+        assert frame.group_by("help_type", "request_goal") == {"finance": 1000.0}
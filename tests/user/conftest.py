@@ -5,7 +5,7 @@ from typing import Any
 import pytest
 
 from api.user.client import UserClient
-from api.user.models import AddToFavouritesPayload
+from api.user.models import AddToFavouritesPayload, FavouritesSet
 from tests.user.test_user_api import FAV_REQUEST_ID_TO_TEST
 
 logger = logging.getLogger(__name__)
@@ -29,8 +29,8 @@ def setup_favourite(authenticated_user_client: UserClient) -> Generator[str, Any
 
     logger.info("Teardown: Попытка удалить %s из избранного...", FAV_REQUEST_ID_TO_TEST)
     try:
-        current_favs = authenticated_user_client.get_favourites(expected_status=200)
-        if isinstance(current_favs, list) and FAV_REQUEST_ID_TO_TEST in current_favs:
+        current_favs = authenticated_user_client.get_favourites(expected_status=200, as_set=True)
+        if isinstance(current_favs, FavouritesSet) and FAV_REQUEST_ID_TO_TEST in current_favs:
             authenticated_user_client.remove_from_favourites(
                 request_id=FAV_REQUEST_ID_TO_TEST, expected_status=200
             )  # type: ignore
@@ -3,10 +3,10 @@ import uuid
 
 import allure
 import pytest
-from playwright.sync_api import APIResponse
 
 from api.user.client import UserClient
-from api.user.models import Contacts, SocialContacts, UserDataResponse
+from api.user.models import Contacts, FavouritesSet, SocialContacts, UserDataResponse
+from core.cached_response import CachedResponse
 
 FAV_REQUEST_ID_TO_TEST = f"test-fav-{uuid.uuid4()}"
 NON_EXISTENT_ID = f"non-existent-{uuid.uuid4()}"
@@ -26,6 +26,7 @@ class TestUserAPI:
     @allure.severity(allure.severity_level.CRITICAL)
     @pytest.mark.smoke
     @pytest.mark.positive
+    @pytest.mark.real_api("проверяет профиль тестового аккаунта, a не примеры из Swagger")
     def test_get_user_info_success(self, authenticated_user_client: UserClient) -> None:
         """
         Проверка успешного получения информации o текущем пользователе.
@@ -84,7 +85,7 @@ class TestUserAPI:
         """
         logger.info("Тест: Получение данных пользователя без авторизации (GET /api/user)")
         response = user_client.get_user_info(expected_status=401)  # type: ignore
-        assert isinstance(response, APIResponse), "Ожидался объект HTTP-ответа"
+        assert isinstance(response, CachedResponse), "Ожидался объект HTTP-ответа"
 
     @allure.feature("Избранное пользователя (DELETE /api/user/favourites/{id})")
     @allure.story("Удаление из избранного")
@@ -105,7 +106,7 @@ class TestUserAPI:
         )  # type: ignore
 
         with allure.step("Проверка статус кода и текста ответа"):  # type: ignore
-            assert isinstance(response, APIResponse), "Ожидался сырой ответ APIResponse"
+            assert isinstance(response, CachedResponse), "Ожидался сырой ответ CachedResponse"
             expected_text = "Запрос успешно удален из избранного."
             assert expected_text in response.text(), (
                 f"Ожидался текст '{expected_text}', получен '{response.text()}'"
@@ -113,8 +114,10 @@ class TestUserAPI:
         logger.info("Ответ сервера: %s", response.text())
 
         with allure.step("Проверка отсутствия элемента в списке избранного после удаления"):  # type: ignore
-            favourites_list = authenticated_user_client.get_favourites(expected_status=200)
-            assert isinstance(favourites_list, list)
+            favourites_list = authenticated_user_client.get_favourites(
+                expected_status=200, as_set=True
+            )
+            assert isinstance(favourites_list, FavouritesSet)
             assert FAV_REQUEST_ID_TO_TEST not in favourites_list, (
                 f"ID {FAV_REQUEST_ID_TO_TEST} все еще найден в списке избранного после удаления"
             )
@@ -134,7 +137,7 @@ class TestUserAPI:
         """
         logger.info("Тест: Удаление из избранного без авторизации (DELETE ...)")
         response = user_client.remove_from_favourites(request_id="any-id", expected_status=401)  # type: ignore
-        assert isinstance(response, APIResponse), "Ожидался объект HTTP-ответа"
+        assert isinstance(response, CachedResponse), "Ожидался объект HTTP-ответа"
 
     @allure.feature("Избранное пользователя (DELETE /api/user/favourites/{id})")
     @allure.story("Удаление из избранного")
@@ -156,4 +159,4 @@ class TestUserAPI:
         response = authenticated_user_client.remove_from_favourites(
             request_id=NON_EXISTENT_ID, expected_status=400
         )  # type: ignore
-        assert isinstance(response, APIResponse), "Ожидался объект HTTP-ответа"
+        assert isinstance(response, CachedResponse), "Ожидался объект HTTP-ответа"
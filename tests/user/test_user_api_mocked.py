@@ -2,7 +2,6 @@ import datetime
 import json
 import logging
 import uuid
-from unittest.mock import Mock
 
 import allure
 import pytest
@@ -11,6 +10,7 @@ from api.user.client import UserClient
 from api.user.models import (
     UserDataResponse,
 )
+from core.fake_response import FakeAPIResponse
 from tests.mocks.conftest import mock_factory, mock_http_client, mock_user_client  # noqa: F401
 from tests.mocks.mock_data import (
     MOCK_FAVOURITES_DELETE_SUCCESS_TEXT,
@@ -83,7 +83,7 @@ class TestUserAPIMockedFactory:
             assert not isinstance(response, UserDataResponse), (
                 "При ошибке 401 не должен возвращаться UserDataResponse"
             )
-            assert isinstance(response, Mock), "Ожидался объект Mock при статусе 401"
+            assert isinstance(response, FakeAPIResponse), "Ожидался FakeAPIResponse при статусе 401"
             assert response.status == 401, "Ожидался статус 401"
             try:
                 error_body = response.json()
@@ -109,7 +109,9 @@ class TestUserAPIMockedFactory:
             request_id=MOCK_FAV_ID_EXISTS, expected_status=200
         )  # type: ignore
         with allure.step("Проверка типа и текста ответа"):  # type: ignore
-            assert isinstance(response, Mock), "Ожидался объект Mock при статусе 200 (text/plain)"
+            assert isinstance(response, FakeAPIResponse), (
+                "Ожидался FakeAPIResponse при статусе 200 (text/plain)"
+            )
             assert response.status == 200
             assert MOCK_FAVOURITES_DELETE_SUCCESS_TEXT in response.text()
         logger.info("Мок-ответ o успешном удалении получен.")
@@ -131,7 +133,7 @@ class TestUserAPIMockedFactory:
             request_id=MOCK_NON_EXISTENT_FAV_ID, expected_status=400
         )  # type: ignore
         with allure.step("Проверка типа и тела ответа"):  # type: ignore
-            assert isinstance(response, Mock), "Ожидался объект Mock при статусе 400"
+            assert isinstance(response, FakeAPIResponse), "Ожидался FakeAPIResponse при статусе 400"
             assert response.status == 400
             try:
                 error_body = response.json()
@@ -154,7 +156,7 @@ class TestUserAPIMockedFactory:
         mock_factory.user.remove_favourite_unauthorized(request_id="any-id")
         response = mock_user_client.remove_from_favourites(request_id="any-id", expected_status=401)  # type: ignore
         with allure.step("Проверка типа и тела ответа"):  # type: ignore
-            assert isinstance(response, Mock), "Ожидался объект Mock при статусе 401"
+            assert isinstance(response, FakeAPIResponse), "Ожидался FakeAPIResponse при статусе 401"
             assert response.status == 401
             try:
                 error_body = response.json()
@@ -2,10 +2,10 @@ import logging
 
 import allure
 import pytest
-from playwright.sync_api import APIResponse
 
 from api.user.client import UserClient
-from api.user.models import AddToFavouritesPayload
+from api.user.models import AddToFavouritesPayload, FavouritesSet
+from core.cached_response import CachedResponse
 
 TEST_REQUEST_ID = "request-id-1"
 ANOTHER_REQUEST_ID = "another-request-id-456"
@@ -48,6 +48,7 @@ class TestUserFavouritesAPI:
     @allure.description("Проверяем, что неавторизованный пользователь получает ошибку 403.")
     @allure.severity(allure.severity_level.CRITICAL)
     @pytest.mark.negative
+    @pytest.mark.real_api("403 без токена (docs/BUG_REPORTS.md, #1); в Swagger - 401")
     def test_get_favourites_unauthorized(self, user_client: UserClient) -> None:
         """
         Проверка получения списка избранного без аутентификации.
@@ -56,7 +57,7 @@ class TestUserFavouritesAPI:
         """
         logger.info("Тест: Получение избранного без авторизации (GET /api/user/favourites)")
         response = user_client.get_favourites(expected_status=403)  # Swagger 401
-        assert isinstance(response, APIResponse), "Ожидался объект HTTP-ответа"
+        assert isinstance(response, CachedResponse), "Ожидался объект HTTP-ответа"
 
     @allure.story("Добавление в избранное")
     @allure.title("Тест успешного добавления запроса в избранное")
@@ -80,7 +81,7 @@ class TestUserFavouritesAPI:
         response = authenticated_user_client.add_to_favourites(payload=payload, expected_status=200)  # type: ignore
 
         with allure.step("Проверка статус кода и текста ответа"):  # type: ignore
-            assert isinstance(response, APIResponse), "Ожидался объект HTTP-ответа"
+            assert isinstance(response, CachedResponse), "Ожидался объект HTTP-ответа"
             expected_text = "Запрос успешно добавлен в избранное."
             assert expected_text in response.text(), (
                 f"Ожидался текст '{expected_text}', получен '{response.text()}'"
@@ -88,8 +89,10 @@ class TestUserFavouritesAPI:
         logger.info("Ответ сервера: %s", response.text())
 
         with allure.step("Проверка наличия элемента в списке избранного после добавления"):  # type: ignore
-            favourites_list = authenticated_user_client.get_favourites(expected_status=200)
-            assert isinstance(favourites_list, list)
+            favourites_list = authenticated_user_client.get_favourites(
+                expected_status=200, as_set=True
+            )
+            assert isinstance(favourites_list, FavouritesSet)
             assert TEST_REQUEST_ID in favourites_list, (
                 f"ID {TEST_REQUEST_ID} не найден в списке избранного после добавления"
             )
@@ -1,13 +1,15 @@
 import json
 import logging
 import uuid
-from unittest.mock import Mock
 
 import allure
 import pytest
+from pydantic import TypeAdapter, ValidationError
 
 from api.user.client import UserClient
-from api.user.models import AddToFavouritesPayload
+from api.user.models import AddToFavouritesPayload, FavouritesSet
+from core.fake_response import FakeAPIResponse
+from core.validation import ValidationLevel, ValidatorRegistry
 from tests.mocks.conftest import mock_factory, mock_http_client, mock_user_client  # noqa: F401
 from tests.mocks.mock_data import (
     MOCK_FAVOURITES_ADD_SUCCESS_TEXT,
@@ -49,6 +51,42 @@ class TestUserFavouritesAPIMockedFactory:
             assert response == MOCK_FAVOURITES_LIST
         logger.info("Мок-список избранного получен: %s", response)
 
+    @allure.story("Получение списка избранного (Мок)")
+    @allure.title("Тест получения избранного как множества (c MockFactory)")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.positive
+    def test_get_favourites_as_set_mocked(
+        self,
+        mock_user_client: UserClient,  # noqa: F811
+        mock_factory: MockFactory,  # noqa: F811
+    ) -> None:
+        """Проверка FavouritesSet: порядок, проверка `in` и сравнение c ожидаемым набором."""
+        mock_factory.user.get_favourites_success_list()
+        response = mock_user_client.get_favourites(expected_status=200, as_set=True)
+        with allure.step("Проверка типа и содержимого ответа"):  # type: ignore
+            assert isinstance(response, FavouritesSet)
+            assert list(response) == MOCK_FAVOURITES_LIST
+            assert MOCK_FAVOURITES_LIST[0] in response
+            assert response == set(MOCK_FAVOURITES_LIST)
+            expected = {MOCK_FAVOURITES_LIST[0], "missing-id"}
+            assert expected - response == FavouritesSet(["missing-id"])
+            assert list(response - expected) == MOCK_FAVOURITES_LIST[1:]
+
+    @allure.story("Получение списка избранного (Мок)")
+    @allure.title("Тест FavouritesSet: дубликаты и невалидные элементы")
+    @allure.severity(allure.severity_level.MINOR)
+    @pytest.mark.negative
+    def test_favourites_set_validation(self) -> None:
+        """Проверка: дубликаты хранятся один раз, не-строки отклоняются при разборе."""
+        favourites = TypeAdapter(FavouritesSet).validate_json(b'["b", "a", "b"]')
+
+        assert list(favourites) == ["b", "a"]
+        assert hash(favourites) == hash(frozenset({"a", "b"}))
+        trusted = ValidatorRegistry(ValidationLevel.TRUSTED).validator(FavouritesSet)
+        assert isinstance(trusted.validate_json(b'["a"]'), FavouritesSet)
+        with pytest.raises(ValidationError):
+            TypeAdapter(FavouritesSet).validate_json(b'["a", 1]')
+
     @allure.story("Получение списка избранного (Мок)")
     @allure.title("Тест получения списка избранного без аутентификации (c MockFactory)")
     @allure.severity(allure.severity_level.CRITICAL)
@@ -65,7 +103,7 @@ class TestUserFavouritesAPIMockedFactory:
         mock_factory.user.get_favourites_unauthorized()
         response = mock_user_client.get_favourites(expected_status=401)
         with allure.step("Проверка типа и тела ответа"):  # type: ignore
-            assert isinstance(response, Mock)
+            assert isinstance(response, FakeAPIResponse)
             assert response.status == 401
             try:
                 error_body = response.json()
@@ -91,7 +129,7 @@ class TestUserFavouritesAPIMockedFactory:
         payload = AddToFavouritesPayload(requestId=f"new-mock-id-{uuid.uuid4()}")
         response = mock_user_client.add_to_favourites(payload=payload, expected_status=200)  # type: ignore
         with allure.step("Проверка типа и текста ответа"):  # type: ignore
-            assert isinstance(response, Mock)
+            assert isinstance(response, FakeAPIResponse)
             assert MOCK_FAVOURITES_ADD_SUCCESS_TEXT in response.text()
         logger.info("Мок-ответ o успешном добавлении получен.")
 
@@ -113,7 +151,7 @@ class TestUserFavouritesAPIMockedFactory:
         payload = AddToFavouritesPayload(requestId="any-id")
         response = mock_user_client.add_to_favourites(payload=payload, expected_status=401)  # type: ignore
         with allure.step("Проверка типа и тела ответа"):  # type: ignore
-            assert isinstance(response, Mock)
+            assert isinstance(response, FakeAPIResponse)
             assert response.status == 401
             try:
                 error_body = response.json()
@@ -0,0 +1,103 @@
+import random
+from unittest.mock import Mock, patch
+
+import allure
+import pytest
+
+from utils.allure_utils import AllureUtils
+from utils.attachment_policy import AttachmentMode, AttachmentPolicy
+
+
+@allure.epic("Утилиты (Моки)")
+@allure.feature("Политика Allure-вложений")
+@pytest.mark.mocked
+class TestAttachmentPolicy:
+    """Тесты разбора политики вложений и отложенного форматирования."""
+
+    @allure.title("Тест разбора строкового описания политики: {spec}")
+    @pytest.mark.positive
+    @pytest.mark.parametrize(
+        ("spec", "expected"),
+        [
+            ("always", AttachmentPolicy(mode=AttachmentMode.ALWAYS)),
+            ("On-Failure", AttachmentPolicy(mode=AttachmentMode.ON_FAILURE)),
+            ("sampled:0.25", AttachmentPolicy(mode=AttachmentMode.SAMPLED, sample_rate=0.25)),
+            (
+                "size-capped:1024",
+                AttachmentPolicy(mode=AttachmentMode.SIZE_CAPPED, max_body_bytes=1024),
+            ),
+            ("never", AttachmentPolicy(mode=AttachmentMode.NEVER)),
+        ],
+    )
+    def test_parse_policy(self, spec: str, expected: AttachmentPolicy) -> None:
+        """Проверка разбора корректных описаний политики."""
+        assert AttachmentPolicy.parse(spec) == expected
+
+    @allure.title("Тест отклонения некорректной политики: {spec}")
+    @pytest.mark.negative
+    @pytest.mark.parametrize("spec", ["sometimes", "sampled:1.5", "size-capped:-1"])
+    def test_parse_invalid_policy(self, spec: str) -> None:
+        """Проверка, что некорректное описание дает ValueError."""
+        with pytest.raises(ValueError, match=r"\S"):
+            AttachmentPolicy.parse(spec)
+
+    @allure.title("Тест доли выборки в режиме sampled")
+    @pytest.mark.positive
+    def test_sampled_policy_rate(self) -> None:
+        """Проверка, что sampled прикладывает примерно заданную долю ответов."""
+        policy = AttachmentPolicy(
+            mode=AttachmentMode.SAMPLED, sample_rate=0.2, rng=random.Random(42)
+        )
+        decisions = [policy.should_attach() for _ in range(1000)]
+        assert 150 < sum(decisions) < 250
+
+    @allure.title("Тест отсутствия форматирования при политике never")
+    @pytest.mark.attach_policy("never")
+    @pytest.mark.positive
+    def test_never_policy_does_not_build_body(self) -> None:
+        """Проверка, что при never тело вложения даже не строится."""
+        build_body = Mock(return_value="body")
+        with patch("allure.attach") as allure_attach:
+            AllureUtils.attach(build_body, name="lazy")
+        build_body.assert_not_called()
+        allure_attach.assert_not_called()
+
+    @allure.title("Тест отложенных вложений в режиме on-failure")
+    @pytest.mark.attach_policy("on-failure")
+    @pytest.mark.positive
+    def test_on_failure_policy_defers_until_flush(self) -> None:
+        """Проверка, что on-failure откладывает вложения и добавляет их только по запросу."""
+        build_body = Mock(return_value="body")
+        with patch("allure.attach") as allure_attach:
+            AllureUtils.attach(build_body, name="lazy")
+            build_body.assert_not_called()
+            AllureUtils.flush_deferred(attach=True)
+        build_body.assert_called_once()
+        allure_attach.assert_called_once()
+
+    @allure.title("Тест усечения большого тела в режиме size-capped")
+    @pytest.mark.attach_policy("size-capped:16")
+    @pytest.mark.positive
+    def test_size_capped_policy_truncates_body(self) -> None:
+        """Проверка, что тело больше лимита прикладывается усеченным и без форматирования."""
+        response = Mock(status=200, url="http://mock/api/request", headers={})
+        response.body.return_value = b"x" * 100
+        with patch("allure.attach") as allure_attach:
+            AllureUtils.attach_response(response)
+        response.json.assert_not_called()
+        body_call = allure_attach.call_args_list[-1]
+        assert body_call.kwargs["name"] == "Response Body (Truncated)"
+        assert body_call.kwargs["body"].startswith("x" * 16 + "\n")
+
+    @allure.title("Тест лимита size-capped в байтах для кириллицы")
+    @pytest.mark.attach_policy("size-capped:15")
+    @pytest.mark.negative
+    def test_size_capped_policy_counts_bytes(self) -> None:
+        """Проверка: 10 букв кириллицы (20 байт) больше лимита 15 байт, символ не разрезается."""
+        response = Mock(status=200, url="http://mock/api/request", headers={})
+        response.body.return_value = ("я" * 9 + "ж").encode()
+        with patch("allure.attach") as allure_attach:
+            AllureUtils.attach_response(response)
+        body_call = allure_attach.call_args_list[-1]
+        assert body_call.kwargs["name"] == "Response Body (Truncated)"
+        assert body_call.kwargs["body"].startswith("я" * 7 + "\n[... тело усечено: 20 > 15")
@@ -1,35 +1,133 @@
 import json
 import logging
+from collections import deque
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from typing import ClassVar
 
 import allure
 from allure_commons.types import AttachmentType
-from playwright.sync_api import APIResponse
+
+from config.config import ALLURE_ATTACH_POLICY
+from core.cached_response import CachedResponse
+from core.json_codec import codec
+from utils.attachment_policy import AttachmentMode, AttachmentPolicy
 
 logger = logging.getLogger(__name__)
 
+# Сколько последних отложенных вложений хранится в режиме on-failure.
+DEFERRED_ATTACHMENTS_LIMIT = 200
+
 
 class AllureUtils:
-    """Утилиты для добавления деталей API ответов в Allure отчеты."""
+    """
+    Утилиты для добавления деталей API ответов в Allure отчеты.
+
+    Вложения проходят через текущую AttachmentPolicy: тело форматируется только тогда,
+    когда политика решила приложить ответ.
+    """
+
+    policy: ClassVar[AttachmentPolicy] = AttachmentPolicy.parse(ALLURE_ATTACH_POLICY)
+    _deferred: ClassVar[deque[Callable[[], None]]] = deque(maxlen=DEFERRED_ATTACHMENTS_LIMIT)
+
+    @classmethod
+    @contextmanager
+    def use_policy(cls, policy: AttachmentPolicy) -> Generator[AttachmentPolicy]:
+        """Временно устанавливает политику вложений (например, на время одного теста)."""
+        previous = cls.policy
+        cls.policy = policy
+        cls._deferred.clear()
+        try:
+            yield policy
+        finally:
+            cls.policy = previous
+            cls._deferred.clear()
+
+    @classmethod
+    def flush_deferred(cls, *, attach: bool) -> None:
+        """
+        Обрабатывает вложения, отложенные политикой `on-failure`.
+
+        Args:
+            attach: True - добавить вложения в отчет (тест упал), False - отбросить их.
+        """
+        pending = list(cls._deferred)
+        cls._deferred.clear()
+        if attach:
+            logger.debug("Добавление %s отложенных вложений в отчет", len(pending))
+            for action in pending:
+                action()
+
+    @classmethod
+    def attach(
+        cls,
+        body: str | Callable[[], str],
+        name: str,
+        attachment_type: AttachmentType = AttachmentType.TEXT,
+    ) -> None:
+        """
+        Добавляет вложение c учетом текущей политики.
+
+        Args:
+            body: Тело вложения или функция, строящая тело (вызывается только если
+                вложение действительно добавляется).
+            name: Имя вложения.
+            attachment_type: Тип вложения Allure.
+        """
+        if not cls.policy.should_attach():
+            return
+
+        def action() -> None:
+            allure.attach(
+                body=body() if callable(body) else body,
+                name=name,
+                attachment_type=attachment_type,
+            )
+
+        cls._submit([action])
 
     @staticmethod
-    def attach_response(response: APIResponse) -> None:
+    def attach_response(response: CachedResponse) -> None:
         """Добавляет детали ответа API в Allure отчет."""
-        # Статус код и URL
+        if not AllureUtils.policy.should_attach():
+            return
+        AllureUtils._submit(
+            [
+                lambda: AllureUtils._attach_status(response.status, response.url),
+                lambda: AllureUtils._attach_headers(response),
+                lambda: AllureUtils._attach_body(response),
+            ]
+        )
+
+    @classmethod
+    def _submit(cls, actions: list[Callable[[], None]]) -> None:
+        """Выполняет действия по добавлению вложений сразу или откладывает их до итога теста."""
+        if cls.policy.deferred:
+            cls._deferred.extend(actions)
+            return
+        for action in actions:
+            action()
+
+    @staticmethod
+    def _attach_status(status: int, url: str) -> None:
+        """Статус код и URL."""
         allure.attach(
-            body=str(response.status),
-            name=f"Status Code: {response.status}",
+            body=str(status),
+            name=f"Status Code: {status}",
             attachment_type=AttachmentType.TEXT,
         )
         allure.attach(
-            body=response.url,
+            body=url,
             name="Request URL",
             attachment_type=AttachmentType.URI_LIST,
         )
 
-        # Заголовки ответа
+    @staticmethod
+    def _attach_headers(response: CachedResponse) -> None:
+        """Заголовки ответа."""
         try:
             headers_dict: dict[str, str] = response.headers
-            headers_json = json.dumps(headers_dict, indent=4, ensure_ascii=False)
+            headers_json = codec.dumps_pretty(headers_dict)
             headers_name = "Response Headers (JSON)"
             headers_attach_type = AttachmentType.JSON
         except Exception as e:  # noqa: BLE001
@@ -47,14 +145,29 @@ class AllureUtils:
             attachment_type=headers_attach_type,
         )
 
-        # Тело ответа
+    @staticmethod
+    def _attach_body(response: CachedResponse) -> None:
+        """Тело ответа: JSON форматируется, слишком большие тела (size-capped) усекаются."""
         formatted_body: str
         attach_type: AttachmentType
         body_name: str
 
+        policy = AllureUtils.policy
+        if policy.mode is AttachmentMode.SIZE_CAPPED:
+            body = response.body()
+            if policy.exceeds_cap(len(body)):
+                # Усечение по границе байтов; разрезанный многобайтный символ отбрасывается.
+                head = body[: policy.max_body_bytes].decode("utf-8", errors="ignore")
+                allure.attach(
+                    body=head + f"\n[... тело усечено: {len(body)} > {policy.max_body_bytes} байт]",
+                    name="Response Body (Truncated)",
+                    attachment_type=AttachmentType.TEXT,
+                )
+                return
+
         try:
             response_json = response.json()
-            formatted_body = json.dumps(response_json, indent=4, ensure_ascii=False)
+            formatted_body = codec.dumps_pretty(response_json)
             attach_type = AttachmentType.JSON
             body_name = "Response Body (JSON)"
 
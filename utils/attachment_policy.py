@@ -0,0 +1,95 @@
+import random
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+
+class AttachmentMode(StrEnum):
+    """Режимы добавления деталей ответов в Allure отчет."""
+
+    ALWAYS = "always"
+    ON_FAILURE = "on-failure"
+    SAMPLED = "sampled"
+    SIZE_CAPPED = "size-capped"
+    NEVER = "never"
+
+
+DEFAULT_SIZE_CAP = 64 * 1024
+
+
+@dataclass(frozen=True)
+class AttachmentPolicy:
+    """
+    Политика добавления вложений в Allure отчет.
+
+    Задается строкой вида `always`, `on-failure`, `sampled:0.1`, `size-capped:65536` или
+    `never` (см. `AttachmentPolicy.parse`):
+
+    * `always` - вложения добавляются для каждого ответа;
+    * `on-failure` - вложения откладываются и добавляются, только если тест упал;
+    * `sampled:<rate>` - вложения добавляются для доли ответов `rate` (0..1);
+    * `size-capped:<bytes>` - тела больше `bytes` прикладываются усеченными, без форматирования;
+    * `never` - вложения не добавляются.
+    """
+
+    mode: AttachmentMode = AttachmentMode.ALWAYS
+    sample_rate: float = 1.0
+    max_body_bytes: int = DEFAULT_SIZE_CAP
+    rng: random.Random = field(default_factory=random.Random, compare=False, repr=False)
+
+    @classmethod
+    def parse(cls, spec: str) -> "AttachmentPolicy":
+        """
+        Создает политику из строкового описания.
+
+        Args:
+            spec: Описание политики, например `sampled:0.25`.
+
+        Returns:
+            AttachmentPolicy: Политика c разобранными параметрами.
+
+        Raises:
+            ValueError: Если режим неизвестен или параметр некорректен.
+        """
+        mode_name, _, argument = spec.strip().lower().partition(":")
+        try:
+            mode = AttachmentMode(mode_name)
+        except ValueError as e:
+            allowed = ", ".join(m.value for m in AttachmentMode)
+            msg = f"Неизвестный режим вложений '{mode_name}'. Допустимые: {allowed}"
+            raise ValueError(msg) from e
+
+        if mode is AttachmentMode.SAMPLED:
+            rate = float(argument) if argument else 0.1
+            if not 0.0 <= rate <= 1.0:
+                msg = f"Доля выборки должна быть в диапазоне [0, 1], получено: {rate}"
+                raise ValueError(msg)
+            return cls(mode=mode, sample_rate=rate)
+        if mode is AttachmentMode.SIZE_CAPPED:
+            cap = int(argument) if argument else DEFAULT_SIZE_CAP
+            if cap < 0:
+                msg = f"Лимит размера тела не может быть отрицательным: {cap}"
+                raise ValueError(msg)
+            return cls(mode=mode, max_body_bytes=cap)
+        return cls(mode=mode)
+
+    @property
+    def enabled(self) -> bool:
+        """Могут ли при этой политике вообще добавляться вложения."""
+        return self.mode is not AttachmentMode.NEVER
+
+    @property
+    def deferred(self) -> bool:
+        """Откладываются ли вложения до известного результата теста."""
+        return self.mode is AttachmentMode.ON_FAILURE
+
+    def should_attach(self) -> bool:
+        """Решает, добавлять ли вложения для очередного ответа (для `sampled` - случайно)."""
+        if self.mode is AttachmentMode.NEVER:
+            return False
+        if self.mode is AttachmentMode.SAMPLED:
+            return self.rng.random() < self.sample_rate
+        return True
+
+    def exceeds_cap(self, body_size: int) -> bool:
+        """Превышает ли тело размером `body_size` байт лимит политики `size-capped`."""
+        return self.mode is AttachmentMode.SIZE_CAPPED and body_size > self.max_body_bytes
@@ -1,47 +1,36 @@
 import logging
+from collections.abc import Sequence
 from typing import NoReturn
 
 import allure
-from playwright.sync_api import APIResponse
-
-logger = logging.getLogger(__name__)
+from pydantic import BaseModel
 
+from config.config import ALLURE_LIST_PREVIEW
+from core.cached_response import CachedResponse
+from core.json_codec import codec
+from utils.allure_utils import AllureUtils
 
-def validate_list_of_strings(data: list[str]) -> list[str]:
-    """
-    Проверяет, что переданные данные являются списком строк.
-
-    Args:
-        data: Данные для проверки (ожидается list).
-
-    Returns:
-        List[str]: Валидированный список строк.
-
-    Raises:
-        ValueError: Если данные не являются списком строк.
-    """
-    if not isinstance(data, list) or not all(isinstance(item, str) for item in data):
-        message = f"Данные не являются списком строк. Данные: {data}"
-        raise ValueError(message)
-    return data
+logger = logging.getLogger(__name__)
 
 
 def handle_api_parsing_error(
-    error: Exception, response: APIResponse, context_message: str = "Ошибка обработки ответа"
+    error: Exception,
+    response: CachedResponse,
+    context_message: str = "Ошибка обработки ответа",
 ) -> NoReturn:
     """
     Логирует и выбрасывает AssertionError при ошибке парсинга/валидации ответа API.
 
     Args:
         error: Исключение, возникшее при обработке.
-        response: Сырой ответ APIResponse.
+        response: Сырой ответ CachedResponse.
         context_message (str): Дополнительное сообщение для контекста ошибки.
 
     Raises:
         AssertionError: Оборачивает исходную ошибку.
     """
     error_details = f"{error}\nBody:{response.text()}"
-    allure.attach(
+    AllureUtils.attach(
         name=f"{context_message}: Ошибка парсинга/валидации",
         body=error_details,
         attachment_type=allure.attachment_type.TEXT,
@@ -49,3 +38,30 @@ def handle_api_parsing_error(
     msg = f"{context_message}: {error}"
     logger.error(msg, exc_info=True)
     raise AssertionError(msg) from error
+
+
+def attach_models_preview(
+    name: str, models: Sequence[BaseModel], total: int, limit: int = ALLURE_LIST_PREVIEW
+) -> None:
+    """
+    Прикрепляет к Allure первые `limit` моделей списка в виде JSON.
+
+    Большие списки не сериализуются целиком: во вложение попадает только начало списка;
+    в названии указывается, сколько элементов было всего.
+
+    Args:
+        name: Название вложения.
+        models: Модели (достаточно первых `limit`).
+        total: Общее количество элементов в ответе.
+        limit: Максимум элементов во вложении (0 - вложение не создается).
+    """
+    if limit <= 0:
+        return
+    shown = models[:limit]
+    if total > len(shown):
+        name = f"{name} (первые {len(shown)} из {total})"
+    AllureUtils.attach(
+        name=name,
+        body=lambda: codec.dumps_pretty([m.model_dump(mode="json") for m in shown]),
+        attachment_type=allure.attachment_type.JSON,
+    )
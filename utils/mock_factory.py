@@ -1,10 +1,10 @@
-import json
 import logging
 from enum import Enum
 from typing import Protocol
-from unittest.mock import Mock
 
 from api.endpoints import APIEndpoints
+from core.cached_response import CachedResponse
+from core.fake_response import FakeAPIResponse
 from tests.mocks import mock_data
 
 logger = logging.getLogger(__name__)
@@ -13,7 +13,7 @@ logger = logging.getLogger(__name__)
 class MockHTTPClientProtocol(Protocol):
     """Интерфейс для мок-HTTP клиента."""
 
-    def set_mock_response(self, method: str, endpoint: str, response: Mock) -> None:
+    def set_mock_response(self, method: str, endpoint: str, response: CachedResponse) -> None:
         """Настраивает мок-ответ для заданного метода и эндпоинта."""
 
     def clear_mocks(self) -> None:
@@ -37,24 +37,10 @@ class MockFactory:
         json_data: dict | list | None = None,
         text_data: str | None = None,
         is_ok: bool | None = None,
-    ) -> Mock:
-        """Создает объект Mock, имитирующий APIResponse."""
-        mock_response = Mock()
-        mock_response.status = status
-        mock_response.ok = is_ok if is_ok is not None else (200 <= status < 300)
-        if json_data is not None:
-            mock_response.json.return_value = json_data
-            try:
-                mock_response.text.return_value = json.dumps(json_data, ensure_ascii=False)
-            except TypeError:
-                mock_response.text.return_value = str(json_data)
-        elif text_data is not None:
-            mock_response.json.side_effect = json.JSONDecodeError("Expecting value", "", 0)
-            mock_response.text.return_value = text_data
-        else:
-            mock_response.json.side_effect = json.JSONDecodeError("Expecting value", "", 0)
-            mock_response.text.return_value = ""
-        return mock_response
+        url: str = "",
+    ) -> FakeAPIResponse:
+        """Создает FakeAPIResponse c заранее сериализованным телом."""
+        return FakeAPIResponse(status, json_data=json_data, text_data=text_data, ok=is_ok, url=url)
 
     def setup_mock(
         self,
@@ -68,7 +54,9 @@ class MockFactory:
         """Настраивает мок-ответ для заданного метода и эндпоинта."""
         endpoint_str = endpoint.value if isinstance(endpoint, Enum) else str(endpoint)
 
-        mock_response = self._create_mock_response(status, json_data, text_data, is_ok)
+        mock_response = self._create_mock_response(
+            status, json_data, text_data, is_ok, url=endpoint_str
+        )
         self.mock_http_client.set_mock_response(method, endpoint_str, mock_response)
 
     def clear_all_mocks(self) -> None: